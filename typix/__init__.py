@@ -4,27 +4,145 @@ An advanced module to hide type handling code behind type annotations
 """
 from sys import version_info
 
+from importlib import import_module
+
+# Imported eagerly: the submodule of the same name would shadow it once loaded
 from .processor import processor
-from .builtin_dynamic_types import Strict, Convert
-from .utils import istypix, typecheck, match_generic_alias, display_type
-from .context import Context
-from .error import CheckResult, TypixError
-from .main import Typix
+
+# The module of each public name, imported on first access
+_LAZY_ATTRIBUTES = {
+    'invalidate': 'processor',
+    'process_many': 'processor',
+    'process_class': 'processor',
+    'ProcessedAttribute': 'attributes',
+    'CallPlan': 'plan',
+    'compile_plan': 'plan',
+    'Strict': 'builtin_dynamic_types',
+    'Convert': 'builtin_dynamic_types',
+    'ConversionCache': 'memo',
+    'memoize': 'memo',
+    'is_pure': 'memo',
+    'ConversionError': 'converters',
+    'register_converter': 'converters',
+    'convert': 'converters',
+    'Strategy': 'strategy',
+    'StreamError': 'stream',
+    'compile_check': 'checker',
+    'compile_alias': 'checker',
+    'compile_valid': 'checker',
+    'compile_record': 'records',
+    'RecordSchema': 'records',
+    'TypeKind': 'kinds',
+    'classify': 'kinds',
+    'istypix': 'utils',
+    'typecheck': 'utils',
+    'is_valid': 'utils',
+    'typecheck_many': 'utils',
+    'match_generic_alias': 'utils',
+    'display_type': 'utils',
+    'typecheck_parallel': 'parallel',
+    'Context': 'context',
+    'Profiler': 'instrument',
+    'profiler': 'instrument',
+    'profiling': 'instrument',
+    'collect_errors': 'report',
+    'ErrorReport': 'report',
+    'Failure': 'report',
+    'ReportError': 'report',
+    'Mode': 'mode',
+    'set_mode': 'mode',
+    'get_mode': 'mode',
+    'PlanCache': 'persist',
+    'set_plan_cache': 'persist',
+    'get_plan_cache': 'persist',
+    'prewarm': 'warmup',
+    'CheckResult': 'error',
+    'BatchResult': 'error',
+    'TypixError': 'error',
+    'ConstraintError': 'error',
+    'Typix': 'main'
+}
+
+def __getattr__(name: str) -> object:
+    """
+    Imports the submodule of a public name on first access (PEP 562),
+    so that importing the module only loads what is used.
+
+    ### Arguments
+    * `name`: `str`\n
+        The name of the attribute
+
+    ### Return
+    * type `object`: The value of the attribute
+
+    ### Raises
+    * `AttributeError`\n
+        When the name is not a public name of the module
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
 __author__ = 'Julien BERTHET'
 
 __all__ = [
     'processor',
+    'invalidate',
+    'process_many',
+    'process_class',
+    'ProcessedAttribute',
+    'CallPlan',
+    'compile_plan',
+    'Strategy',
+    'compile_check',
+    'compile_alias',
+    'compile_valid',
+    'compile_record',
+    'RecordSchema',
+    'TypeKind',
+    'classify',
     'istypix',
     'typecheck',
+    'is_valid',
+    'typecheck_many',
+    'typecheck_parallel',
     'match_generic_alias',
     'display_type',
     'Context',
+    'Profiler',
+    'profiler',
+    'profiling',
+    'collect_errors',
+    'ErrorReport',
+    'Failure',
+    'ReportError',
+    'Mode',
+    'set_mode',
+    'get_mode',
+    'PlanCache',
+    'set_plan_cache',
+    'get_plan_cache',
+    'prewarm',
     'CheckResult',
+    'BatchResult',
     'TypixError',
+    'ConstraintError',
+    'StreamError',
     'Typix',
     'Strict',
-    'Convert'
+    'Convert',
+    'ConversionCache',
+    'memoize',
+    'is_pure',
+    'ConversionError',
+    'register_converter',
+    'convert'
 ]
 
 # Deprecated Version Warning
@@ -0,0 +1,174 @@
+from typing import Any
+from types import MemberDescriptorType
+import sys
+
+from .main import Typix
+from .error import TypixError
+from .context import Frame, failed_arguments
+from .instrument import profiler
+
+# Marker of an attribute without default value
+_MISSING = object()
+
+class ProcessedAttribute:
+    """
+    A data descriptor processing the values assigned to an attribute
+    annotated with a dynamic type instance. The values are stored in the
+    slot of the attribute when the class defines one, or in the `__dict__`
+    of the instance otherwise.
+    Should not be instanciated directly, use `processor` on the class instead.
+    """
+    __slots__ = ('__name', '__type_hint', '__storage', '__default')
+
+    def __init__(self, name: str, type_hint: Typix, storage: MemberDescriptorType = None, default: Any = _MISSING):
+        """
+        A data descriptor processing the values assigned to an attribute.
+        Should not be instanciated directly, use `processor` on the class instead.
+
+        ### Arguments
+        * `name`: `str`\n
+            The name of the attribute
+        * `type_hint`: `Typix`\n
+            The dynamic type annotating the attribute
+        * `storage`: `Optional[MemberDescriptorType]`\n
+            The descriptor of the slot storing the values.
+            Defaults to `None`: the values are stored in the `__dict__` of the instance
+        * `default`: `Optional[Any]`\n
+            The value of the attribute before any assignment, returned as is.
+            Defaults to no default value
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.__name = name
+        self.__type_hint = type_hint
+        self.__storage = storage
+        self.__default = default
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"<{class_name}: {self.__name}: {self.__type_hint.__class__.__name__}>"
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            if self.__storage is not None:
+                return self.__storage.__get__(instance, owner)
+            return instance.__dict__[self.__name]
+        except (AttributeError, KeyError):
+            if self.__default is _MISSING:
+                raise AttributeError(
+                    f"'{type(instance).__name__}' object has no attribute '{self.__name}'"
+                ) from None
+            return self.__default
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        type_hint = self.__type_hint
+        value = type_hint._run(Frame(type_hint, value, self.__name))
+        # The value failed while the errors are collected
+        if profiler.collecting and failed_arguments():
+            return
+        if self.__storage is not None:
+            self.__storage.__set__(instance, value)
+        else:
+            instance.__dict__[self.__name] = value
+
+    def __delete__(self, instance: Any) -> None:
+        if self.__storage is not None:
+            self.__storage.__delete__(instance)
+            return
+        try:
+            del instance.__dict__[self.__name]
+        except KeyError:
+            raise AttributeError(self.__name) from None
+
+    @property
+    def name(self) -> str:
+        """
+        ### Property
+        `name`: `str`\n
+            The name of the attribute
+        """
+        return self.__name
+
+    @property
+    def type_hint(self) -> Typix:
+        """
+        ### Property
+        `type_hint`: `Typix`\n
+            The dynamic type annotating the attribute
+        """
+        return self.__type_hint
+
+    @property
+    def slotted(self) -> bool:
+        """
+        ### Property
+        `slotted`: `bool`\n
+            Whether or not the values are stored in a slot
+        """
+        return self.__storage is not None
+
+def _resolve(annotation: Any, cls: type) -> Any:
+    """
+    Evaluates an annotation written as a string in the namespace of a class.
+
+    ### Arguments
+    * `annotation`: `Any`\n
+        The annotation
+    * `cls`: `type`\n
+        The annotated class
+
+    ### Return
+    * type `Any`: The evaluated annotation, `None` when it cannot be resolved
+    """
+    if not isinstance(annotation, str):
+        return annotation
+    module = sys.modules.get(cls.__module__)
+    try:
+        return eval(annotation, getattr(module, '__dict__', {}), dict(vars(cls)))
+    except Exception:
+        return None
+
+def process_attributes(cls: type) -> tuple[str, ...]:
+    """
+    Replaces each attribute of a class annotated with a dynamic type
+    instance by a `ProcessedAttribute`. Only the annotations of the class
+    itself are used, the attributes of the parent classes are left as is.
+
+    ### Arguments
+    * `cls`: `type`\n
+        The class to process
+
+    ### Return
+    * type `tuple[str, ...]`: The names of the processed attributes
+
+    ### Raises
+    * `TypixError`\n
+        When an asynchronous dynamic type annotates an attribute
+    """
+    # Imported when a class is processed, so that importing `typix` does not load it
+    from .kinds import TypeKind, classify
+
+    names = []
+    for name, annotation in cls.__dict__.get('__annotations__', {}).items():
+        type_hint = _resolve(annotation, cls)
+        if classify(type_hint) is not TypeKind.TYPIX:
+            continue
+        if type_hint.asynchronous:
+            raise TypixError(
+                f"'{type_hint.__class__.__name__}' is asynchronous and cannot annotate "
+                f"the attribute '{name}' of '{cls.__qualname__}'"
+            )
+
+        current = cls.__dict__.get(name, _MISSING)
+        if isinstance(current, ProcessedAttribute):
+            continue
+        if isinstance(current, MemberDescriptorType):
+            attribute = ProcessedAttribute(name, type_hint, storage=current)
+        else:
+            attribute = ProcessedAttribute(name, type_hint, default=current)
+        setattr(cls, name, attribute)
+        names.append(name)
+    return tuple(names)
@@ -0,0 +1,779 @@
+"""
+### Typix benchmarks
+Measures the overhead added by the module. Run with `python -m typix.benchmark`,
+`--json FILE` saves the results and `--compare FILE` compares them with a saved baseline
+"""
+from timeit import Timer, default_timer
+from typing import Callable, Any, List, Optional, Literal, TypedDict, NotRequired
+from threading import Thread, Barrier
+from time import sleep
+from tempfile import TemporaryDirectory
+import argparse
+import py_compile
+import json
+import os
+import platform
+import subprocess
+import sys
+
+from .processor import processor, process_class
+from .checker import compile_check
+from .utils import typecheck, typecheck_many, is_valid, display_type
+from .builtin_dynamic_types import Strict, Convert
+from .memo import ConversionCache
+from .main import Typix
+from .error import TypixError
+from .report import collect_errors
+from .mode import Mode, set_mode
+from .records import compile_record
+from .converters import ConversionError
+
+# The numbers of annotated arguments of the benchmarked functions
+ARGUMENT_COUNTS = (0, 1, 2, 5, 10)
+
+# The sizes of the benchmarked collections
+SIZES = (10, 100, 1_000)
+
+# The relative slowdown over which a benchmark is reported as a regression
+THRESHOLD = 0.10
+
+# The name of the module generated by the startup benchmark
+STARTUP_MODULE = 'typix_startup_module'
+
+def measure(statement: Callable[[], object], number: int = 100_000, repeat: int = 5) -> float:
+    """
+    Measures the best time of a statement over multiple runs.
+
+    ### Arguments
+    * `statement`: `Callable[[], object]`\n
+        The statement to time
+    * `number`: `Optional[int]`\n
+        The number of executions per run.
+        Defaults to `100_000`
+    * `repeat`: `Optional[int]`\n
+        The number of runs.
+        Defaults to `5`
+
+    ### Return
+    * type `float`: The best time per execution in nanoseconds
+    """
+    return min(Timer(statement).repeat(repeat, number)) / number * 1e9
+
+def bench_processor_overhead(number: int = 100_000) -> dict[str, float]:
+    """
+    Compares the cost of a call to a plain function with the cost of
+    the same function decorated by the generic and the generated
+    `processor` wrappers, with positional and keyword calls. The function
+    has one annotated argument and two plain ones.
+
+    ### Arguments
+    * `number`: `Optional[int]`\n
+        The number of calls per run.
+        Defaults to `100_000`
+
+    ### Return
+    * type `dict[str, float]`: The time per call in nanoseconds by wrapper
+    """
+    def plain(a, b, c):
+        return a
+
+    def annotated(a: Typix(), b, c):
+        return a
+
+    generic = processor(annotated)
+    generated = processor(annotated, codegen=True)
+
+    return {
+        'plain': measure(lambda: plain(1, 2, 3), number),
+        'processor': measure(lambda: generic(1, 2, 3), number),
+        'processor(codegen=True)': measure(lambda: generated(1, 2, 3), number),
+        'processor keywords': measure(lambda: generic(1, b=2, c=3), number),
+        'processor(codegen=True) keywords': measure(lambda: generated(1, b=2, c=3), number)
+    }
+
+def bench_typecheck(number: int = 100_000) -> dict[str, float]:
+    """
+    Compares `typecheck` with a checker compiled once by `compile_check`
+    and with `is_valid` on a small `GenericAlias` and on a plain type.
+
+    ### Arguments
+    * `number`: `Optional[int]`\n
+        The number of checks per run.
+        Defaults to `100_000`
+
+    ### Return
+    * type `dict[str, float]`: The time per check in nanoseconds by statement
+    """
+    value = [0, 1, 2]
+    check_alias = compile_check(list[int])
+    check_type = compile_check(list)
+
+    return {
+        'typecheck(list[int])': measure(lambda: typecheck(value, list[int]), number),
+        'compile_check(list[int])': measure(lambda: check_alias(value), number),
+        'is_valid(list[int])': measure(lambda: is_valid(value, list[int]), number),
+        'typecheck(list)': measure(lambda: typecheck(value, list), number),
+        'compile_check(list)': measure(lambda: check_type(value), number),
+        'is_valid(list)': measure(lambda: is_valid(value, list), number)
+    }
+
+def bench_batch(size: int = 10_000, number: int = 20) -> dict[str, float]:
+    """
+    Compares the batch API with a loop over the items of a batch: the
+    check of a list of values and the calls of a decorated function.
+
+    ### Arguments
+    * `size`: `Optional[int]`\n
+        The number of items of the batch.
+        Defaults to `10_000`
+    * `number`: `Optional[int]`\n
+        The number of batches per run.
+        Defaults to `20`
+
+    ### Return
+    * type `dict[str, float]`: The time per item in nanoseconds by statement
+    """
+    values = [[index, index + 1] for index in range(size)]
+    batch = [(index, 2, 3) for index in range(size)]
+
+    @processor
+    def annotated(a: Typix(), b, c):
+        return a
+
+    def loop_typecheck() -> list:
+        return [typecheck(value, list[int]) for value in values]
+
+    def loop_processor() -> list:
+        return [annotated(*args) for args in batch]
+
+    return {
+        'typecheck loop': measure(loop_typecheck, number) / size,
+        'typecheck_many': measure(lambda: typecheck_many(values, list[int]), number) / size,
+        'processor loop': measure(loop_processor, number) / size,
+        'processor.map': measure(lambda: processor.map(annotated, batch), number) / size
+    }
+
+def bench_failures(size: int = 1_000, number: int = 20) -> dict[str, float]:
+    """
+    Compares, on a batch where half of the calls fail, catching the error
+    raised by each failing call with collecting every failing argument
+    in a single report.
+
+    ### Arguments
+    * `size`: `Optional[int]`\n
+        The number of calls of the batch.
+        Defaults to `1_000`
+    * `number`: `Optional[int]`\n
+        The number of batches per run.
+        Defaults to `20`
+
+    ### Return
+    * type `dict[str, float]`: The time per call in nanoseconds by statement
+    """
+    strict_type = Strict(int)
+    batch = [(index, index) if index % 2 else ('a', 'b') for index in range(size)]
+
+    @processor
+    def annotated(a: strict_type, b: strict_type):
+        return a
+
+    def loop_raise() -> None:
+        for args in batch:
+            try:
+                annotated(*args)
+            except TypixError:
+                pass
+
+    def loop_collect() -> None:
+        with collect_errors(raise_errors=False):
+            for args in batch:
+                annotated(*args)
+
+    def map_collect() -> None:
+        with collect_errors(raise_errors=False):
+            processor.map(annotated, batch)
+
+    return {
+        'raise and catch': measure(loop_raise, number) / size,
+        'collect_errors': measure(loop_collect, number) / size,
+        'collect_errors processor.map': measure(map_collect, number) / size
+    }
+
+def bench_modes(number: int = 100_000) -> dict[str, float]:
+    """
+    Compares a call of an undecorated function with the calls of
+    decorated functions, generic and generated, processed on every call,
+    on one call out of 100, and never processed.
+
+    ### Arguments
+    * `number`: `Optional[int]`\n
+        The number of executions per run.
+        Defaults to `100_000`
+
+    ### Return
+    * type `dict[str, float]`: The time per call in nanoseconds by statement
+    """
+    strict_type = Strict(int)
+
+    def plain(a, b):
+        return a
+
+    def annotated(a: strict_type, b: strict_type):
+        return a
+
+    results = {'plain': measure(lambda: plain(1, 2), number)}
+    for name, codegen in (('generic', False), ('codegen', True)):
+        for mode in (Mode.always(), Mode.sample(100), Mode.never()):
+            decorated = processor(annotated, codegen=codegen)
+            set_mode(mode, decorated)
+            results[f'{name} {mode.kind}'] = measure(lambda: decorated(1, 2), number)
+    return results
+
+def _build_function(count: int, type_hint: Any = None) -> Callable:
+    """
+    Builds a function with plain positional arguments, optionally
+    annotated with the same type.
+
+    ### Arguments
+    * `count`: `int`\n
+        The number of arguments
+    * `type_hint`: `Optional[Any]`\n
+        The annotation of every argument.
+        Defaults to `None`: the arguments are not annotated
+
+    ### Return
+    * type `function`: The function, returning `None`
+    """
+    annotation = '' if type_hint is None else ': _type_hint'
+    parameters = ', '.join(f'a{index}{annotation}' for index in range(count))
+    namespace = {'_type_hint': type_hint}
+    exec(f"def function({parameters}):\n    return None\n", namespace)
+    return namespace['function']
+
+def bench_arguments(number: int = 100_000) -> dict[str, float]:
+    """
+    Compares the cost of a call to a plain function with the cost of the
+    same function decorated by the generic and the generated `processor`
+    wrappers, for a growing number of annotated arguments.
+
+    ### Arguments
+    * `number`: `Optional[int]`\n
+        The number of calls per run.
+        Defaults to `100_000`
+
+    ### Return
+    * type `dict[str, float]`: The time per call in nanoseconds by wrapper and number of arguments
+    """
+    results = {}
+    for count in ARGUMENT_COUNTS:
+        args = tuple(range(count))
+        plain = _build_function(count)
+        generic = processor(_build_function(count, Typix()))
+        generated = processor(_build_function(count, Typix()), codegen=True)
+
+        results[f'plain {count} args'] = measure(lambda: plain(*args), number)
+        results[f'processor {count} args'] = measure(lambda: generic(*args), number)
+        results[f'processor(codegen=True) {count} args'] = measure(lambda: generated(*args), number)
+    return results
+
+def bench_builtins(number: int = 100_000) -> dict[str, float]:
+    """
+    Measures the built-in dynamic types, as annotations and with `typecheck`.
+
+    ### Arguments
+    * `number`: `Optional[int]`\n
+        The number of calls per run.
+        Defaults to `100_000`
+
+    ### Return
+    * type `dict[str, float]`: The time per call or check in nanoseconds by statement
+    """
+    @processor
+    def strict(value: Strict(int)):
+        return value
+
+    @processor
+    def convert(value: Convert(int)):
+        return value
+
+    @processor
+    def convert_cached(value: Convert(int, ConversionCache())):
+        return value
+
+    strict_type = Strict(int)
+    convert_type = Convert(int)
+    convert_list_type = Convert(list[int])
+    strings = [str(index) for index in range(100)]
+
+    return {
+        'processor Strict(int)': measure(lambda: strict(1), number),
+        'processor Convert(int)': measure(lambda: convert('1'), number),
+        'processor Convert(int) cached': measure(lambda: convert_cached('1'), number),
+        'typecheck Strict(int)': measure(lambda: typecheck(1, strict_type), number),
+        'typecheck Convert(int)': measure(lambda: typecheck('1', convert_type), number),
+        'typecheck Convert(int) failure': measure(lambda: typecheck('a', convert_type), number),
+        'typecheck Convert(list[int]) 100 items': measure(
+            lambda: typecheck(strings, convert_list_type), max(number // 100, 10)
+        )
+    }
+
+def bench_generics(number: int = 10_000) -> dict[str, float]:
+    """
+    Measures `typecheck` on scalars, tuples of types, unions and
+    generics of growing size.
+
+    ### Arguments
+    * `number`: `Optional[int]`\n
+        The number of checks per run, divided by the size of the collections.
+        Defaults to `10_000`
+
+    ### Return
+    * type `dict[str, float]`: The time per check in nanoseconds by statement
+    """
+    results = {
+        'int': measure(lambda: typecheck(1, int), number),
+        'str': measure(lambda: typecheck('a', str), number),
+        '(int, str)': measure(lambda: typecheck('a', (int, str)), number),
+        'int | str': measure(lambda: typecheck('a', int | str), number)
+    }
+    for size in SIZES:
+        runs = max(number // size, 10)
+        integers = list(range(size))
+        mapping = {str(index): index for index in range(size)}
+        pairs = [(index, str(index)) for index in range(size)]
+
+        results[f'list[int] {size} items'] = measure(lambda: typecheck(integers, list[int]), runs)
+        results[f'List[int] {size} items'] = measure(lambda: typecheck(integers, List[int]), runs)
+        results[f'dict[str, int] {size} items'] = measure(lambda: typecheck(mapping, dict[str, int]), runs)
+        results[f'list[tuple[int, str]] {size} items'] = measure(
+            lambda: typecheck(pairs, list[tuple[int, str]]), runs
+        )
+    return results
+
+class _Address(TypedDict):
+    city: str
+    zip: NotRequired[int]
+
+class _User(TypedDict):
+    name: str
+    age: int
+    tags: list[str]
+    address: _Address
+    score: float
+
+def bench_records(number: int = 20_000) -> dict[str, float]:
+    """
+    Compares `typecheck` on a `TypedDict` record decoded from JSON with the
+    checks of its compiled `RecordSchema`, and with its conversion.
+
+    ### Arguments
+    * `number`: `Optional[int]`\n
+        The number of checks per run.
+        Defaults to `20_000`
+
+    ### Return
+    * type `dict[str, float]`: The time per record in nanoseconds by statement
+    """
+    schema = compile_record(_User)
+    record = {'name': 'a', 'age': 1, 'tags': ['a', 'b'], 'address': {'city': 'b', 'zip': 1}, 'score': 1.5}
+    strings = {'name': 'a', 'age': '1', 'tags': ['a', 'b'], 'address': {'city': 'b', 'zip': '1'}, 'score': '1.5'}
+
+    return {
+        'typecheck': measure(lambda: typecheck(record, _User), number),
+        'is_valid': measure(lambda: schema.is_valid(record), number),
+        'validate': measure(lambda: schema.validate(record), number),
+        'validate convert': measure(lambda: schema.validate(strings, convert=True), number)
+    }
+
+def bench_classes(number: int = 100_000) -> dict[str, float]:
+    """
+    Compares the assignment of a plain attribute with the assignment of
+    attributes processed by descriptors, stored in the `__dict__` or in
+    slots, and the cost of decorating a class with 20 annotated methods.
+
+    ### Arguments
+    * `number`: `Optional[int]`\n
+        The number of executions per run.
+        Defaults to `100_000`
+
+    ### Return
+    * type `dict[str, float]`: The time per operation in nanoseconds
+    """
+    type_hint = Typix()
+
+    class Plain:
+        value: Typix()
+
+    class Slotted:
+        __slots__ = ('value',)
+        value: Typix()
+
+    Processed = process_class(type('Processed', (), {'__annotations__': {'value': type_hint}}))
+    process_class(Slotted)
+    plain, processed, slotted = Plain(), Processed(), Slotted()
+
+    def method(self, value: type_hint) -> type_hint:
+        return value
+    namespace = {f'method_{index}': method for index in range(20)}
+
+    return {
+        'assignment': measure(lambda: setattr(plain, 'value', 1), number),
+        'processed assignment': measure(lambda: setattr(processed, 'value', 1), number),
+        'processed slotted assignment': measure(lambda: setattr(slotted, 'value', 1), number),
+        'process_class 20 methods': measure(
+            lambda: process_class(type('Model', (), dict(namespace))), max(number // 100, 10)
+        )
+    }
+
+def bench_display_type(number: int = 100_000) -> dict[str, float]:
+    """
+    Measures `display_type` on the different kinds of types, built once
+    like annotations, and the rendering of a conversion error.
+
+    ### Arguments
+    * `number`: `Optional[int]`\n
+        The number of calls per run.
+        Defaults to `100_000`
+
+    ### Return
+    * type `dict[str, float]`: The time per call in nanoseconds by type
+    """
+    strict_type = Strict(int)
+    builtin_alias = list[int]
+    typing_alias = List[int]
+    nested_alias = List[dict[str, Optional[int]]]
+    union = int | str | None
+    nested_type = Strict(dict[str, Literal['a', 'b']])
+    conversion_error = ConversionError('a', nested_alias)
+    return {
+        'int': measure(lambda: display_type(int), number),
+        'list[int]': measure(lambda: display_type(builtin_alias), number),
+        'List[int]': measure(lambda: display_type(typing_alias), number),
+        'List[dict[str, Optional[int]]]': measure(lambda: display_type(nested_alias), number),
+        'int | str | None': measure(lambda: display_type(union), number),
+        'Strict(int)': measure(lambda: display_type(strict_type), number),
+        "Strict(dict[str, Literal['a', 'b']])": measure(lambda: display_type(nested_type), number),
+        'ConversionError message': measure(lambda: str(conversion_error), number)
+    }
+
+class _Yield(Typix):
+    """
+    Releases the GIL in the middle of the processing, so that concurrent
+    calls interleave as much as possible.
+    """
+    def process(self) -> Any:
+        value = self.value
+        sleep(0)
+        if self.value != value:
+            return self.error("The processed value changed during the processing", fatal=True)
+        return self.value
+
+def bench_threads(threads: int = 32, calls: int = 2_000) -> dict[str, float]:
+    """
+    Runs many threads against one decorated function and counts the
+    calls that did not return their own argument.
+
+    ### Arguments
+    * `threads`: `Optional[int]`\n
+        The number of threads.
+        Defaults to `32`
+    * `calls`: `Optional[int]`\n
+        The number of calls per thread.
+        Defaults to `2_000`
+
+    ### Return
+    * type `dict[str, float]`: The time per call in nanoseconds and
+    the number of failed calls
+    """
+    @processor
+    def echo(value: _Yield()) -> _Yield():
+        return value
+
+    barrier = Barrier(threads)
+    failures = [0] * threads
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        for call in range(calls):
+            value = index * calls + call
+            try:
+                if echo(value) != value:
+                    failures[index] += 1
+            except BaseException:
+                failures[index] += 1
+
+    workers = [Thread(target=worker, args=(index,)) for index in range(threads)]
+    start = default_timer()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    duration = default_timer() - start
+
+    return {
+        'ns/call': duration / (threads * calls) * 1e9,
+        'failures': sum(failures)
+    }
+
+def _startup_source(functions: int, postponed: bool = False) -> str:
+    """
+    Generates the source of a module defining many decorated functions,
+    with a function timing the first call of each of them.
+
+    ### Arguments
+    * `functions`: `int`\n
+        The number of decorated functions
+    * `postponed`: `Optional[bool]`\n
+        Whether or not the annotations are postponed, evaluated
+        when the plans are compiled.
+        Defaults to `False`
+
+    ### Return
+    * type `str`: The source of the module
+    """
+    lines = ['from __future__ import annotations'] if postponed else []
+    lines += ['from time import perf_counter_ns', 'from typix import processor, Strict', '']
+    for index in range(functions):
+        lines += [
+            '@processor',
+            f'def function_{index}(a: Strict(int), b: Strict(int) = 0) -> Strict(int):',
+            '    return a + b',
+            ''
+        ]
+    lines += ['def first_calls():', '    start = perf_counter_ns()']
+    lines += [f'    function_{index}(1)' for index in range(functions)]
+    lines += ['    return perf_counter_ns() - start', '']
+    return '\n'.join(lines)
+
+def _import_times(code: str, path: str) -> tuple[dict[str, int], str]:
+    """
+    Runs code in a new interpreter with `-X importtime`.
+
+    ### Arguments
+    * `code`: `str`\n
+        The code to run
+    * `path`: `str`\n
+        A directory added to the import path
+
+    ### Return
+    * type `tuple[dict[str, int], str]`: The cumulative import time of each
+    module in microseconds, and the standard output
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        filter(None, (path, root, environment.get('PYTHONPATH')))
+    )
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, env=environment, check=True
+    )
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        # The header has no numbers
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            pass
+    return times, completed.stdout
+
+def bench_startup(functions: int = 500, repeat: int = 5) -> dict[str, float]:
+    """
+    Measures in new interpreters the time to import the module, then to
+    import a module defining many decorated functions, and the time of
+    the first call of each function, which resolves its annotations.
+
+    ### Arguments
+    * `functions`: `Optional[int]`\n
+        The number of decorated functions of the generated module.
+        Defaults to `500`
+    * `repeat`: `Optional[int]`\n
+        The number of interpreters started, the best times are kept.
+        Defaults to `5`
+
+    ### Return
+    * type `dict[str, float]`: The times in nanoseconds
+    """
+    code = f'import typix.builtin_dynamic_types; import {STARTUP_MODULE}; print({STARTUP_MODULE}.first_calls())'
+    runs = []
+    with TemporaryDirectory() as path:
+        source = os.path.join(path, f'{STARTUP_MODULE}.py')
+        with open(source, 'w') as file:
+            file.write(_startup_source(functions))
+        # Like an installed module, the bytecode is not compiled on import
+        py_compile.compile(source, doraise=True)
+        for _ in range(repeat):
+            times, output = _import_times(code, path)
+            runs.append((times['typix'], times['typix.builtin_dynamic_types'], times[STARTUP_MODULE], int(output)))
+
+    package, types, module, calls = (min(run) for run in zip(*runs))
+    return {
+        'import typix': package * 1e3,
+        'import typix.builtin_dynamic_types': types * 1e3,
+        f'import module of {functions} functions': module * 1e3,
+        'decoration': module * 1e3 / functions,
+        'first call': calls / functions
+    }
+
+def bench_warm_start(functions: int = 500, repeat: int = 5) -> dict[str, float]:
+    """
+    Measures in new interpreters the time to the first fast call of each
+    function of a module with postponed annotations: the time of its first
+    call, which compiles its plan, without plan cache and with a plan cache
+    saved by a previous interpreter.
+
+    ### Arguments
+    * `functions`: `Optional[int]`\n
+        The number of decorated functions of the generated module.
+        Defaults to `500`
+    * `repeat`: `Optional[int]`\n
+        The number of interpreters started for each case, the best times are kept.
+        Defaults to `5`
+
+    ### Return
+    * type `dict[str, float]`: The times per function in nanoseconds
+    """
+    results = {}
+    with TemporaryDirectory() as path:
+        source = os.path.join(path, f'{STARTUP_MODULE}.py')
+        with open(source, 'w') as file:
+            file.write(_startup_source(functions, postponed=True))
+        py_compile.compile(source, doraise=True)
+
+        cache = os.path.join(path, 'plans.bin')
+        setup = f'import typix; typix.set_plan_cache(typix.PlanCache({cache!r}))'
+        code = f'import {STARTUP_MODULE}; print({STARTUP_MODULE}.first_calls())'
+        # The first interpreter fills the cache
+        _import_times(f'{setup}; {code}', path)
+
+        for name, run in (('first call', code), ('first call with plan cache', f'{setup}; {code}')):
+            calls = min(int(_import_times(run, path)[1]) for _ in range(repeat))
+            results[name] = calls / functions
+    return results
+
+def run_suite(scale: float = 1.0) -> dict[str, dict[str, float]]:
+    """
+    Runs every benchmark.
+
+    ### Arguments
+    * `scale`: `Optional[float]`\n
+        The factor applied to the number of executions of each benchmark,
+        lower is faster but less stable.
+        Defaults to `1.0`
+
+    ### Return
+    * type `dict[str, dict[str, float]]`: The time per operation in
+    nanoseconds by benchmark name, grouped by benchmark
+    """
+    def scaled(number: int) -> int:
+        return max(int(number * scale), 10)
+
+    threads = bench_threads(calls=scaled(2_000))
+    if threads['failures']:
+        print(f"{threads['failures']} concurrent calls failed", file=sys.stderr)
+
+    return {
+        'overhead': bench_processor_overhead(scaled(100_000)),
+        'arguments': bench_arguments(scaled(100_000)),
+        'builtins': bench_builtins(scaled(100_000)),
+        'typecheck': bench_typecheck(scaled(100_000)),
+        'generics': bench_generics(scaled(10_000)),
+        'display_type': bench_display_type(scaled(100_000)),
+        'classes': bench_classes(scaled(100_000)),
+        'records': bench_records(scaled(20_000)),
+        'batch': bench_batch(number=scaled(20)),
+        'failures': bench_failures(number=scaled(20)),
+        'modes': bench_modes(scaled(100_000)),
+        'threads': {'call': threads['ns/call']},
+        'startup': bench_startup(repeat=max(int(5 * scale), 1)),
+        'warm_start': bench_warm_start(repeat=max(int(5 * scale), 1))
+    }
+
+def compare(results: dict, baseline: dict, threshold: float = THRESHOLD) -> list[tuple[str, float, float]]:
+    """
+    Compares the results of a suite with a baseline. The benchmarks
+    missing from either side are ignored.
+
+    ### Arguments
+    * `results`: `dict`\n
+        The results of `run_suite`
+    * `baseline`: `dict`\n
+        The baseline results of `run_suite`
+    * `threshold`: `Optional[float]`\n
+        The relative slowdown over which a benchmark is a regression.
+        Defaults to `THRESHOLD`
+
+    ### Return
+    * type `list[tuple[str, float, float]]`: The name, the baseline and
+    the current time of each regression
+    """
+    regressions = []
+    for group, durations in results.items():
+        for name, duration in durations.items():
+            reference = baseline.get(group, {}).get(name)
+            if reference and (duration - reference) / reference > threshold:
+                regressions.append((f'{group}.{name}', reference, duration))
+    return regressions
+
+def main(argv: list[str] = None) -> int:
+    """
+    Runs the benchmarks and prints the results.
+
+    ### Arguments
+    * `argv`: `Optional[list[str]]`\n
+        The command line arguments.
+        Defaults to `None`: the arguments of the process
+
+    ### Return
+    * type `int`: The exit status, `1` when a regression is found
+    """
+    parser = argparse.ArgumentParser(prog='python -m typix.benchmark', description='Typix benchmarks')
+    parser.add_argument('--json', metavar='FILE', help="save the results as JSON, '-' for the standard output")
+    parser.add_argument('--compare', metavar='FILE', help='compare the results with a saved baseline')
+    parser.add_argument(
+        '--threshold', type=float, default=THRESHOLD,
+        help=f'relative slowdown reported as a regression, defaults to {THRESHOLD}'
+    )
+    parser.add_argument('--scale', type=float, default=1.0, help='factor applied to the number of executions')
+    arguments = parser.parse_args(argv)
+
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'unit': 'ns',
+        'results': run_suite(arguments.scale)
+    }
+    results = report['results']
+
+    if arguments.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        for group, durations in results.items():
+            for name, duration in durations.items():
+                print(f"{f'{group}.{name}':<50} {duration:>12.1f} ns")
+        if arguments.json:
+            with open(arguments.json, 'w') as file:
+                json.dump(report, file, indent=2)
+
+    if arguments.compare is None:
+        return 0
+
+    with open(arguments.compare) as file:
+        baseline = json.load(file)['results']
+    regressions = compare(results, baseline, arguments.threshold)
+    for name, reference, duration in regressions:
+        print(
+            f"REGRESSION {name:<50} {reference:>12.1f} ns -> {duration:>12.1f} ns "
+            f"({(duration - reference) / reference:+.1%})",
+            file=sys.stderr
+        )
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,7 +1,12 @@
 from typing import Any
 
 from .main import Typix
-from .utils import typecheck, istypix, display_type
+from .strategy import Strategy
+from .utils import typecheck, istypix
+from .vectorize import can_convert, convert_array
+from .memo import ConversionCache, is_pure
+from .converters import ConversionError, convert
+from .error import ConstraintError
 
 class Strict(Typix):
     """
@@ -10,38 +15,68 @@ class Strict(Typix):
     ### Arguments
     * `type_`: `Any`\n
         The children type
+    * `strategy`: `Optional[Strategy]`\n
+        How much of the collections is inspected.
+        Defaults to `None`: every item is inspected
     
     ### Return
     * type `Any`: If the children do not returns any error 
     * type `TypixError`: If the children returns any error
     """
-    def process(self, type_: Any) -> Any:
-        result = typecheck(self.value, type_)
+    def process(self, type_: Any, strategy: Strategy = None) -> Any:
+        result = typecheck(self.value, type_, strategy=strategy)
         if result:
             return result.value
         else:
+            # The exception is only built if it is read
             if istypix(type_):
-                return self.error(f"Strict constraint failed: {result.exception}", fatal=True)
+                return self._fatal(ConstraintError, type_, result.exception)
             else:
-                return self.error(f"Strict constraint failed", fatal=True)
+                return self._fatal(ConstraintError, type_)
             
 class Convert(Typix):
     """
     Convert the value to the given type. If not possible returns a non-fatal error.
+    A value of the exact type is returned as is, and the specialized converters
+    registered with `register_converter` are used when available. Containers
+    like `list[int]` or `dict[str, float]` are converted with their items.
+    Only the `ValueError` and `OverflowError` of a conversion, and the `TypeError`
+    of the built-in types called with a value of another type, are conversion
+    failures: the other errors, and the missing values, are raised as is.
+    NumPy arrays converted to a NumPy dtype or a numeric builtin type, and lists
+    or tuples converted to a NumPy dtype, are converted item by item at once into
+    a NumPy array.
+    The conversions can be memoized by a `ConversionCache` when the type is
+    pure, see `is_pure`: the other types, and the inputs that equality does not
+    identify exactly like `Decimal` values, bypass it.
+    The functions annotated with `Convert` are processed on every call
+    whatever their mode, see `set_mode`.
     
     ### Arguments
     * `type_`: `Any`\n
         The type to convert to
+    * `cache`: `Optional[ConversionCache]`\n
+        The cache of the conversions, can be shared by multiple types.
+        Defaults to `None`: the conversions are not memoized
     
     ### Return
     * type `Any`: The converted value, if the type conversion does not raise any error
     * type `TypixError`: If the type conversion does raise an error
     """
-    def process(self, type_: Any) -> Any:
-        new_value = self.value
+    # The conversions are never skipped
+    _required = True
+    
+    def process(self, type_: Any, cache: ConversionCache = None) -> Any:
+        if cache is not None and is_pure(type_):
+            return cache.process(self, Convert._convert, (type_,))
+        return self._convert(type_)
+    
+    def _convert(self, type_: Any) -> Any:
+        value = self.value
         try:
-            new_value = type_(new_value)
-        except ValueError:
-            return self.error(f"Cannot convert '{display_type(self.value)}' to '{display_type(type_)}'")
-        else:
-            return new_value
\ No newline at end of file
+            if can_convert(value, type_):
+                return convert_array(value, type_)
+            return convert(value, type_)
+        except (ValueError, OverflowError):
+            # The message is only built if it is read
+            return self.error(ConversionError(value, type_))
\ No newline at end of file
@@ -0,0 +1,719 @@
+from inspect import isclass
+from types import GenericAlias, UnionType
+from typing import (
+    Any, Callable, Iterable, Mapping, Union, Literal, Annotated, TypeVar, ForwardRef, NewType,
+    _SpecialForm, get_origin, get_args, get_type_hints, is_typeddict
+)
+from dataclasses import is_dataclass, fields as dataclass_fields
+from functools import lru_cache
+import collections.abc as collection
+
+from .main import Typix
+from .error import CheckResult
+from .context import Context, Frame
+from .strategy import Strategy, Inspection
+from .stream import Stream
+from .kinds import TypeKind, STRUCTURAL_KINDS, classify, clear_kinds
+from .vectorize import BUFFER_TYPES, VECTORIZE_SIZE, match_buffer, match_list, is_numeric
+
+_NoneType = type(None)
+
+# The maximum number of compiled checkers kept in each cache
+CACHE_SIZE = 1024
+
+Checker = Callable[[Any, Context, Strategy], CheckResult]
+Predicate = Callable[[Any, Callable[[Iterable], Iterable]], bool]
+Validator = Callable[[Any], bool]
+
+class _Node:
+    """
+    A node of a compiled checker tree. Matches a value against one type,
+    the nodes of the nested types are compiled once with the node.
+    Should not be instanciated directly.
+    """
+    __slots__ = ('match', 'types', 'memoized')
+
+    def __init__(
+        self,
+        match: Callable[..., bool],
+        types: type | tuple[type, ...] = None,
+        memoized: bool = False
+    ):
+        """
+        A node of a compiled checker tree.
+        Should not be instanciated directly.
+
+        ### Arguments
+        * `match`: `Callable[[Any, Callable, set], bool]`\n
+            Whether or not a value matches the type. Takes the value,
+            an optional item selector and an optional memo
+        * `types`: `Optional[type | tuple[type, ...]]`\n
+            The classes of the type when matching is a plain `isinstance`.
+            Defaults to `None`
+        * `memoized`: `Optional[bool]`\n
+            Whether or not the node or one of its children uses the memo.
+            Defaults to `False`
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.match = match
+        self.types = types
+        self.memoized = memoized
+
+def _instance_node(types: type | tuple[type, ...]) -> _Node:
+    """
+    Compiles a plain `isinstance` check.
+
+    ### Arguments
+    * `types`: `type | tuple[type, ...]`\n
+        The classes to check with
+
+    ### Return
+    * type `_Node`: The compiled node
+    """
+    return _Node(lambda value, select=None, memo=None: isinstance(value, types), types)
+
+def _any_node(types: Iterable, vectorize: bool = False) -> _Node:
+    """
+    Compiles a check matching any of multiple types, like a tuple
+    of types or an union.
+
+    ### Arguments
+    * `types`: `Iterable`\n
+        The types to check with
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists in bulk as NumPy arrays.
+        Defaults to `False`
+
+    ### Return
+    * type `_Node`: The compiled node
+    """
+    nodes = tuple(compile_node(t, vectorize) for t in types)
+    if len(nodes) == 1:
+        return nodes[0]
+
+    # Plain classes are merged into a single `isinstance` call
+    if all(node.types is not None for node in nodes):
+        classes = []
+        for node in nodes:
+            classes.extend(node.types if isinstance(node.types, tuple) else (node.types,))
+        return _instance_node(tuple(classes))
+
+    def match_any(value: Any, select: Callable = None, memo: set = None) -> bool:
+        return any(node.match(value, select, memo) for node in nodes)
+    return _Node(match_any, memoized=any(node.memoized for node in nodes))
+
+def _items_matcher(node: _Node) -> Callable[[Iterable, Callable, set], bool]:
+    """
+    Builds the check of every item of a collection against a node.
+
+    ### Arguments
+    * `node`: `_Node`\n
+        The node of the items
+
+    ### Return
+    * type `Callable[[Iterable, Callable, set], bool]`: Whether or not
+    every item matches the node
+    """
+    types = node.types
+    if types is not None:
+        return lambda items, select, memo: all(isinstance(item, types) for item in items)
+
+    match = node.match
+    return lambda items, select, memo: all(match(item, select, memo) for item in items)
+
+def _memoized_node(match: Callable[..., bool]) -> _Node:
+    """
+    Compiles the check of an immutable container whose items are nested
+    containers. A container that already matched within the same check
+    is not checked again when it is shared by multiple parents.
+
+    ### Arguments
+    * `match`: `Callable[[Any, Callable, set], bool]`\n
+        The check of the container
+
+    ### Return
+    * type `_Node`: The compiled node
+    """
+    def match_memoized(value: Any, select: Callable = None, memo: set = None) -> bool:
+        if memo is None:
+            return match(value, select, memo)
+
+        key = (id(value), id(match))
+        if key in memo:
+            return True
+        if match(value, select, memo):
+            memo.add(key)
+            return True
+        return False
+    return _Node(match_memoized, memoized=True)
+
+def _alias_node(alias: Any, vectorize: bool = False) -> _Node:
+    """
+    Compiles a generic container alias like `list[int]`, `dict[str, int]`
+    or `tuple[int, ...]`, with the nodes of its nested types.
+
+    ### Arguments
+    * `alias`: `GenericAlias`\n
+        The alias to compile
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists in bulk as NumPy arrays.
+        Defaults to `False`
+
+    ### Return
+    * type `_Node`: The compiled node
+    """
+    alias_origin = get_origin(alias)
+    alias_args = get_args(alias)
+
+    # Needs to match any of the given type arguments
+    if issubclass(alias_origin, Mapping):
+        if len(alias_args) < 2:
+            return _Node(lambda value, select=None, memo=None: False)
+
+        key_node = compile_node(alias_args[0], vectorize)
+        value_node = _any_node(alias_args[1:], vectorize)
+        match_keys = _items_matcher(key_node)
+        match_values = _items_matcher(value_node)
+        match_key = key_node.match
+        match_value = value_node.match
+
+        def match_mapping(value: Any, select: Callable = None, memo: set = None) -> bool:
+            if not isinstance(value, alias_origin):
+                return False
+
+            if select is not None:
+                return all(
+                    match_key(key, select, memo) and match_value(val, select, memo)
+                    for key, val in select(value.items())
+                )
+
+            return match_keys(value.keys(), None, memo) and match_values(value.values(), None, memo)
+        return _Node(match_mapping, memoized=key_node.memoized or value_node.memoized)
+
+    # Tuples are either variadic like `tuple[int, ...]` or of fixed length
+    if issubclass(alias_origin, tuple):
+        if len(alias_args) == 2 and alias_args[1] is Ellipsis:
+            item_nodes = (compile_node(alias_args[0], vectorize),)
+            match_items = _items_matcher(item_nodes[0])
+
+            def match_tuple(value: Any, select: Callable = None, memo: set = None) -> bool:
+                if not isinstance(value, alias_origin):
+                    return False
+                if select is not None:
+                    return match_items(select(value), select, memo)
+                return match_items(value, None, memo)
+        else:
+            item_nodes = tuple(compile_node(t, vectorize) for t in alias_args)
+            length = len(item_nodes)
+
+            def match_tuple(value: Any, select: Callable = None, memo: set = None) -> bool:
+                return (
+                    isinstance(value, alias_origin)
+                    and len(value) == length
+                    and all(node.match(item, select, memo) for node, item in zip(item_nodes, value))
+                )
+
+        if all(node.types is not None for node in item_nodes):
+            return _Node(match_tuple)
+        return _memoized_node(match_tuple)
+
+    if issubclass(alias_origin, Iterable):
+        item_node = _any_node(alias_args, vectorize)
+        match_items = _items_matcher(item_node)
+        item_types = item_node.types
+        if item_types is not None and not isinstance(item_types, tuple):
+            item_types = (item_types,)
+        vectorize = vectorize and item_types is not None and is_numeric(item_types)
+
+        def match_iterable(value: Any, select: Callable = None, memo: set = None) -> bool:
+            if not isinstance(value, alias_origin):
+                return False
+
+            # Buffers are checked from their item type
+            if item_types is not None:
+                matched = None
+                if isinstance(value, BUFFER_TYPES):
+                    matched = match_buffer(value, item_types)
+                elif vectorize and type(value) is list and len(value) >= VECTORIZE_SIZE:
+                    matched = match_list(value, item_types)
+                if matched is not None:
+                    return matched
+
+            if select is not None:
+                return match_items(select(value), select, memo)
+            return match_items(value, None, memo)
+
+        if item_types is None and issubclass(alias_origin, frozenset):
+            return _memoized_node(match_iterable)
+        return _Node(match_iterable, memoized=item_node.memoized)
+
+    # Always defaults to False
+    return _Node(lambda value, select=None, memo=None: False)
+
+def _fields_node(cls: type, typed_dict: bool) -> _Node:
+    """
+    Compiles the check of the fields of a `TypedDict` or of a dataclass.
+    The annotations of the fields are resolved on the first check, so that
+    forward references and recursive classes are supported.
+
+    ### Arguments
+    * `cls`: `type`\n
+        The `TypedDict` or the dataclass
+    * `typed_dict`: `bool`\n
+        Whether or not the class is a `TypedDict`
+
+    ### Return
+    * type `_Node`: The compiled node
+    """
+    fields = None
+
+    def compile_fields() -> tuple[tuple[str, _Node], ...]:
+        type_hints = get_type_hints(cls)
+        if typed_dict:
+            names = list(type_hints)
+        else:
+            names = [field.name for field in dataclass_fields(cls)]
+        return tuple((name, compile_node(type_hints.get(name, Any))) for name in names)
+
+    if typed_dict:
+        required = cls.__required_keys__
+
+        def match_fields(value: Any, select: Callable = None, memo: set = None) -> bool:
+            nonlocal fields
+            if not isinstance(value, Mapping) or not required <= value.keys():
+                return False
+            if fields is None:
+                fields = compile_fields()
+            return all(
+                node.match(value[name], select, memo)
+                for name, node in fields
+                if name in value
+            )
+    else:
+        def match_fields(value: Any, select: Callable = None, memo: set = None) -> bool:
+            nonlocal fields
+            if not isinstance(value, cls):
+                return False
+            if fields is None:
+                fields = compile_fields()
+            return all(
+                node.match(getattr(value, name), select, memo)
+                for name, node in fields
+            )
+
+    return _Node(match_fields, memoized=True)
+
+def _typix_node(type_: Typix) -> _Node:
+    """
+    Compiles a dynamic type nested in a type. The item matches when
+    the dynamic type does not return any error.
+
+    ### Arguments
+    * `type_`: `Typix`\n
+        The dynamic type
+
+    ### Return
+    * type `_Node`: The compiled node
+    """
+    check = compile_check(type_)
+    return _Node(lambda value, select=None, memo=None: check(value).state)
+
+def _compile_node(type_: Any, vectorize: bool = False) -> _Node:
+    """
+    Compiles a type into a node of a checker tree. Nested types like
+    `dict[str, list[int]]`, unions, `Optional`, `Literal`, `tuple[T, ...]`,
+    `TypedDict` and dataclasses are compiled recursively.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type to compile
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists in bulk as NumPy arrays.
+        Defaults to `False`
+
+    ### Return
+    * type `_Node`: The compiled node
+    """
+    # Unresolved and unconstrained types match anything
+    if type_ is Any or isinstance(type_, (TypeVar, ForwardRef, str)):
+        return _instance_node(object)
+
+    if type_ is None:
+        return _instance_node(_NoneType)
+
+    if isinstance(type_, tuple):
+        return _any_node(type_, vectorize)
+
+    if isinstance(type_, Typix):
+        return _typix_node(type_)
+
+    if isinstance(type_, NewType):
+        return compile_node(type_.__supertype__, vectorize)
+
+    origin = get_origin(type_)
+    if origin is Union or isinstance(type_, UnionType):
+        return _any_node(get_args(type_), vectorize)
+
+    if origin is Literal:
+        literals = get_args(type_)
+
+        def match_literal(value: Any, select: Callable = None, memo: set = None) -> bool:
+            return any(type(value) is type(literal) and value == literal for literal in literals)
+        return _Node(match_literal)
+
+    if origin is Annotated:
+        return compile_node(type_.__origin__, vectorize)
+
+    if origin is not None:
+        # Needs to match the origin, `isinstance` raises on special origins
+        if not isclass(origin):
+            return _Node(lambda value, select=None, memo=None: isinstance(value, origin))
+        return _alias_node(type_, vectorize)
+
+    if is_typeddict(type_):
+        return _fields_node(type_, True)
+
+    if isclass(type_) and is_dataclass(type_):
+        return _fields_node(type_, False)
+
+    if isclass(type_):
+        return _instance_node(type_)
+
+    return _Node(lambda value, select=None, memo=None: isinstance(value, type_))
+
+_cached_compile_node = lru_cache(maxsize=CACHE_SIZE)(_compile_node)
+
+def compile_node(type_: Any, vectorize: bool = False) -> _Node:
+    """
+    Compiles a type into a node of a checker tree. Nodes are memoized
+    by type in a bounded LRU cache, so that each distinct nested type
+    is only compiled once.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type to compile
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists in bulk as NumPy arrays.
+        Defaults to `False`
+
+    ### Return
+    * type `_Node`: The compiled node
+    """
+    try:
+        hash(type_)
+    except TypeError:
+        return _compile_node(type_, vectorize)
+    return _cached_compile_node(type_, vectorize)
+
+def _compile_alias(alias: GenericAlias, vectorize: bool = False) -> Predicate:
+    """
+    Compiles a `GenericAlias` into a predicate. The alias and its nested
+    types are compiled once into a checker tree.
+
+    ### Arguments
+    * `alias`: `GenericAlias`\n
+        The `GenericAlias` to compile
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists in bulk as NumPy arrays.
+        Defaults to `False`
+
+    ### Return
+    * type `Callable[[Any, Callable], bool]`: Whether or not a value matches
+    the alias, the optional second argument selects the items to inspect
+
+    ### Raises
+    * `NotImplementedError`\n
+        When trying to use an instance of `typing._SpecialForm` as `GenericAlias`
+    """
+    # NOTE: Probably never will be implemented due to
+    # the new __class_getitem__ special method. Also, leads
+    # to confusing code, when trying to implement the support.
+    if isinstance(alias, _SpecialForm):
+        raise NotImplementedError("typing._SpecialForm is currently not supported")
+
+    node = compile_node(alias, vectorize)
+    match = node.match
+    if not node.memoized:
+        return match
+
+    # The memo only lives for a single check
+    return lambda value, select=None: match(value, select, set())
+
+def _stream_types(alias: GenericAlias) -> tuple[type | None, Any]:
+    """
+    Gets the origin and the item type of an iterable `GenericAlias`
+    whose iterators can be validated lazily.
+
+    ### Arguments
+    * `alias`: `GenericAlias`\n
+        The `GenericAlias` to inspect
+
+    ### Return
+    * type `tuple[type | None, Any]`: The origin and the item type,
+    `(None, None)` when the alias is not an iterable alias
+    """
+    origin = get_origin(alias)
+    args = get_args(alias)
+    if not isclass(origin) or not issubclass(origin, Iterable) or issubclass(origin, Mapping):
+        return None, None
+
+    # Only the yield type of a generator describes its items
+    if issubclass(origin, collection.Generator) or len(args) == 1:
+        return origin, args[0]
+    return origin, args
+
+def _compile_check(type_: Any, vectorize: bool = False) -> Checker:
+    """
+    Compiles a type expression into a checker. The dispatch on the
+    kind of the type is only done once.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type to compile
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists in bulk as NumPy arrays.
+        Defaults to `False`
+
+    ### Return
+    * type `Callable[[Any, Context, Strategy], CheckResult]`: The checker
+    """
+    kind = classify(type_)
+
+    # Tuple recursive support
+    if kind is TypeKind.TUPLE:
+        checkers = tuple(compile_check(t, vectorize) for t in type_)
+        valid = compile_valid(type_, vectorize)
+
+        def check_tuple(value: Any, context: Context = None, strategy: Strategy = None) -> CheckResult:
+            # The alternatives only need a state without a strategy
+            if strategy is None:
+                return CheckResult(valid(value), value = value, context = context)
+            return CheckResult(
+                any(checker(value, None, strategy).state for checker in checkers),
+                value = value,
+                context = context,
+                strategy = strategy
+            )
+        return check_tuple
+
+    # GenericAlias, union, `TypedDict` and dataclass support
+    if kind in STRUCTURAL_KINDS:
+        match = compile_alias(type_, vectorize)
+        origin, item_type = _stream_types(type_)
+
+        def check_alias(value: Any, context: Context = None, strategy: Strategy = None) -> CheckResult:
+            if strategy is None:
+                return CheckResult(match(value), value = value, context = context)
+
+            # One-shot iterators are validated lazily
+            if (
+                strategy.kind == Strategy.STREAM
+                and origin is not None
+                and isinstance(value, collection.Iterator)
+                and isinstance(value, origin)
+            ):
+                return CheckResult(
+                    True,
+                    value = Stream(value, compile_check(item_type), item_type, strategy.collect),
+                    context = context,
+                    strategy = strategy,
+                    inspected = 0,
+                    complete = False
+                )
+
+            inspection = Inspection(strategy)
+            return CheckResult(
+                match(value, inspection.select),
+                value = value,
+                context = context,
+                strategy = strategy,
+                inspected = inspection.inspected,
+                complete = inspection.complete
+            )
+        return check_alias
+
+    # Dynamic Type support
+    if kind is TypeKind.TYPIX:
+        def check_typix(value: Any, context: Context = None, strategy: Strategy = None) -> CheckResult:
+            frame = Frame(type_, value, function_context=False)
+
+            # Add context data if present
+            if context:
+                frame.arg = context.arg_name
+                frame.func = context.func
+
+            new_value = type_._run(frame)
+
+            return CheckResult(
+                frame.fail is None,
+                frame.fail,
+                value = new_value,
+                context = context
+            )
+        return check_typix
+
+    # Standard type check
+    def check_type(value: Any, context: Context = None, strategy: Strategy = None) -> CheckResult:
+        return CheckResult(isinstance(value, type_), value = value, context = context)
+    return check_type
+
+def _compile_valid(type_: Any, vectorize: bool = False) -> Validator:
+    """
+    Compiles a type expression into a validator only returning the state
+    of the check. Nothing is allocated to check a plain type or a
+    `GenericAlias`, a dynamic type still needs a frame.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type to compile
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists in bulk as NumPy arrays.
+        Defaults to `False`
+
+    ### Return
+    * type `Callable[[Any], bool]`: The validator
+    """
+    kind = classify(type_)
+
+    # Tuple recursive support
+    if kind is TypeKind.TUPLE:
+        validators = tuple(compile_valid(t, vectorize) for t in type_)
+
+        def valid_tuple(value: Any) -> bool:
+            for valid in validators:
+                if valid(value):
+                    return True
+            return False
+        return valid_tuple
+
+    # GenericAlias, union, `TypedDict` and dataclass support
+    if kind in STRUCTURAL_KINDS:
+        return compile_alias(type_, vectorize)
+
+    # Dynamic Type support
+    if kind is TypeKind.TYPIX:
+        def valid_typix(value: Any) -> bool:
+            frame = Frame(type_, value, function_context=False)
+            type_._run(frame)
+            return frame.fail is None
+        return valid_typix
+
+    # Standard type check
+    def valid_type(value: Any) -> bool:
+        return isinstance(value, type_)
+    return valid_type
+
+_cached_compile_alias = lru_cache(maxsize=CACHE_SIZE)(_compile_alias)
+_cached_compile_check = lru_cache(maxsize=CACHE_SIZE)(_compile_check)
+_cached_compile_valid = lru_cache(maxsize=CACHE_SIZE)(_compile_valid)
+
+def compile_alias(alias: GenericAlias, vectorize: bool = False) -> Predicate:
+    """
+    Compiles a `GenericAlias` into a reusable predicate. Predicates
+    are memoized by alias in a bounded LRU cache.
+    The items of `array.array`, `memoryview` and `numpy.ndarray` values
+    are checked in O(1) from their typecode, format or dtype.
+
+    ### Arguments
+    * `alias`: `GenericAlias`\n
+        The `GenericAlias` to compile
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to convert lists of at least `VECTORIZE_SIZE` items
+        to NumPy arrays when the arguments of the alias are numeric, and
+        to check them in bulk. The items are checked as NumPy coerces them,
+        so `int` items match `float` in a list of floats. Ignored when
+        NumPy is not installed.
+        Defaults to `False`
+
+    ### Return
+    * type `Callable[[Any, Callable], bool]`: Whether or not a value matches
+    the alias, the optional second argument selects the items to inspect
+
+    ### Raises
+    * `NotImplementedError`\n
+        When trying to use an instance of `typing._SpecialForm` as `GenericAlias`
+    """
+    try:
+        hash(alias)
+    except TypeError:
+        return _compile_alias(alias, vectorize)
+    return _cached_compile_alias(alias, vectorize)
+
+def compile_check(type_: Any, vectorize: bool = False) -> Checker:
+    """
+    Compiles a type expression into a reusable checker with the same
+    behavior as `typecheck`. Checkers are memoized by type in a bounded
+    LRU cache, unhashable types are compiled on each call.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type to compile
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists in bulk as NumPy arrays,
+        see `compile_alias`.
+        Defaults to `False`
+
+    ### Return
+    * type `Callable[[Any, Context, Strategy], CheckResult]`: A checker taking
+    a value, an optional context and an optional strategy, and returning
+    a `CheckResult`
+
+    .. doctest
+        >>> check = compile_check(list[int])
+        >>> check([0, 1, 2])
+        <CheckResult: True>
+        >>> check([0.0])
+        <CheckResult: False>
+    """
+    try:
+        hash(type_)
+    except TypeError:
+        return _compile_check(type_, vectorize)
+    return _cached_compile_check(type_, vectorize)
+
+def compile_valid(type_: Any, vectorize: bool = False) -> Validator:
+    """
+    Compiles a type expression into a reusable validator returning whether
+    or not a value is valid, without building a `CheckResult`. Validators
+    are memoized by type in a bounded LRU cache, unhashable types are
+    compiled on each call.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type to compile
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists in bulk as NumPy arrays,
+        see `compile_alias`.
+        Defaults to `False`
+
+    ### Return
+    * type `Callable[[Any], bool]`: A validator taking a value
+
+    .. doctest
+        >>> valid = compile_valid((int, list[int]))
+        >>> valid([0, 1, 2])
+        True
+        >>> valid('0')
+        False
+    """
+    try:
+        hash(type_)
+    except TypeError:
+        return _compile_valid(type_, vectorize)
+    return _cached_compile_valid(type_, vectorize)
+
+def clear_caches() -> None:
+    """
+    Empties the caches of compiled checkers and predicates,
+    and of the kinds of the types.
+
+    ### Return
+    * type `NoneType`: Returns `None`
+    """
+    _cached_compile_node.cache_clear()
+    _cached_compile_alias.cache_clear()
+    _cached_compile_check.cache_clear()
+    _cached_compile_valid.cache_clear()
+    clear_kinds()
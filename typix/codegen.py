@@ -0,0 +1,342 @@
+from typing import Callable
+from inspect import CO_VARARGS, CO_VARKEYWORDS, iscoroutinefunction
+from types import FunctionType
+from functools import update_wrapper
+
+from .plan import CallPlan, compile_plan, _apply, _apply_async, DEFAULTS_CALL
+from .instrument import profiler, SKIPPED
+
+# Prefix of the names injected in the namespace of the generated wrappers
+_PREFIX = '_typix_'
+
+def can_generate(func: FunctionType) -> bool:
+    """
+    Checks whether a specialized wrapper can be generated for a function.
+    The argument names must not collide with the names injected by the
+    code generation.
+
+    ### Arguments
+    * `func`: `function`\n
+        The function to check
+
+    ### Return
+    * type `bool`: Whether or not a specialized wrapper can be generated
+    """
+    code = func.__code__
+    count = code.co_argcount + code.co_kwonlyargcount
+    count += bool(code.co_flags & CO_VARARGS) + bool(code.co_flags & CO_VARKEYWORDS)
+    return not any(name.startswith(_PREFIX) for name in code.co_varnames[:count])
+
+class _Missing:
+    """
+    The default value of the generated parameters whose default value
+    is processed once, so that a missing argument can be detected.
+    """
+    def __repr__(self) -> str:
+        return '<missing>'
+
+_MISSING = _Missing()
+
+def _processed_defaults(plan: CallPlan) -> dict:
+    """
+    Gets the default values of a plan that are already processed.
+
+    ### Arguments
+    * `plan`: `CallPlan`\n
+        The compiled plan of the function
+
+    ### Return
+    * type `dict`: The processed default value by argument name
+    """
+    return {
+        argument: value
+        for _, argument, type_hint, value in plan.defaults
+        if type_hint is None
+    }
+
+def generate_source(func: FunctionType, plan: CallPlan) -> tuple[str, dict]:
+    """
+    Generates the source code of a wrapper specialized to the signature
+    of a function. Only the annotated parameters of the plan are processed,
+    every other argument is forwarded as is. The items of annotated
+    variadic parameters are processed in a comprehension. The wrapper
+    of a coroutine function is a coroutine function awaiting the
+    asynchronous dynamic types.
+
+    ### Arguments
+    * `func`: `function`\n
+        The function to wrap
+    * `plan`: `CallPlan`\n
+        The compiled plan of the function
+
+    ### Return
+    * type `tuple[str, dict]`: The source code of the wrapper and the
+    namespace it must be executed in
+    """
+    code = func.__code__
+    names = code.co_varnames
+    argcount = code.co_argcount
+    posonly = code.co_posonlyargcount
+    kwonly = code.co_kwonlyargcount
+    asynchronous = iscoroutinefunction(func)
+    processed_defaults = _processed_defaults(plan)
+
+    namespace = {
+        f'{_PREFIX}apply': _apply,
+        f'{_PREFIX}apply_async': _apply_async,
+        f'{_PREFIX}func': func,
+        f'{_PREFIX}call': profiler.caller(func),
+        f'{_PREFIX}missing': _MISSING,
+        f'{_PREFIX}skipped': SKIPPED
+    }
+    annotated = {argument: type_hint for _, argument, type_hint in plan.slots}
+    annotated.update(plan.keywords)
+
+    def process(argument: str, type_hint, value: str) -> str:
+        namespace[f'{_PREFIX}type_{argument}'] = type_hint
+        apply = f'{_PREFIX}apply'
+        if type_hint.asynchronous:
+            apply = f'await {_PREFIX}apply_async'
+        return f'{apply}({_PREFIX}type_{argument}, {argument!r}, {_PREFIX}func, {value})'
+
+    def forward(argument: str) -> str:
+        if argument not in annotated:
+            return argument
+        expression = process(argument, annotated[argument], argument)
+        if argument in processed_defaults:
+            namespace[f'{_PREFIX}default_{argument}'] = processed_defaults[argument]
+            expression = (
+                f'({_PREFIX}default_{argument} if {argument} is {_PREFIX}missing else {expression})'
+            )
+        return expression
+
+    # Signature, the default values are set on the wrapper afterwards
+    parameters = []
+    arguments = []
+    for index, argument in enumerate(names[:argcount]):
+        if index >= argcount - len(func.__defaults__ or ()):
+            parameters.append(f'{argument}=None')
+        else:
+            parameters.append(argument)
+        if index == posonly - 1:
+            parameters.append('/')
+        arguments.append(forward(argument))
+
+    position = argcount + kwonly
+    if code.co_flags & CO_VARARGS:
+        varargs = names[position]
+        parameters.append(f'*{varargs}')
+        if plan.var_positional is not None:
+            item = process(varargs, plan.var_positional[1], f'{_PREFIX}item')
+            arguments.append(f'*[{item} for {_PREFIX}item in {varargs}]')
+        else:
+            arguments.append(f'*{varargs}')
+        position += 1
+    elif kwonly:
+        parameters.append('*')
+
+    for argument in names[argcount:argcount + kwonly]:
+        parameters.append(argument)
+        arguments.append(f'{argument}={forward(argument)}')
+
+    if code.co_flags & CO_VARKEYWORDS:
+        varkw = names[position]
+        parameters.append(f'**{varkw}')
+        if plan.var_keyword is not None:
+            item = process(varkw, plan.var_keyword[1], f'{_PREFIX}item')
+            arguments.append(
+                f'**{{{_PREFIX}key: {item} for {_PREFIX}key, {_PREFIX}item in {varkw}.items()}}'
+            )
+        else:
+            arguments.append(f'**{varkw}')
+
+    # Body, the function is called through a global swapped by the profiler,
+    # which skips the call when arguments failed while the errors are collected
+    call = f"{_PREFIX}call({', '.join(arguments)})"
+    if asynchronous:
+        call = f"await {call}"
+    result = f'{_PREFIX}value'
+    if plan.return_type is not None:
+        namespace[f'{_PREFIX}return'] = plan.return_type
+        apply = f'{_PREFIX}apply'
+        if plan.return_type.asynchronous:
+            apply = f'await {_PREFIX}apply_async'
+        result = f"{apply}({_PREFIX}return, 'return', {_PREFIX}func, {result})"
+
+    define = 'async def' if asynchronous else 'def'
+    source = (
+        f"{define} {_PREFIX}wrapper({', '.join(parameters)}):\n"
+        f"    {_PREFIX}value = {call}\n"
+        f"    if {_PREFIX}value is {_PREFIX}skipped:\n"
+        f"        return None\n"
+        f"    return {result}\n"
+    )
+    return source, namespace
+
+def _set_defaults(wrapper: FunctionType, func: FunctionType, plan: CallPlan) -> None:
+    """
+    Sets the default values of a generated wrapper. The default values
+    that are already processed are replaced by a marker of missing argument.
+
+    ### Arguments
+    * `wrapper`: `function`\n
+        The generated wrapper
+    * `func`: `function`\n
+        The wrapped function
+    * `plan`: `CallPlan`\n
+        The compiled plan of the function
+
+    ### Return
+    * type `NoneType`: Returns `None`
+    """
+    processed_defaults = _processed_defaults(plan)
+    code = func.__code__
+    defaults = func.__defaults__
+    if defaults:
+        offset = code.co_argcount - len(defaults)
+        names = code.co_varnames[offset:code.co_argcount]
+        defaults = tuple(
+            _MISSING if argument in processed_defaults else value
+            for argument, value in zip(names, defaults)
+        )
+    kwdefaults = func.__kwdefaults__
+    if kwdefaults:
+        kwdefaults = {
+            argument: _MISSING if argument in processed_defaults else value
+            for argument, value in kwdefaults.items()
+        }
+    wrapper.__defaults__ = defaults
+    wrapper.__kwdefaults__ = kwdefaults
+
+def generate_wrapper(func: FunctionType, plan: CallPlan = None, defaults: str = DEFAULTS_CALL) -> FunctionType:
+    """
+    Builds a wrapper specialized to the signature of a function. It has
+    the same parameters as the function, calls the dynamic types inline
+    for the annotated parameters only and does not build any intermediate
+    argument list.
+
+    ### Arguments
+    * `func`: `function`\n
+        The function to wrap
+    * `plan`: `Optional[CallPlan]`\n
+        The compiled plan of the function.
+        Defaults to `None`: the plan is compiled from the function
+    * `defaults`: `Optional[str]`\n
+        The mode of processing of the default values, see `compile_plan`.
+        Defaults to `'call'`
+
+    ### Return
+    * type `function`: The specialized wrapper
+
+    ### Raises
+    * `NameError`\n
+        When an annotation is a forward reference that cannot be resolved yet
+    """
+    if plan is None:
+        plan = compile_plan(func, defaults)
+
+    # Imported when a wrapper is generated, so that importing `typix` does not load it
+    from .persist import compile_source
+
+    source, namespace = generate_source(func, plan)
+    exec(compile_source(func, source, f'<typix wrapper of {func.__qualname__}>'), namespace)
+
+    wrapper = namespace[f'{_PREFIX}wrapper']
+    _set_defaults(wrapper, func, plan)
+    update_wrapper(wrapper, func)
+    wrapper.__typix_plan__ = plan
+    wrapper.__typix_source__ = source
+    wrapper.__typix_code__ = wrapper.__code__
+    wrapper.__typix_defaults__ = defaults
+    profiler.register(wrapper)
+    return wrapper
+
+def regenerate_wrapper(wrapper: FunctionType) -> None:
+    """
+    Compiles again the plan of a generated wrapper and updates its code
+    in place, so that every reference to the wrapper stays valid.
+
+    ### Arguments
+    * `wrapper`: `function`\n
+        A wrapper built by `generate_wrapper`
+
+    ### Return
+    * type `NoneType`: Returns `None`
+
+    ### Raises
+    * `NameError`\n
+        When an annotation is a forward reference that cannot be resolved yet
+    """
+    func = wrapper.__wrapped__
+    plan = compile_plan(func, wrapper.__typix_defaults__)
+    # Imported when a wrapper is generated, so that importing `typix` does not load it
+    from .persist import compile_source
+
+    source, namespace = generate_source(func, plan)
+    exec(compile_source(func, source, f'<typix wrapper of {func.__qualname__}>'), namespace)
+
+    # The wrapper has no free variable, its globals can be swapped in place
+    wrapper.__globals__.clear()
+    wrapper.__globals__.update(namespace)
+    wrapper.__code__ = wrapper.__typix_code__ = namespace[f'{_PREFIX}wrapper'].__code__
+    _set_defaults(wrapper, func, plan)
+    wrapper.__typix_plan__ = plan
+    wrapper.__typix_source__ = source
+
+# The bodies of the generated wrappers whose calls are not all processed
+_BYPASS_SOURCE = (
+    "def {prefix}bypass(*args, **kwargs):\n"
+    "    return {prefix}func(*args, **kwargs)\n"
+    "def {prefix}gated(*args, **kwargs):\n"
+    "    if {prefix}gate():\n"
+    "        return {prefix}processed(*args, **kwargs)\n"
+    "    return {prefix}func(*args, **kwargs)\n"
+)
+_BYPASS_SOURCE_ASYNC = (
+    "async def {prefix}bypass(*args, **kwargs):\n"
+    "    return await {prefix}func(*args, **kwargs)\n"
+    "async def {prefix}gated(*args, **kwargs):\n"
+    "    if {prefix}gate():\n"
+    "        return await {prefix}processed(*args, **kwargs)\n"
+    "    return await {prefix}func(*args, **kwargs)\n"
+)
+
+def gate_wrapper(wrapper: FunctionType, gate: Callable[[], bool] | None, bypass: bool = False) -> None:
+    """
+    Swaps the code of a generated wrapper in place, so that only the calls
+    let through by a gate are processed. Without gate, the specialized code
+    is restored and costs nothing more.
+
+    ### Arguments
+    * `wrapper`: `function`\n
+        A wrapper built by `generate_wrapper`
+    * `gate`: `Callable[[], bool] | None`\n
+        The function telling whether the current call is processed,
+        `None` to process every call
+    * `bypass`: `Optional[bool]`\n
+        Whether or not no call is processed, the function is then
+        called straight away without testing the gate.
+        Defaults to `False`
+
+    ### Return
+    * type `NoneType`: Returns `None`
+    """
+    if gate is None:
+        wrapper.__code__ = wrapper.__typix_code__
+        return
+
+    namespace = wrapper.__globals__
+    template = _BYPASS_SOURCE_ASYNC if iscoroutinefunction(wrapper.__wrapped__) else _BYPASS_SOURCE
+    exec(compile(template.format(prefix=_PREFIX), f'<typix gate of {wrapper.__qualname__}>', 'exec'), namespace)
+
+    # The specialized code keeps running in a copy of the wrapper
+    processed = FunctionType(wrapper.__typix_code__, namespace, wrapper.__name__)
+    processed.__defaults__ = wrapper.__defaults__
+    processed.__kwdefaults__ = wrapper.__kwdefaults__
+    namespace[f'{_PREFIX}processed'] = processed
+    namespace[f'{_PREFIX}gate'] = gate
+
+    if bypass:
+        wrapper.__code__ = namespace[f'{_PREFIX}bypass'].__code__
+    else:
+        wrapper.__code__ = namespace[f'{_PREFIX}gated'].__code__
@@ -1,10 +1,15 @@
+from typing import Any
 from types import FunctionType
+from functools import lru_cache
+from contextvars import ContextVar
 
 class Context:
     """
     A class containing argument data to use in a non-function context.
     Should not be instanciated directly.
     """
+    __slots__ = ('__arg_name', '__func')
+    
     def __init__(self, arg_name: str = None, func: FunctionType = None):
         """
         A class containing argument data to use in a non-function context.
@@ -42,4 +47,121 @@ class Context:
         `func`: `function`\n
             The function containing the argument
         """
-        return self.__func
\ No newline at end of file
+        return self.__func
+
+@lru_cache(maxsize=1024)
+def shared_context(arg_name: str = None, func: FunctionType = None) -> Context:
+    """
+    Gets the context of an argument. Contexts are immutable, so a single
+    instance is shared by all the processings of the same argument.
+    
+    ### Arguments
+    * `arg_name`: `Optional[str]`\n
+        The name of the argument
+    * `func`: `Optional[function]`\n
+        The function containing the argument
+    
+    ### Return
+    * type `Context`: The shared context
+    """
+    return Context(arg_name, func)
+
+class Frame:
+    """
+    The state of a single processing of a value by a dynamic type.
+    A new frame is created on each invocation, so that a dynamic type
+    instance shared by multiple threads or asyncio tasks is reentrant.
+    Should not be instanciated directly.
+    """
+    __slots__ = ('typix', 'value', 'arg', 'func', 'function_context', 'fail', 'parent')
+
+    def __init__(
+        self,
+        typix: Any,
+        value: Any,
+        arg: str = None,
+        func: FunctionType = None,
+        function_context: bool = True
+    ):
+        """
+        The state of a single processing of a value by a dynamic type.
+        Should not be instanciated directly.
+
+        ### Arguments
+        * `typix`: `Typix`\n
+            The dynamic type processing the value
+        * `value`: `Any`\n
+            The value to process
+        * `arg`: `Optional[str]`\n
+            The name of the argument
+        * `func`: `Optional[function]`\n
+            The function containing the argument
+        * `function_context`: `Optional[bool]`\n
+            Whether or not the value is processed in a function context.
+            Defaults to `True`
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.typix = typix
+        self.value = value
+        self.arg = arg
+        self.func = func
+        self.function_context = function_context
+        self.fail = None
+        self.parent = None
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"<{class_name}: {self.typix.__class__.__name__} {repr(self.arg)}>"
+
+    def _error(self) -> BaseException | None:
+        """
+        Gets the error of the frame. A failure deferred by the report
+        collecting the errors builds its exception when it is read.
+
+        ### Return
+        * type `BaseException`: The error if any, otherwise `None`
+        """
+        fail = self.fail
+        if fail is not None and not isinstance(fail, BaseException):
+            fail = self.fail = fail.reason
+        return fail
+
+# The innermost frame of the current thread or asyncio task
+_current_frame: ContextVar[Frame | None] = ContextVar('typix_frame', default=None)
+
+def current_frame(typix: Any = None) -> Frame | None:
+    """
+    Gets the frame being processed in the current thread or asyncio task.
+
+    ### Arguments
+    * `typix`: `Optional[Typix]`\n
+        The dynamic type to get the frame from. The innermost frame
+        processed by this instance is returned.
+        Defaults to `None`: the innermost frame is returned
+
+    ### Return
+    * type `Frame`: The frame if any, otherwise `None`
+    """
+    frame = _current_frame.get()
+    if typix is None:
+        return frame
+    while frame is not None and frame.typix is not typix:
+        frame = frame.parent
+    return frame
+
+# The report collecting the fatal errors of the current thread or asyncio task
+_current_report: ContextVar[Any] = ContextVar('typix_report', default=None)
+
+def failed_arguments() -> bool:
+    """
+    Checks whether arguments failed since the last call while the errors
+    are collected, in which case the decorated function must not be called.
+    The pending failures are cleared.
+
+    ### Return
+    * type `bool`: Whether or not the call must be skipped
+    """
+    report = _current_report.get()
+    return report is not None and report._pop_pending()
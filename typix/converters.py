@@ -0,0 +1,194 @@
+from typing import Any, Callable, Iterable, get_args, get_origin
+from types import GenericAlias
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import lru_cache
+
+from .error import TypixError
+from .kinds import _TypingGenericAlias
+from .utils import display_type
+
+# Type Alias for the converters
+Converter = Callable[[Any], Any]
+
+# The specialized converters by source type and target type
+_converters: dict[tuple[type, type], Converter] = {
+    (str, int): int,
+    (str, float): float,
+    (str, Decimal): Decimal,
+    (str, bytes): str.encode,
+    (bytes, str): bytes.decode,
+    (str, datetime): datetime.fromisoformat,
+    (str, date): date.fromisoformat,
+    (str, time): time.fromisoformat,
+    (int, float): float,
+    (list, tuple): tuple,
+    (tuple, list): list
+}
+
+# The containers built from an iterable of converted items
+_CONTAINERS = frozenset((list, set, frozenset))
+
+class ConversionError(TypixError):
+    """
+    Indicates that a value cannot be converted to a type.
+    The message is only built when it is read.
+    """
+    def __init__(self, value: Any, type_: Any):
+        """
+        Indicates that a value cannot be converted to a type.
+
+        ### Arguments
+        * `value`: `Any`\n
+            The value that cannot be converted
+        * `type_`: `Any`\n
+            The type to convert to
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        super().__init__()
+        self.value_type = type(value)
+        self.type_ = type_
+
+    def __str__(self) -> str:
+        return f"Cannot convert '{display_type(self.value_type)}' to '{display_type(self.type_)}'"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self)!r})"
+
+    def __reduce__(self) -> tuple:
+        # The value is not kept, only its type is restored
+        return self.__class__, (None, self.type_), {'value_type': self.value_type}
+
+def register_converter(source: type, target: Any, converter: Converter) -> None:
+    """
+    Registers a specialized converter used by `Convert` to convert
+    the values of a type to another type, replacing any previous one.
+
+    ### Arguments
+    * `source`: `type`\n
+        The exact type of the values to convert
+    * `target`: `Any`\n
+        The type to convert to
+    * `converter`: `Callable[[Any], Any]`\n
+        The function converting a value, raises a `ValueError` when the
+        value cannot be converted. Any other error is propagated
+
+    ### Return
+    * type `NoneType`: Returns `None`
+    """
+    _converters[(source, target)] = converter
+    _compile_converter.cache_clear()
+
+def _items_converter(item_type: Any) -> Converter:
+    """
+    Gets the converter of the items of a container.
+
+    ### Arguments
+    * `item_type`: `Any`\n
+        The type of the items
+
+    ### Return
+    * type `Callable[[Any], Any]`: The converter of an item
+    """
+    if isinstance(item_type, (GenericAlias, _TypingGenericAlias)):
+        return _compile_converter(item_type)
+    return lambda item: convert(item, item_type)
+
+@lru_cache(maxsize=1024)
+def _compile_converter(alias: Any) -> Converter:
+    """
+    Compiles a converter building a whole container in one pass,
+    converting each item to the arguments of the alias.
+
+    ### Arguments
+    * `alias`: `GenericAlias`\n
+        The container type to convert to, like `list[int]` or `dict[str, float]`
+
+    ### Return
+    * type `Callable[[Any], Any]`: The converter of the container
+
+    ### Raises
+    * `TypeError`\n
+        When the origin of the alias is not a supported container
+    """
+    origin = get_origin(alias)
+    args = get_args(alias)
+
+    if origin in _CONTAINERS or (origin is tuple and len(args) == 2 and args[1] is Ellipsis):
+        convert_item = _items_converter(args[0])
+
+        def convert_container(value: Iterable) -> Any:
+            return origin([convert_item(item) for item in value])
+        return convert_container
+
+    if origin is tuple:
+        converters = tuple(_items_converter(arg) for arg in args)
+
+        def convert_tuple(value: Iterable) -> tuple:
+            items = tuple(value)
+            if len(items) != len(converters):
+                raise ValueError(f"Expected {len(converters)} items, got {len(items)}")
+            return tuple(convert_item(item) for convert_item, item in zip(converters, items))
+        return convert_tuple
+
+    if origin is dict:
+        convert_key = _items_converter(args[0])
+        convert_value = _items_converter(args[1])
+
+        def convert_mapping(value: Any) -> dict:
+            return {convert_key(key): convert_value(item) for key, item in dict(value).items()}
+        return convert_mapping
+
+    raise TypeError(f"Cannot convert to '{alias}'")
+
+def convert(value: Any, type_: Any) -> Any:
+    """
+    Converts a value to a type. A value of the exact type is returned as is,
+    a specialized converter is used if one is registered for the type of the
+    value, and the containers like `list[int]` are converted with their items.
+    Otherwise the type is called with the value.
+
+    ### Arguments
+    * `value`: `Any`\n
+        The value to convert
+    * `type_`: `Any`\n
+        The type to convert to
+
+    ### Return
+    * type `Any`: The converted value
+
+    ### Raises
+    * `ValueError`, `OverflowError`\n
+        When the value cannot be converted, including the `TypeError` of
+        the built-in types called with a value of an unsupported type
+    * `Any`\n
+        Whatever Exception a registered converter or the type raised
+
+    .. doctest
+        >>> convert('1', int)
+        1
+        >>> convert(['1', '2'], tuple[int, ...])
+        (1, 2)
+        >>> convert({'a': '1.5'}, dict[str, float])
+        {'a': 1.5}
+    """
+    value_type = type(value)
+    if value_type is type_:
+        return value
+
+    converter = _converters.get((value_type, type_))
+    if converter is not None:
+        return converter(value)
+
+    if isinstance(type_, (GenericAlias, _TypingGenericAlias)):
+        return _compile_converter(type_)(value)
+    try:
+        return type_(value)
+    except TypeError as exception:
+        # The built-in types reject the values of an unsupported type with a
+        # `TypeError`, the other ones and the missing values are not conversions
+        if value is None or not isinstance(type_, type) or type_.__module__ != 'builtins':
+            raise
+        raise ValueError(str(exception)) from exception
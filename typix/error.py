@@ -1,4 +1,5 @@
 from typing import Any
+from array import array
 
 from .context import Context
 
@@ -7,6 +8,40 @@ class TypixError(BaseException):
     Common base class for all exceptions related to the `Typix` module
     """
     pass
+
+class ConstraintError(TypixError):
+    """
+    Indicates that a value failed the check of a `Strict` dynamic type.
+    The message is only built when it is read.
+    """
+    def __init__(self, type_: Any, cause: BaseException = None):
+        """
+        Indicates that a value failed the check of a `Strict` dynamic type.
+
+        ### Arguments
+        * `type_`: `Any`\n
+            The type the value was checked with
+        * `cause`: `Optional[BaseException]`\n
+            The error returned by the dynamic type the value was checked with.
+            Defaults to `None`
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        super().__init__()
+        self.type_ = type_
+        self.cause = cause
+
+    def __str__(self) -> str:
+        if self.cause is None:
+            return "Strict constraint failed"
+        return f"Strict constraint failed: {self.cause}"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self)!r})"
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (self.type_, self.cause)
     
 class CheckResult:
     """
@@ -15,12 +50,17 @@ class CheckResult:
     if the state is `False`. If this object is used in an `if` statement,
     it will take the value of it's state.
     """
+    __slots__ = ('__state', '__exception', '__value', '__context', '__strategy', '__inspected', '__complete')
+    
     def __init__(
         self,
         state: bool,
         exception: BaseException = None,
         value: Any = None,
-        context: Context = None
+        context: Context = None,
+        strategy: Any = None,
+        inspected: int = None,
+        complete: bool = True
     ):
         """
         This object is returned by the `typecheck` function. It contains
@@ -43,6 +83,15 @@ class CheckResult:
             not provide argument or function data. Must be provided
             for dynamic type that use function context
             Defaults to `None`
+        * `strategy`: `Optional[Strategy]`\n
+            The strategy applied to inspect the collections.
+            Defaults to `None`: every item is inspected
+        * `inspected`: `Optional[int]`\n
+            The number of items inspected when a strategy is applied.
+            Defaults to `None`
+        * `complete`: `Optional[bool]`\n
+            Whether or not every item was inspected.
+            Defaults to `True`
         
         ### Return
         * type `NoneType`: Returns `None` as it is the constructor
@@ -51,6 +100,9 @@ class CheckResult:
         self.__exception = exception
         self.__value = value
         self.__context = context
+        self.__strategy = strategy
+        self.__inspected = inspected
+        self.__complete = complete
         
     def __repr__(self) -> str:
         class_name = self.__class__.__name__
@@ -97,4 +149,105 @@ class CheckResult:
             for dynamic type that use function context
             Defaults to `None`
         """
-        return self.__context
\ No newline at end of file
+        return self.__context
+    
+    @property
+    def strategy(self) -> Any:
+        """
+        ### Property
+        `strategy`: `Strategy`\n
+            The strategy applied to inspect the collections,
+            `None` when every item is inspected
+        """
+        return self.__strategy
+    
+    @property
+    def inspected(self) -> int | None:
+        """
+        ### Property
+        `inspected`: `int`\n
+            The number of items inspected when a strategy is applied.
+            Items checked from the typecode of a buffer are not counted
+        """
+        return self.__inspected
+    
+    @property
+    def complete(self) -> bool:
+        """
+        ### Property
+        `complete`: `bool`\n
+            Whether or not every item was inspected. A successful check
+            that is not complete only proves the inspected items
+        """
+        return self.__complete
+
+class BatchResult:
+    """
+    This object is returned by the `typecheck_many` function. It contains
+    the indices of the values that failed the check, their exceptions and
+    the processed values. If this object is used in an `if` statement,
+    it will be `True` when every value passed the check.
+    """
+    __slots__ = ('__failures', '__exceptions', '__values')
+    
+    def __init__(
+        self,
+        failures: array,
+        exceptions: list[BaseException | None],
+        values: list
+    ):
+        """
+        This object is returned by the `typecheck_many` function.
+        Should not be instanciated directly.
+        
+        ### Arguments
+        * `failures`: `array`\n
+            The indices of the values that failed the check, in order
+        * `exceptions`: `list[BaseException | None]`\n
+            The exception of each failure, in the order of `failures`
+        * `values`: `list`\n
+            The processed values, in the order of the checked values
+        
+        ### Return
+        * type `NoneType`: Returns `None` as it is the constructor
+        """
+        self.__failures = failures
+        self.__exceptions = exceptions
+        self.__values = values
+        
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"<{class_name}: {len(self.__failures)}/{len(self.__values)} failed>"
+    
+    def __bool__(self) -> bool:
+        return not self.__failures
+    
+    def __len__(self) -> int:
+        return len(self.__values)
+    
+    @property
+    def failures(self) -> array:
+        """
+        ### Property
+        `failures`: `array`\n
+            The indices of the values that failed the check, in order
+        """
+        return self.__failures
+    
+    @property
+    def exceptions(self) -> list[BaseException | None]:
+        """
+        ### Property
+        `exceptions`: `list[BaseException | None]`\n
+            The exception of each failure, in the order of `failures`
+        """
+        return self.__exceptions
+    
+    @property
+    def values(self) -> list:
+        """
+        ### Property
+        `values`: `list`\n
+            The processed values, in the order of the checked values
+        """
+        return self.__values
\ No newline at end of file
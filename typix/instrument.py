@@ -0,0 +1,564 @@
+from typing import Any, Callable, Iterator
+from types import FunctionType
+from contextlib import contextmanager
+from inspect import iscoroutinefunction
+from threading import Lock
+from time import perf_counter
+from weakref import WeakSet
+
+from .context import failed_arguments
+
+# Type Alias for the functions receiving the exported statistics
+Hook = Callable[[dict], None]
+
+# Returned instead of calling a function whose arguments failed while the errors are collected
+SKIPPED = object()
+
+class Counters:
+    """
+    The counters of the processings of an argument, of a dynamic type
+    or of the checks of a type.
+    Should not be instanciated directly.
+    """
+    __slots__ = ('calls', 'time', 'conversions', 'errors', 'fatal')
+
+    def __init__(self):
+        """
+        The counters of the processings of an argument, of a dynamic type
+        or of the checks of a type.
+        Should not be instanciated directly.
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.calls = 0
+        self.time = 0.0
+        self.conversions = 0
+        self.errors = 0
+        self.fatal = 0
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"<{class_name}: {self.calls} calls>"
+
+    def add(self, duration: float, converted: bool, error: bool, fatal: bool) -> None:
+        """
+        Counts a processing.
+
+        ### Arguments
+        * `duration`: `float`\n
+            The duration of the processing in seconds
+        * `converted`: `bool`\n
+            Whether or not the value was replaced
+        * `error`: `bool`\n
+            Whether or not a non-fatal error was returned
+        * `fatal`: `bool`\n
+            Whether or not an exception was raised
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        self.calls += 1
+        self.time += duration
+        self.conversions += converted
+        self.errors += error
+        self.fatal += fatal
+
+    def as_dict(self) -> dict:
+        """
+        Exports the counters.
+
+        ### Return
+        * type `dict`: The counters by name, the time is in seconds
+        """
+        return {
+            'calls': self.calls,
+            'time': self.time,
+            'conversions': self.conversions,
+            'errors': self.errors,
+            'fatal': self.fatal
+        }
+
+class FunctionStats:
+    """
+    The statistics of a function decorated with `processor`.
+    Should not be instanciated directly.
+    """
+    __slots__ = ('calls', 'function_time', 'arguments')
+
+    def __init__(self):
+        """
+        The statistics of a function decorated with `processor`.
+        Should not be instanciated directly.
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.calls = 0
+        self.function_time = 0.0
+        self.arguments: dict[str, Counters] = {}
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"<{class_name}: {self.calls} calls>"
+
+    @property
+    def processing_time(self) -> float:
+        """
+        ### Property
+        `processing_time`: `float`\n
+            The time spent processing the arguments and the return value in seconds
+        """
+        return sum(counters.time for counters in self.arguments.values())
+
+    def as_dict(self) -> dict:
+        """
+        Exports the statistics.
+
+        ### Return
+        * type `dict`: The statistics by name, the times are in seconds
+        """
+        return {
+            'calls': self.calls,
+            'function_time': self.function_time,
+            'processing_time': self.processing_time,
+            'arguments': {argument: counters.as_dict() for argument, counters in self.arguments.items()}
+        }
+
+class Profiler:
+    """
+    Records how much time the dynamic types add to the decorated functions
+    and to the checks. Disabled by default: a disabled profiler costs a
+    single flag test and never reads the clock.
+    Should not be instanciated directly, use the `profiler` instance instead.
+    """
+    def __init__(self):
+        """
+        Records how much time the dynamic types add to the decorated functions.
+        Should not be instanciated directly.
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.enabled = False
+        self.collecting = 0
+        self.__lock = Lock()
+        self.__functions: dict[FunctionType, FunctionStats] = {}
+        self.__types: dict[str, Counters] = {}
+        self.__checks: dict[str, Counters] = {}
+        self.__hooks: list[Hook] = []
+        self.__wrappers = WeakSet()
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"<{class_name}: {'enabled' if self.enabled else 'disabled'}>"
+
+    def enable(self) -> None:
+        """
+        Starts recording.
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        self.enabled = True
+        self._rebind()
+
+    def disable(self) -> None:
+        """
+        Stops recording, the statistics are kept.
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        self.enabled = False
+        self._rebind()
+
+    def reset(self) -> None:
+        """
+        Drops the recorded statistics.
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        with self.__lock:
+            self.__functions.clear()
+            self.__types.clear()
+            self.__checks.clear()
+
+    def stats(self) -> dict:
+        """
+        Exports a snapshot of the recorded statistics. The functions
+        are named after their module and qualified name, the dynamic
+        types after their class and the checks after their type.
+
+        ### Return
+        * type `dict`: The statistics of the `'functions'`, of the dynamic
+        `'types'` and of the `'checks'` done by `typecheck`
+        """
+        with self.__lock:
+            return {
+                'functions': {
+                    f"{func.__module__}.{func.__qualname__}": stats.as_dict()
+                    for func, stats in self.__functions.items()
+                },
+                'types': {name: counters.as_dict() for name, counters in self.__types.items()},
+                'checks': {name: counters.as_dict() for name, counters in self.__checks.items()}
+            }
+
+    def add_hook(self, hook: Hook) -> None:
+        """
+        Registers a function receiving the statistics on each export,
+        for example to send them to a metrics system.
+
+        ### Arguments
+        * `hook`: `Callable[[dict], None]`\n
+            The function receiving the snapshot of `stats`
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        self.__hooks.append(hook)
+
+    def remove_hook(self, hook: Hook) -> None:
+        """
+        Unregisters a function added by `add_hook`.
+
+        ### Arguments
+        * `hook`: `Callable[[dict], None]`\n
+            The registered function
+
+        ### Return
+        * type `NoneType`: Returns `None`
+
+        ### Raises
+        * `ValueError`\n
+            When the function is not registered
+        """
+        self.__hooks.remove(hook)
+
+    def export(self) -> dict:
+        """
+        Sends a snapshot of the statistics to the registered hooks.
+
+        ### Return
+        * type `dict`: The exported snapshot
+        """
+        snapshot = self.stats()
+        for hook in self.__hooks:
+            hook(snapshot)
+        return snapshot
+
+    def register(self, wrapper: FunctionType) -> None:
+        """
+        Registers a generated wrapper, so that the call of its function
+        is timed while the profiler is enabled. The wrapper calls the
+        function through its `_typix_call` global.
+
+        ### Arguments
+        * `wrapper`: `function`\n
+            A wrapper built by `generate_wrapper`
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        self.__wrappers.add(wrapper)
+
+    def _collect(self, active: bool) -> None:
+        """
+        Counts the blocks collecting the errors, so that the registered
+        generated wrappers check the failed arguments only while any is active.
+
+        ### Arguments
+        * `active`: `bool`\n
+            Whether a block starts or ends
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        with self.__lock:
+            self.collecting += 1 if active else -1
+            changed = self.collecting == (1 if active else 0)
+        if changed:
+            self._rebind()
+
+    def _rebind(self) -> None:
+        """
+        Swaps the function called by the registered generated wrappers,
+        so that they do not test any flag when the profiler is disabled
+        and no errors are collected.
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        for wrapper in list(self.__wrappers):
+            wrapper.__globals__['_typix_call'] = self.caller(wrapper.__wrapped__)
+
+    def caller(self, func: FunctionType) -> FunctionType:
+        """
+        Gets the function a generated wrapper must call.
+
+        ### Arguments
+        * `func`: `function`\n
+            The wrapped function
+
+        ### Return
+        * type `function`: The function itself, or a function timing
+        its calls when the profiler is enabled and returning `SKIPPED`
+        instead of calling it when arguments failed while the errors
+        are collected
+        """
+        if not (self.enabled or self.collecting):
+            return func
+
+        if iscoroutinefunction(func):
+            async def timed_async(*args, **kwargs) -> Any:
+                if self.collecting and failed_arguments():
+                    return SKIPPED
+                if self.enabled:
+                    return await self.call_async(func, args, kwargs)
+                return await func(*args, **kwargs)
+            return timed_async
+
+        def timed(*args, **kwargs) -> Any:
+            if self.collecting and failed_arguments():
+                return SKIPPED
+            if self.enabled:
+                return self.call(func, args, kwargs)
+            return func(*args, **kwargs)
+        return timed
+
+    def _function(self, func: FunctionType) -> FunctionStats:
+        """
+        Gets the statistics of a function, must be called with the lock.
+
+        ### Arguments
+        * `func`: `function`\n
+            The decorated function
+
+        ### Return
+        * type `FunctionStats`: The statistics of the function
+        """
+        stats = self.__functions.get(func)
+        if stats is None:
+            stats = self.__functions[func] = FunctionStats()
+        return stats
+
+    def _record_call(self, func: FunctionType, duration: float) -> None:
+        """
+        Counts a call of a decorated function.
+
+        ### Arguments
+        * `func`: `function`\n
+            The decorated function
+        * `duration`: `float`\n
+            The time spent in the function in seconds
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        with self.__lock:
+            stats = self._function(func)
+            stats.calls += 1
+            stats.function_time += duration
+
+    def call(self, func: FunctionType, args: tuple | list, kwargs: dict) -> Any:
+        """
+        Calls a decorated function and times the call.
+
+        ### Arguments
+        * `func`: `function`\n
+            The decorated function
+        * `args`: `tuple | list`\n
+            The processed positional arguments
+        * `kwargs`: `dict`\n
+            The processed keyword arguments
+
+        ### Return
+        * type `Any`: The return value of the function
+        """
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._record_call(func, perf_counter() - start)
+
+    async def call_async(self, func: FunctionType, args: tuple | list, kwargs: dict) -> Any:
+        """
+        Awaits a decorated coroutine function and times the call.
+
+        ### Arguments
+        * `func`: `function`\n
+            The decorated coroutine function
+        * `args`: `tuple | list`\n
+            The processed positional arguments
+        * `kwargs`: `dict`\n
+            The processed keyword arguments
+
+        ### Return
+        * type `Any`: The awaited return value of the function
+        """
+        start = perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            self._record_call(func, perf_counter() - start)
+
+    def _record_process(self, typix: Any, frame: Any, duration: float, result: Any, fatal: bool) -> None:
+        """
+        Counts a processing by a dynamic type, for the dynamic type and
+        for the argument when it is the outermost processing of the argument.
+
+        ### Arguments
+        * `typix`: `Typix`\n
+            The dynamic type
+        * `frame`: `Frame`\n
+            The processed frame
+        * `duration`: `float`\n
+            The duration of the processing in seconds
+        * `result`: `Any`\n
+            The new value
+        * `fatal`: `bool`\n
+            Whether or not an exception was raised
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        error = frame.fail is not None and not fatal
+        converted = not (fatal or error) and result is not frame.value
+        parent = frame.parent
+        outermost = frame.func is not None and (
+            parent is None or parent.func is not frame.func or parent.arg != frame.arg
+        )
+
+        with self.__lock:
+            name = typix.__class__.__qualname__
+            counters = self.__types.get(name)
+            if counters is None:
+                counters = self.__types[name] = Counters()
+            counters.add(duration, converted, error, fatal)
+
+            if outermost:
+                arguments = self._function(frame.func).arguments
+                counters = arguments.get(frame.arg)
+                if counters is None:
+                    counters = arguments[frame.arg] = Counters()
+                counters.add(duration, converted, error, fatal)
+
+    def process(self, typix: Any, frame: Any) -> Any:
+        """
+        Processes the value of a frame and times the processing.
+        Must be called by `Typix._run` once the frame is current.
+
+        ### Arguments
+        * `typix`: `Typix`\n
+            The dynamic type
+        * `frame`: `Frame`\n
+            The processed frame
+
+        ### Return
+        * type `Any`: The new value
+        """
+        start = perf_counter()
+        try:
+            result = typix.process(*typix.args)
+        except BaseException:
+            self._record_process(typix, frame, perf_counter() - start, None, True)
+            raise
+        self._record_process(typix, frame, perf_counter() - start, result, False)
+        return result
+
+    async def process_async(self, typix: Any, frame: Any) -> Any:
+        """
+        Processes the value of a frame, awaits the result if the dynamic
+        type is asynchronous and times the processing.
+        Must be called by `Typix._run_async` once the frame is current.
+
+        ### Arguments
+        * `typix`: `Typix`\n
+            The dynamic type
+        * `frame`: `Frame`\n
+            The processed frame
+
+        ### Return
+        * type `Any`: The new value
+        """
+        start = perf_counter()
+        try:
+            result = typix.process(*typix.args)
+            if typix.asynchronous:
+                result = await result
+        except BaseException:
+            self._record_process(typix, frame, perf_counter() - start, None, True)
+            raise
+        self._record_process(typix, frame, perf_counter() - start, result, False)
+        return result
+
+    def check(self, check: Callable, name: str, value: Any, context: Any, strategy: Any) -> Any:
+        """
+        Runs a compiled checker and times the check.
+
+        ### Arguments
+        * `check`: `Callable[[Any, Context, Strategy], CheckResult]`\n
+            The compiled checker
+        * `name`: `str`\n
+            The display of the checked type
+        * `value`: `Any`\n
+            The value to check
+        * `context`: `Context`\n
+            The context of the check
+        * `strategy`: `Strategy`\n
+            The strategy of the check
+
+        ### Return
+        * type `CheckResult`: The result of the check
+        """
+        start = perf_counter()
+        result = None
+        try:
+            result = check(value, context, strategy)
+            return result
+        finally:
+            duration = perf_counter() - start
+            with self.__lock:
+                counters = self.__checks.get(name)
+                if counters is None:
+                    counters = self.__checks[name] = Counters()
+                counters.add(
+                    duration,
+                    result is not None and result.state and result.value is not value,
+                    result is not None and not result.state,
+                    result is None
+                )
+
+# The profiler of the module
+profiler = Profiler()
+
+@contextmanager
+def profiling(export: Hook = None, reset: bool = True) -> Iterator[Profiler]:
+    """
+    Enables the profiler in a `with` block. The statistics are sent
+    to the registered hooks when the block exits.
+
+    ### Arguments
+    * `export`: `Optional[Callable[[dict], None]]`\n
+        A function receiving the statistics when the block exits.
+        Defaults to `None`
+    * `reset`: `Optional[bool]`\n
+        Whether or not to drop the statistics recorded before the block.
+        Defaults to `True`
+
+    ### Return
+    * type `Iterator[Profiler]`: The profiler
+    """
+    enabled = profiler.enabled
+    if reset:
+        profiler.reset()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        if not enabled:
+            profiler.disable()
+        snapshot = profiler.export()
+        if export is not None:
+            export(snapshot)
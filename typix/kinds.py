@@ -0,0 +1,134 @@
+from typing import Any, Iterable, Union, _SpecialForm, get_origin, is_typeddict
+from types import GenericAlias, UnionType
+from dataclasses import is_dataclass
+from inspect import isclass
+from enum import IntEnum
+from weakref import ref
+
+from .main import Typix
+
+# Type Alias for the `typing._GenericAlias` protected class
+_TypingGenericAlias = type(Iterable[int])
+# Type Alias for the `typing` special classes (ex. Iterable)
+_TypingType = type(Iterable)
+
+# The maximum number of objects that cannot be weakly referenced kept in the cache
+CACHE_SIZE = 1024
+
+class TypeKind(IntEnum):
+    """
+    The kind of a type expression, used to dispatch on the type
+    without testing it again on each check. The kinds are integers
+    so that they are hashed as fast as integers in the sets of kinds.
+    """
+    CLASS = 1
+    RECORD = 2
+    ALIAS = 3
+    UNION = 4
+    TUPLE = 5
+    TYPIX = 6
+    TYPIX_CLASS = 7
+    SPECIAL = 8
+    OTHER = 9
+
+# The kinds of the types checked by a checker tree
+STRUCTURAL_KINDS = frozenset((TypeKind.RECORD, TypeKind.ALIAS, TypeKind.UNION))
+
+# The kinds of the dynamic types and of their classes
+TYPIX_KINDS = frozenset((TypeKind.TYPIX, TypeKind.TYPIX_CLASS))
+
+# The kind of each classified object by identity. Objects that can be
+# weakly referenced are dropped when they are collected, the others are
+# kept alive so that their identity cannot be reused
+_kinds: dict[int, TypeKind] = {}
+_references: dict[int, Any] = {}
+
+def _classify(type_: Any) -> TypeKind:
+    """
+    Classifies a type expression.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type expression to classify
+
+    ### Return
+    * type `TypeKind`: The kind of the type expression
+    """
+    if isinstance(type_, tuple):
+        return TypeKind.TUPLE
+    if isinstance(type_, Typix):
+        return TypeKind.TYPIX
+    if isinstance(type_, UnionType) or get_origin(type_) is Union:
+        return TypeKind.UNION
+    if isinstance(type_, (GenericAlias, _TypingGenericAlias)):
+        return TypeKind.ALIAS
+    if isclass(type_):
+        if issubclass(type_, Typix):
+            return TypeKind.TYPIX_CLASS
+        if is_typeddict(type_) or is_dataclass(type_):
+            return TypeKind.RECORD
+        return TypeKind.CLASS
+    if isinstance(type_, (_SpecialForm, _TypingType)):
+        return TypeKind.SPECIAL
+    return TypeKind.OTHER
+
+def _forget(key: int) -> None:
+    """
+    Drops the kind of a collected object.
+
+    ### Arguments
+    * `key`: `int`\n
+        The identity of the object
+
+    ### Return
+    * type `NoneType`: Returns `None`
+    """
+    _kinds.pop(key, None)
+    _references.pop(key, None)
+
+def classify(type_: Any) -> TypeKind:
+    """
+    Gets the kind of a type expression. The kind is computed once per
+    object and cached by identity.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type expression to classify
+
+    ### Return
+    * type `TypeKind`: The kind of the type expression
+
+    .. doctest
+        >>> classify(int)
+        <TypeKind.CLASS: 1>
+        >>> classify(list[int])
+        <TypeKind.ALIAS: 3>
+        >>> classify(int | str)
+        <TypeKind.UNION: 4>
+    """
+    key = id(type_)
+    kind = _kinds.get(key)
+    if kind is not None:
+        return kind
+
+    kind = _classify(type_)
+    try:
+        reference = ref(type_, lambda _, key=key: _forget(key))
+    except TypeError:
+        # Bounded, the oldest strong references are dropped first
+        if len(_references) >= CACHE_SIZE:
+            _forget(next(iter(_references)))
+        reference = type_
+    _references[key] = reference
+    _kinds[key] = kind
+    return kind
+
+def clear_kinds() -> None:
+    """
+    Empties the cache of the kinds.
+
+    ### Return
+    * type `NoneType`: Returns `None`
+    """
+    _kinds.clear()
+    _references.clear()
@@ -1,13 +1,25 @@
 from typing import Optional, Any
 from types import FunctionType
+from inspect import iscoroutinefunction
 
 from .error import TypixError
-from .context import Context
+from .context import Context, Frame, _current_frame, _current_report, current_frame, shared_context
+from .instrument import profiler
 
 class Typix:
     """
     All dynamic types should inherit from this class.
     """
+    # Whether or not the `process` method is a coroutine function
+    _asynchronous = False
+    
+    # Whether or not the processing changes the values, so that it cannot be skipped
+    _required = False
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._asynchronous = iscoroutinefunction(cls.process)
+    
     def __init__(self, *args) -> None:
         """
         A dynamic type instance.\n
@@ -24,21 +36,15 @@ class Typix:
         # Arguments
         self._args = args
         
-        # Context
-        self._arg = None
-        self._value = None
-        self._func = None
-        self._function_context = True
-        
-        # Store
-        self._fail = None
-    
     def process(self, *args):
         """
         The method called when an argument needs to be processed after being annotated with this
         dynamic type. This function is meant to be overloaded to implement a specific logic
         to this dynamic type. The default behavior of the method is to return the argument value
         without modifying or raising anything.
+        The method can be overloaded with a coroutine function: the dynamic type
+        is then asynchronous and can only annotate coroutine functions and
+        asynchronous generators.
         
         ### Arguments
         * `*args`: `tuple`\n
@@ -50,13 +56,72 @@ class Typix:
         ### Raises
         * `Any`: Whatever Exception the method raised
         """
-        return self._value
+        return self.value
+    
+    def _run(self, frame: Frame) -> Any:
+        """
+        Processes the value of a frame. The frame is the current frame
+        of the thread or asyncio task until the processing ends.
+        
+        ### Arguments
+        * `frame`: `Frame`\n
+            The frame to process
+        
+        ### Return
+        * type `Any`: The new value
+        
+        ### Raises
+        * `Any`: Whatever Exception the `process` method raised
+        """
+        if self._asynchronous:
+            raise TypixError(
+                f"'{self.__class__.__name__}' is asynchronous and cannot be processed synchronously"
+            )
+        
+        frame.parent = _current_frame.get()
+        token = _current_frame.set(frame)
+        try:
+            if profiler.enabled:
+                return profiler.process(self, frame)
+            return self.process(*self._args)
+        finally:
+            _current_frame.reset(token)
+    
+    async def _run_async(self, frame: Frame) -> Any:
+        """
+        Processes the value of a frame and awaits the result of
+        the `process` method if it is asynchronous. The frame is the
+        current frame of the asyncio task until the processing ends.
+        
+        ### Arguments
+        * `frame`: `Frame`\n
+            The frame to process
+        
+        ### Return
+        * type `Any`: The new value
+        
+        ### Raises
+        * `Any`: Whatever Exception the `process` method raised
+        """
+        frame.parent = _current_frame.get()
+        token = _current_frame.set(frame)
+        try:
+            if profiler.enabled:
+                return await profiler.process_async(self, frame)
+            result = self.process(*self._args)
+            if self._asynchronous:
+                result = await result
+            return result
+        finally:
+            _current_frame.reset(token)
     
     def error(self, exception: BaseException, fatal: Optional[bool] = False) -> Any:
         """
         Indicates an Exception in the typing procedure. The Exception won't raise
         unless it is fatal. A non-fatal error can also be raised by a parent type
         like the `Strict` dynamic type.
+        While the errors are collected with `collect_errors`, a fatal error does
+        not raise either: it is added to the report when it fails an argument.
         
         ### Arguments
         * `exception`: `BaseException`\n
@@ -76,10 +141,50 @@ class Typix:
         if isinstance(exception, str):
             exception = TypixError(exception)
         
-        self._fail = exception
-        if fatal:
-            raise self._fail
-        return self._value
+        frame = current_frame(self)
+        if frame is None:
+            if fatal:
+                raise exception
+            return None
+        
+        frame.fail = exception
+        if not fatal:
+            return frame.value
+
+        report = _current_report.get()
+        if report is None:
+            raise exception
+        # The nested processings are reported by the outermost one
+        if frame.function_context and frame.parent is None:
+            report._add(frame, self, exception)
+        return frame.value
+    
+    def _fatal(self, error_type: type, *args: Any) -> Any:
+        """
+        Indicates a fatal error from the type of its exception, see `error`.
+        While the errors are collected with `collect_errors`, the exception
+        of a failed argument is only built when the report reads it.
+        
+        ### Arguments
+        * `error_type`: `type`\n
+            The type of the exception to indicate
+        * `*args`: `Any`\n
+            The arguments to build the exception with
+        
+        ### Return
+        * type `Any`: The default value, unless an Exception is raised
+        
+        ### Raises
+        * `Any`\n
+            The built Exception if the errors are not collected
+        """
+        frame = current_frame(self)
+        if frame is not None and frame.function_context and frame.parent is None:
+            report = _current_report.get()
+            if report is not None:
+                frame.fail = report._defer(frame, self, error_type, args)
+                return frame.value
+        return self.error(error_type(*args), fatal=True)
         
     @property
     def args(self) -> tuple:
@@ -90,6 +195,28 @@ class Typix:
         """
         return self._args
     
+    @property
+    def asynchronous(self) -> bool:
+        """
+        ### Property
+        `asynchronous`: `bool`\n
+            Whether or not the `process` method is a coroutine function
+        """
+        return self._asynchronous
+    
+    @property
+    def required(self) -> bool:
+        """
+        ### Property
+        `required`: `bool`\n
+            Whether or not the processing changes the values, like a conversion,
+            so that it is never skipped by the sampling modes, see `set_mode`.
+            A dynamic type having a required dynamic type as argument is required too
+        """
+        return self._required or any(
+            isinstance(argument, Typix) and argument.required for argument in self._args
+        )
+    
     @property
     def argument(self) -> str:
         """
@@ -97,7 +224,8 @@ class Typix:
         `argument`: `str`\n
             The current argument name in a function context
         """
-        return self._arg
+        frame = current_frame(self)
+        return None if frame is None else frame.arg
     
     @property
     def value(self) -> Any:
@@ -106,7 +234,8 @@ class Typix:
         `value`: `Any`\n
             The value returned by the dynamic type
         """
-        return self._value
+        frame = current_frame(self)
+        return None if frame is None else frame.value
     
     @property
     def func(self) -> FunctionType | None:
@@ -115,7 +244,8 @@ class Typix:
         `func`: `function`\n
             The current function in a function context
         """
-        return self._func
+        frame = current_frame(self)
+        return None if frame is None else frame.func
     
     @property
     def fail(self) -> BaseException | None:
@@ -124,7 +254,8 @@ class Typix:
         `fail`: `BaseException`\n
             The error returned by the dynamic type
         """
-        return self._fail
+        frame = current_frame(self)
+        return None if frame is None else frame._error()
     
     @property
     def function_context(self) -> bool | None:
@@ -136,7 +267,8 @@ class Typix:
             a function context. Otherwise, in the `typecheck` function for example
             it won't unless a context object is passed from a child.
         """
-        return self._function_context
+        frame = current_frame(self)
+        return None if frame is None else frame.function_context
     
     @property
     def context(self) -> Context:
@@ -146,4 +278,49 @@ class Typix:
             A 'bundle' object containing data about the current target argument. It can
             be passed from child to parent to relay errors for example.
         """
-        return Context(self._arg, self._func)
\ No newline at end of file
+        frame = current_frame(self)
+        if frame is None:
+            return shared_context()
+        return shared_context(frame.arg, frame.func)
+    
+    # Read-only aliases of the properties, for the dynamic types written when
+    # the state of the processing was stored in the instance
+    @property
+    def _value(self) -> Any:
+        """
+        ### Property
+        `_value`: `Any`\n
+            The value returned by the dynamic type, see `value`
+        """
+        frame = current_frame(self)
+        return None if frame is None else frame.value
+    
+    @property
+    def _arg(self) -> str | None:
+        """
+        ### Property
+        `_arg`: `str`\n
+            The current argument name in a function context, see `argument`
+        """
+        frame = current_frame(self)
+        return None if frame is None else frame.arg
+    
+    @property
+    def _func(self) -> FunctionType | None:
+        """
+        ### Property
+        `_func`: `function`\n
+            The current function in a function context, see `func`
+        """
+        frame = current_frame(self)
+        return None if frame is None else frame.func
+    
+    @property
+    def _fail(self) -> BaseException | None:
+        """
+        ### Property
+        `_fail`: `BaseException`\n
+            The error returned by the dynamic type, see `fail`
+        """
+        frame = current_frame(self)
+        return None if frame is None else frame._error()
\ No newline at end of file
@@ -0,0 +1,285 @@
+from typing import Any, Callable
+from collections import OrderedDict
+from enum import Enum
+from fractions import Fraction
+from functools import wraps
+from inspect import iscoroutinefunction
+from math import copysign
+from threading import Lock
+from time import monotonic
+from uuid import UUID
+
+# The types whose constructor returns the same immutable value for the same input
+PURE_TYPES = frozenset((bool, int, float, complex, str, bytes, Fraction, UUID, tuple, frozenset))
+
+# The types of the inputs whose equal values are identical, used as is in the keys
+EXACT_INPUTS = frozenset((bool, int, str, bytes, type(None)))
+
+# Marker of a value missing from the cache
+_MISSING = object()
+
+def _input_key(value: Any) -> Any:
+    """
+    Builds the part of a key identifying an input. Equal inputs can give
+    different outputs, like `0.0` and `-0.0` or `Decimal('1.0')` and
+    `Decimal('1.00')` converted to `str`, so only the inputs that equality
+    identifies exactly are keyed: the floats are keyed with their sign,
+    and the items of the tuples with their type.
+
+    ### Arguments
+    * `value`: `Any`\n
+        The input
+
+    ### Return
+    * type `Any`: The hashable key, or a marker when the input cannot be memoized
+    """
+    value_type = type(value)
+    if value_type in EXACT_INPUTS:
+        return value
+    if value_type is float:
+        return value, copysign(1.0, value)
+    if value_type is tuple:
+        keys = []
+        for item in value:
+            key = _input_key(item)
+            if key is _MISSING:
+                return _MISSING
+            keys.append((type(item), key))
+        return tuple(keys)
+    return _MISSING
+
+def is_pure(type_: Any) -> bool:
+    """
+    Checks whether the conversions to a type can be memoized: the
+    conversion of an input must always give the same immutable value.
+    A class can declare it with a truthy `__typix_pure__` attribute.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type to convert to
+
+    ### Return
+    * type `bool`: Whether or not the conversions to the type are pure
+    """
+    try:
+        if type_ in PURE_TYPES:
+            return True
+    except TypeError:
+        return False
+    if getattr(type_, '__typix_pure__', False):
+        return True
+    return isinstance(type_, type) and issubclass(type_, Enum)
+
+class ConversionCache:
+    """
+    A bounded cache of the values returned by dynamic types, keyed by the
+    dynamic type class, its arguments and the type and value of the input.
+    The least recently used entries are evicted first, and the entries
+    expire after `ttl` seconds if set. Only the inputs that equality
+    identifies exactly are cached: booleans, integers, strings, bytes,
+    `None`, floats keyed with their sign and tuples of those. The other
+    inputs bypass the cache, and the results of the processings returning
+    an error are not stored.
+    """
+    def __init__(self, maxsize: int = 1024, ttl: float = None):
+        """
+        A bounded cache of the values returned by dynamic types.
+
+        ### Arguments
+        * `maxsize`: `Optional[int]`\n
+            The maximum number of entries.
+            Defaults to `1024`
+        * `ttl`: `Optional[float]`\n
+            The lifetime of an entry in seconds.
+            Defaults to `None`: the entries do not expire
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.__maxsize = maxsize
+        self.__ttl = ttl
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"<{class_name}: {len(self.__entries)}/{self.__maxsize} entries>"
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __getstate__(self) -> dict:
+        # A copy sent to another process starts empty
+        return {'maxsize': self.__maxsize, 'ttl': self.__ttl}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state['maxsize'], state['ttl'])
+
+    @property
+    def maxsize(self) -> int:
+        """
+        ### Property
+        `maxsize`: `int`\n
+            The maximum number of entries
+        """
+        return self.__maxsize
+
+    @property
+    def ttl(self) -> float | None:
+        """
+        ### Property
+        `ttl`: `float`\n
+            The lifetime of an entry in seconds if any
+        """
+        return self.__ttl
+
+    def stats(self) -> dict:
+        """
+        Exports the statistics of the cache.
+
+        ### Return
+        * type `dict`: The hits, the misses, the bypassed
+        inputs and the size of the cache
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'bypasses': self.bypasses,
+            'size': len(self.__entries),
+            'maxsize': self.__maxsize
+        }
+
+    def clear(self) -> None:
+        """
+        Drops every entry and resets the statistics.
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = self.misses = self.bypasses = 0
+
+    def get(self, key: Any) -> Any:
+        """
+        Gets the value of a key and marks it as recently used.
+
+        ### Arguments
+        * `key`: `Any`\n
+            The hashable key
+
+        ### Return
+        * type `Any`: The value, or a marker of missing value
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return _MISSING
+            expires, value = entry
+            if expires is not None and monotonic() >= expires:
+                del self.__entries[key]
+                self.misses += 1
+                return _MISSING
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Stores the value of a key, evicting the least recently used entry
+        when the cache is full.
+
+        ### Arguments
+        * `key`: `Any`\n
+            The hashable key
+        * `value`: `Any`\n
+            The value
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        expires = None if self.__ttl is None else monotonic() + self.__ttl
+        with self.__lock:
+            self.__entries[key] = (expires, value)
+            self.__entries.move_to_end(key)
+            if len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    def process(self, typix: Any, process: Callable, args: tuple) -> Any:
+        """
+        Processes the current value of a dynamic type through the cache.
+
+        ### Arguments
+        * `typix`: `Typix`\n
+            The dynamic type being processed
+        * `process`: `Callable`\n
+            The processing function, called with the dynamic type and the arguments
+        * `args`: `tuple`\n
+            The arguments of the dynamic type
+
+        ### Return
+        * type `Any`: The new value
+        """
+        value = typix.value
+        value_key = _input_key(value)
+        key = (typix.__class__, args, type(value), value_key)
+        try:
+            hash(key)
+        except TypeError:
+            value_key = _MISSING
+        if value_key is _MISSING:
+            with self.__lock:
+                self.bypasses += 1
+            return process(typix, *args)
+
+        result = self.get(key)
+        if result is not _MISSING:
+            return result
+
+        result = process(typix, *args)
+        if typix.fail is None:
+            self.put(key, result)
+        return result
+
+def memoize(cache: ConversionCache = None, maxsize: int = 1024, ttl: float = None) -> Callable:
+    """
+    A decorator memoizing the `process` method of a dynamic type. Must only
+    be used when the method always returns the same immutable value for the
+    same arguments and input value. The cache is available as the `cache`
+    attribute of the decorated method.
+
+    ### Arguments
+    * `cache`: `Optional[ConversionCache]`\n
+        The cache to use, can be shared by multiple dynamic types.
+        Defaults to `None`: a new cache is created
+    * `maxsize`: `Optional[int]`\n
+        The maximum number of entries of a new cache.
+        Defaults to `1024`
+    * `ttl`: `Optional[float]`\n
+        The lifetime of an entry of a new cache in seconds.
+        Defaults to `None`: the entries do not expire
+
+    ### Return
+    * type `function`: The decorator
+
+    ### Raises
+    * `TypeError`\n
+        When the decorated method is a coroutine function
+    """
+    store = cache if cache is not None else ConversionCache(maxsize, ttl)
+
+    def decorator(process: Callable) -> Callable:
+        if iscoroutinefunction(process):
+            raise TypeError(f"{process!r} is asynchronous and cannot be memoized")
+
+        @wraps(process)
+        def inner(self, *args) -> Any:
+            return store.process(self, process, args)
+
+        inner.cache = store
+        return inner
+    return decorator
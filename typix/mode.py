@@ -0,0 +1,294 @@
+from typing import Callable
+from types import FunctionType
+from itertools import count
+from threading import Lock
+from weakref import WeakSet
+
+from .codegen import gate_wrapper
+
+# Type Alias for the gates deciding whether a call is processed
+Gate = Callable[[], bool]
+
+class Mode:
+    """
+    Describes which calls of the functions decorated with `processor`
+    are processed. The calls that are not processed go straight to the
+    decorated function. The functions annotated with a required dynamic
+    type, like `Convert`, are always processed.
+    Should not be instanciated directly, use the class methods instead.
+    """
+    ALWAYS = 'always'
+    NEVER = 'never'
+    SAMPLE = 'sample'
+    FIRST = 'first'
+
+    __slots__ = ('__kind', '__calls')
+
+    def __init__(self, kind: str, calls: int = None):
+        """
+        Describes which calls of the decorated functions are processed.
+        Should not be instanciated directly, use the class methods instead.
+
+        ### Arguments
+        * `kind`: `str`\n
+            The kind of mode, one of `ALWAYS`, `NEVER`, `SAMPLE` and `FIRST`
+        * `calls`: `Optional[int]`\n
+            The period of the sampling, or the number of processed calls.
+            Defaults to `None`
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.__kind = kind
+        self.__calls = calls
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        if self.__calls is None:
+            return f"<{class_name}: {self.__kind}>"
+        return f"<{class_name}: {self.__kind}({self.__calls})>"
+
+    @classmethod
+    def always(cls) -> 'Mode':
+        """
+        Processes every call.
+
+        ### Return
+        * type `Mode`: The mode
+        """
+        return cls(cls.ALWAYS)
+
+    @classmethod
+    def never(cls) -> 'Mode':
+        """
+        Processes no call, the decorated functions are called directly.
+
+        ### Return
+        * type `Mode`: The mode
+        """
+        return cls(cls.NEVER)
+
+    @classmethod
+    def sample(cls, every: int) -> 'Mode':
+        """
+        Processes one call out of `every` calls of each function,
+        starting with the first one.
+
+        ### Arguments
+        * `every`: `int`\n
+            The period of the sampling
+
+        ### Return
+        * type `Mode`: The mode
+
+        ### Raises
+        * `ValueError`\n
+            When the period is not positive
+        """
+        if every < 1:
+            raise ValueError(f"The period of the sampling must be positive, got {every}")
+        return cls(cls.SAMPLE, every)
+
+    @classmethod
+    def first(cls, calls: int) -> 'Mode':
+        """
+        Processes the first calls of each function, then no call.
+
+        ### Arguments
+        * `calls`: `int`\n
+            The number of processed calls of each function
+
+        ### Return
+        * type `Mode`: The mode
+
+        ### Raises
+        * `ValueError`\n
+            When the number of calls is negative
+        """
+        if calls < 0:
+            raise ValueError(f"The number of processed calls cannot be negative, got {calls}")
+        return cls(cls.FIRST, calls)
+
+    @property
+    def kind(self) -> str:
+        """
+        ### Property
+        `kind`: `str`\n
+            The kind of mode, one of `ALWAYS`, `NEVER`, `SAMPLE` and `FIRST`
+        """
+        return self.__kind
+
+    @property
+    def calls(self) -> int | None:
+        """
+        ### Property
+        `calls`: `int`\n
+            The period of the sampling, or the number of processed calls
+        """
+        return self.__calls
+
+    def gate(self) -> Gate | None:
+        """
+        Builds the gate of a function, with its own counter of calls.
+        The counters are thread-safe.
+
+        ### Return
+        * type `Callable[[], bool]`: The function telling whether the current call
+        is processed, `None` when every call is processed
+        """
+        if self.__kind == Mode.ALWAYS:
+            return None
+        if self.__kind == Mode.NEVER:
+            return _never
+
+        calls = count()
+        if self.__kind == Mode.SAMPLE:
+            every = self.__calls
+            return lambda: next(calls) % every == 0
+        limit = self.__calls
+        return lambda: next(calls) < limit
+
+def _never() -> bool:
+    """
+    The gate of the functions that are never processed.
+
+    ### Return
+    * type `bool`: Returns `False`
+    """
+    return False
+
+# The global mode, the decorated functions and the lock of the mode changes
+_mode = Mode.always()
+_wrappers = WeakSet()
+_lock = Lock()
+
+def _apply_mode(wrapper: FunctionType) -> None:
+    """
+    Sets the gate of a decorated function from its own mode, or from the
+    global mode. Until its plan is compiled, a function has no gate: its
+    first call compiles the plan, then sets and tests its gate.
+    Must be called with the lock.
+
+    ### Arguments
+    * `wrapper`: `function`\n
+        The decorated function
+
+    ### Return
+    * type `NoneType`: Returns `None`
+    """
+    mode = wrapper.__typix_mode__ or _mode
+    plan = wrapper.__typix_plan__
+    gate = None
+    if mode.kind != Mode.ALWAYS and plan is not None and not plan.required:
+        gate = mode.gate()
+
+    if hasattr(wrapper, '__typix_source__'):
+        gate_wrapper(wrapper, gate, bypass=gate is _never)
+    else:
+        wrapper.__typix_gate__ = gate
+
+def register(wrapper: FunctionType, mode: Mode = None) -> None:
+    """
+    Registers a function decorated with `processor`, so that it follows
+    the global mode unless it has its own.
+
+    ### Arguments
+    * `wrapper`: `function`\n
+        The decorated function
+    * `mode`: `Optional[Mode]`\n
+        The mode of the function.
+        Defaults to `None`: the global mode is followed
+
+    ### Return
+    * type `NoneType`: Returns `None`
+    """
+    with _lock:
+        wrapper.__typix_mode__ = mode
+        wrapper.__typix_gate__ = None
+        _wrappers.add(wrapper)
+        if (mode or _mode).kind != Mode.ALWAYS:
+            _apply_mode(wrapper)
+
+def registered() -> list[FunctionType]:
+    """
+    Lists the functions decorated with `processor` that are still alive.
+
+    ### Return
+    * type `list[function]`: The decorated functions
+    """
+    with _lock:
+        return list(_wrappers)
+
+def reapply(wrapper: FunctionType) -> None:
+    """
+    Sets again the gate of a decorated function, once its plan changed.
+
+    ### Arguments
+    * `wrapper`: `function`\n
+        The decorated function
+
+    ### Return
+    * type `NoneType`: Returns `None`
+    """
+    with _lock:
+        _apply_mode(wrapper)
+
+def set_mode(mode: Mode | None, func: FunctionType = None) -> None:
+    """
+    Sets the global mode of the functions decorated with `processor`, or
+    the mode of a single function. The change is atomic: each call sees
+    either the previous or the new mode. In the `NEVER` mode, a decorated
+    function calls the function straight away. The functions annotated
+    with a required dynamic type, like `Convert`, are always processed.
+    The annotations are still resolved on the first call of each function,
+    whether it is processed or not.
+
+    ### Arguments
+    * `mode`: `Mode | None`\n
+        The mode, `None` to make a function follow the global mode again
+    * `func`: `Optional[function]`\n
+        The decorated function.
+        Defaults to `None`: the global mode is set
+
+    ### Return
+    * type `NoneType`: Returns `None`
+
+    ### Raises
+    * `TypeError`\n
+        When the function is not decorated with `processor`
+    * `ValueError`\n
+        When the global mode is set to `None`
+    """
+    global _mode
+
+    if func is not None and not hasattr(func, '__typix_mode__'):
+        raise TypeError(f"{func!r} is not decorated with 'processor'")
+    if func is None and mode is None:
+        raise ValueError("The global mode cannot be None")
+
+    with _lock:
+        if func is not None:
+            func.__typix_mode__ = mode
+            _apply_mode(func)
+            return
+
+        _mode = mode
+        for wrapper in list(_wrappers):
+            if wrapper.__typix_mode__ is None:
+                _apply_mode(wrapper)
+
+def get_mode(func: FunctionType = None) -> Mode:
+    """
+    Gets the global mode, or the mode followed by a decorated function.
+
+    ### Arguments
+    * `func`: `Optional[function]`\n
+        The decorated function.
+        Defaults to `None`: the global mode is returned
+
+    ### Return
+    * type `Mode`: The mode
+    """
+    if func is None:
+        return _mode
+    return func.__typix_mode__ or _mode
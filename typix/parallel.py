@@ -0,0 +1,199 @@
+from typing import Any, Iterable
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from os import cpu_count
+from pickle import dumps, PicklingError
+import sys
+
+from .error import BatchResult, TypixError
+from .strategy import Strategy
+from .context import _current_report
+from .instrument import profiler
+from .report import ErrorReport
+from .utils import typecheck_many, display_type
+
+# The number of chunks submitted per worker, so that the workers stay busy
+# when some chunks are slower to check than others
+CHUNKS_PER_WORKER = 4
+
+def _free_threaded() -> bool:
+    """
+    Checks whether the interpreter runs without the GIL, in which case
+    threads check the chunks in parallel without the cost of processes.
+
+    ### Return
+    * type `bool`: Whether or not the GIL is disabled
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+def _ensure_picklable(type_: Any, strategy: Strategy = None) -> None:
+    """
+    Checks that a type and a strategy can be sent to the worker processes.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type to send
+    * `strategy`: `Optional[Strategy]`\n
+        The strategy to send.
+        Defaults to `None`
+
+    ### Return
+    * type `NoneType`: Returns `None`
+
+    ### Raises
+    * `TypixError`\n
+        When the type or the strategy cannot be pickled
+    """
+    try:
+        dumps((type_, strategy))
+    except (PicklingError, AttributeError, TypeError) as exception:
+        raise TypixError(
+            f"'{display_type(type_)}' cannot be sent to the worker processes: {exception}"
+        ) from exception
+
+def _check_chunk(
+    values: list,
+    type_: Any,
+    vectorize: bool = False,
+    strategy: Strategy = None,
+    collect: bool = False
+) -> tuple[BatchResult, list | None]:
+    """
+    Checks a chunk of values in a worker. The type is compiled
+    once per worker and kept in the cache of `compile_check`.
+
+    ### Arguments
+    * `values`: `list`\n
+        The values of the chunk
+    * `type_`: `Any`\n
+        The type to check the values with
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists of numbers in bulk.
+        Defaults to `False`
+    * `strategy`: `Optional[Strategy]`\n
+        How much of the collections is inspected.
+        Defaults to `None`
+    * `collect`: `Optional[bool]`\n
+        Whether or not the caller collects the errors in a report.
+        Defaults to `False`
+
+    ### Return
+    * type `tuple[BatchResult, list[Failure] | None]`: The result of the chunk
+    and the failures collected by the worker, indexed from the start of the chunk
+    """
+    # A worker does not share the report of the caller: the chunk is
+    # collected in its own report, merged by the caller with global indices
+    report = ErrorReport() if collect else None
+    token = _current_report.set(report)
+    if collect:
+        profiler._collect(True)
+    try:
+        result = typecheck_many(values, type_, vectorize=vectorize, strategy=strategy)
+    finally:
+        _current_report.reset(token)
+        if collect:
+            profiler._collect(False)
+    return result, None if report is None else report.failures
+
+def typecheck_parallel(
+    values: Iterable,
+    type_: Any,
+    vectorize: bool = False,
+    strategy: Strategy = None,
+    workers: int = None,
+    chunksize: int = None,
+    executor: Executor = None
+) -> BatchResult:
+    """
+    Checks many values against the same type in parallel. The values are
+    split in chunks checked by a `ProcessPoolExecutor`, or by threads when
+    the interpreter is free-threaded. The failures keep their original
+    indices. The type, the strategy and the values are pickled: dynamic
+    types must be defined at the top level of a module.
+
+    ### Arguments
+    * `values`: `Iterable`\n
+        The values to check
+    * `type_`: `Any`\n
+        The type to check the values with
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists of numbers in bulk
+        as NumPy arrays, see `compile_alias`.
+        Defaults to `False`
+    * `strategy`: `Optional[Strategy]`\n
+        How much of the collections is inspected, see `typecheck`.
+        Defaults to `None`: every item is inspected
+    * `workers`: `Optional[int]`\n
+        The number of workers of the executor created by the function.
+        Defaults to `None`: the number of CPUs
+    * `chunksize`: `Optional[int]`\n
+        The number of values checked by a worker at once.
+        Defaults to `None`: a few chunks per worker
+    * `executor`: `Optional[Executor]`\n
+        An executor to submit the chunks to instead of creating one.
+        It is not shut down by the function.
+        Defaults to `None`
+
+    ### Return
+    * type `BatchResult`: An object containing the indices of the
+    failures, their exceptions and the processed values
+
+    ### Raises
+    * `TypixError`\n
+        When the type or the strategy cannot be pickled
+
+    .. doctest
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> from typix.report import collect_errors
+        >>> with ThreadPoolExecutor(2) as executor:
+        ...     with collect_errors(raise_errors=False) as report:
+        ...         result = typecheck_parallel([1, 'a', 2, 'b'], int, chunksize=2, executor=executor)
+        >>> list(result.failures)
+        [1, 3]
+        >>> print(report.render())
+        2 failures
+          [1]: expected 'int', got 'str'
+          [3]: expected 'int', got 'str'
+    """
+    values = list(values)
+    threaded = _free_threaded()
+    if not threaded:
+        _ensure_picklable(type_, strategy)
+
+    if workers is None:
+        workers = getattr(executor, '_max_workers', None) or cpu_count() or 1
+    if chunksize is None:
+        chunksize = -(-len(values) // (workers * CHUNKS_PER_WORKER)) or 1
+
+    # A single chunk is not worth the cost of the executor
+    if len(values) <= chunksize:
+        return typecheck_many(values, type_, vectorize=vectorize, strategy=strategy)
+
+    starts = range(0, len(values), chunksize)
+    pool = executor
+    if pool is None:
+        pool = ThreadPoolExecutor(workers) if threaded else ProcessPoolExecutor(workers)
+    report = _current_report.get()
+    collect = report is not None
+    try:
+        futures = [
+            pool.submit(_check_chunk, values[start:start + chunksize], type_, vectorize, strategy, collect)
+            for start in starts
+        ]
+
+        failures = array('q')
+        exceptions = []
+        new_values = []
+        for start, future in zip(starts, futures):
+            result, collected = future.result()
+            failures.extend(start + index for index in result.failures)
+            exceptions.extend(result.exceptions)
+            new_values.extend(result.values)
+            if collected:
+                report._extend(collected, start)
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+
+    return BatchResult(failures, exceptions, new_values)
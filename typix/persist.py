@@ -0,0 +1,358 @@
+from typing import Any, get_type_hints
+from types import CodeType, FunctionType
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+from hashlib import blake2b
+from threading import Lock
+import atexit
+import marshal
+import os
+import sys
+
+from .kinds import TypeKind, classify
+
+# The version of the format of the cache files, bumped when it changes
+FORMAT_VERSION = 1
+
+# The code objects are only valid for the interpreter that compiled them
+_PYTHON = sys.implementation.cache_tag
+
+def _fingerprint(func: FunctionType) -> bytes:
+    """
+    Hashes what the plan of a function depends on: its bytecode, its
+    signature, and its annotations, as written for the postponed ones and
+    by class otherwise. The marshaled code is not used, it depends on the
+    reference counts of the interpreter.
+
+    ### Arguments
+    * `func`: `function`\n
+        The function
+
+    ### Return
+    * type `bytes`: The digest
+    """
+    code = func.__code__
+    signature = (
+        code.co_argcount,
+        code.co_posonlyargcount,
+        code.co_kwonlyargcount,
+        code.co_flags & (CO_VARARGS | CO_VARKEYWORDS),
+        code.co_varnames[:code.co_argcount + code.co_kwonlyargcount + 2],
+        len(func.__defaults__ or ()),
+        tuple(func.__kwdefaults__ or ()),
+        tuple(
+            (argument, annotation if isinstance(annotation, str) else type(annotation).__qualname__)
+            for argument, annotation in func.__annotations__.items()
+        )
+    )
+    digest = blake2b(code.co_code, digest_size=16)
+    digest.update(repr(signature).encode())
+    return digest.digest()
+
+class PlanCache:
+    """
+    A versioned on-disk cache of what `compile_plan` resolves, shared by
+    the processes of an application so that they start warm. For each
+    function, keyed by its module, its qualified name and a hash of its code
+    and annotations, it stores the arguments annotated with a dynamic type
+    and the compiled code of their postponed annotations, so that the other
+    annotations are never evaluated again. The wrappers generated with
+    `processor(codegen=True)` are stored compiled too. The file is only
+    read on the first lookup, and is ignored when written by another version
+    of Python or of the format. The code objects are loaded like bytecode
+    files: the file must be trusted.
+    """
+    def __init__(self, path: str, autosave: bool = True):
+        """
+        A versioned on-disk cache of the compiled plans.
+
+        ### Arguments
+        * `path`: `str`\n
+            The path of the cache file
+        * `autosave`: `Optional[bool]`\n
+            Whether or not to save the cache when the interpreter exits.
+            Defaults to `True`
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.__path = os.fspath(path)
+        self.__entries: dict[str, tuple] | None = None
+        self.__annotations: dict[str, CodeType] = {}
+        self.__dirty = False
+        self.__lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        if autosave:
+            atexit.register(self.save)
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"<{class_name}: {self.__path}>"
+
+    @property
+    def path(self) -> str:
+        """
+        ### Property
+        `path`: `str`\n
+            The path of the cache file
+        """
+        return self.__path
+
+    def stats(self) -> dict:
+        """
+        Exports the statistics of the cache.
+
+        ### Return
+        * type `dict`: The hits, the misses and the number of entries
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.__load())}
+
+    def __load(self) -> dict[str, tuple]:
+        """
+        Reads the cache file on the first lookup. A missing, corrupted
+        or outdated file gives an empty cache.
+
+        ### Return
+        * type `dict[str, tuple]`: The entries by function
+        """
+        entries = self.__entries
+        if entries is not None:
+            return entries
+
+        with self.__lock:
+            if self.__entries is None:
+                try:
+                    with open(self.__path, 'rb') as file:
+                        content = marshal.load(file)
+                    if content['format'] != FORMAT_VERSION or content['python'] != _PYTHON:
+                        raise ValueError("Outdated plan cache")
+                    self.__annotations = dict(content['annotations'])
+                    self.__entries = dict(content['entries'])
+                except (OSError, EOFError, ValueError, TypeError, KeyError):
+                    self.__entries = {}
+            return self.__entries
+
+    def __compile_annotation(self, annotation: str) -> CodeType:
+        """
+        Compiles a postponed annotation. The same annotations
+        share their code, stored once in the file.
+
+        ### Arguments
+        * `annotation`: `str`\n
+            The annotation
+
+        ### Return
+        * type `CodeType`: The compiled expression
+        """
+        code = self.__annotations.get(annotation)
+        if code is None:
+            code = self.__annotations[annotation] = compile(annotation, '<typix annotation>', 'eval')
+        return code
+
+    def type_hints(self, func: FunctionType) -> dict[str, Any]:
+        """
+        Resolves the annotations of a function that are dynamic type
+        instances. On a hit, only these annotations are evaluated, from
+        their compiled code when they are postponed. On a miss, every
+        annotation is resolved and the function is added to the cache.
+
+        ### Arguments
+        * `func`: `function`\n
+            The function
+
+        ### Return
+        * type `dict[str, Any]`: The resolved annotations, at least the
+        dynamic type instances
+
+        ### Raises
+        * `NameError`\n
+            When an annotation is a forward reference that cannot be resolved yet
+        """
+        entries = self.__load()
+        key = f'{func.__module__}:{func.__qualname__}'
+        fingerprint = _fingerprint(func)
+
+        entry = entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            annotations = func.__annotations__
+            try:
+                type_hints = {
+                    argument: annotations[argument] if annotation is None
+                    else eval(self.__compile_annotation(annotation), func.__globals__)
+                    for argument, annotation in entry[1].items()
+                }
+            except Exception:
+                type_hints = None
+            if type_hints is not None and all(
+                classify(type_hint) is TypeKind.TYPIX for type_hint in type_hints.values()
+            ):
+                self.hits += 1
+                return type_hints
+
+        self.misses += 1
+        type_hints = get_type_hints(func)
+        annotated = {}
+        for argument, type_hint in type_hints.items():
+            if classify(type_hint) is not TypeKind.TYPIX:
+                continue
+            annotation = func.__annotations__.get(argument)
+            if isinstance(annotation, str):
+                annotated[argument] = annotation
+            else:
+                annotated[argument] = None
+
+        with self.__lock:
+            for annotation in annotated.values():
+                if annotation is not None:
+                    self.__compile_annotation(annotation)
+            code = entry[3] if entry is not None else None
+            source = entry[2] if entry is not None else None
+            entries[key] = (fingerprint, annotated, source, code)
+            self.__dirty = True
+        return type_hints
+
+    def compile_source(self, func: FunctionType, source: str, filename: str) -> CodeType:
+        """
+        Compiles the source of a wrapper generated for a function,
+        or loads its code when the same source was compiled before.
+
+        ### Arguments
+        * `func`: `function`\n
+            The wrapped function
+        * `source`: `str`\n
+            The source of the wrapper
+        * `filename`: `str`\n
+            The name of the source in the tracebacks
+
+        ### Return
+        * type `CodeType`: The compiled code
+        """
+        entries = self.__load()
+        key = f'{func.__module__}:{func.__qualname__}'
+        digest = blake2b(source.encode(), digest_size=16).digest()
+
+        entry = entries.get(key)
+        if entry is not None and entry[2] == digest:
+            self.hits += 1
+            return entry[3]
+
+        self.misses += 1
+        code = compile(source, filename, 'exec')
+        with self.__lock:
+            entry = entries.get(key) or (None, {}, None, None)
+            entries[key] = (entry[0], entry[1], digest, code)
+            self.__dirty = True
+        return code
+
+    def save(self) -> None:
+        """
+        Writes the cache file if entries were added since it was read.
+        The file is replaced atomically, so that concurrent processes
+        read either the previous or the new cache.
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        with self.__lock:
+            if not self.__dirty:
+                return
+            content = {
+                'format': FORMAT_VERSION,
+                'python': _PYTHON,
+                'annotations': self.__annotations,
+                'entries': self.__entries
+            }
+            temporary = f'{self.__path}.{os.getpid()}.tmp'
+            directory = os.path.dirname(self.__path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(temporary, 'wb') as file:
+                marshal.dump(content, file)
+            os.replace(temporary, self.__path)
+            self.__dirty = False
+
+    def clear(self) -> None:
+        """
+        Drops every entry and removes the cache file.
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        with self.__lock:
+            self.__entries = {}
+            self.__annotations = {}
+            self.__dirty = False
+            self.hits = self.misses = 0
+            try:
+                os.remove(self.__path)
+            except FileNotFoundError:
+                pass
+
+# The plan cache used by `compile_plan`, if any
+_plan_cache: PlanCache | None = None
+
+def set_plan_cache(cache: PlanCache | None) -> None:
+    """
+    Sets the plan cache used to resolve the annotations of the functions
+    decorated with `processor`. Must be set before the functions are
+    decorated for the generated wrappers to be cached.
+
+    ### Arguments
+    * `cache`: `PlanCache | None`\n
+        The cache, `None` to resolve every annotation again
+
+    ### Return
+    * type `NoneType`: Returns `None`
+    """
+    global _plan_cache
+    _plan_cache = cache
+
+def get_plan_cache() -> PlanCache | None:
+    """
+    Gets the plan cache used to resolve the annotations.
+
+    ### Return
+    * type `PlanCache | None`: The cache if any
+    """
+    return _plan_cache
+
+def resolve_type_hints(func: FunctionType) -> dict[str, Any]:
+    """
+    Resolves the annotations of a function through the plan cache if any.
+
+    ### Arguments
+    * `func`: `function`\n
+        The function
+
+    ### Return
+    * type `dict[str, Any]`: The resolved annotations, at least the
+    dynamic type instances
+
+    ### Raises
+    * `NameError`\n
+        When an annotation is a forward reference that cannot be resolved yet
+    """
+    cache = _plan_cache
+    if cache is None:
+        return get_type_hints(func)
+    return cache.type_hints(func)
+
+def compile_source(func: FunctionType, source: str, filename: str) -> CodeType:
+    """
+    Compiles the source of a generated wrapper through the plan cache if any.
+
+    ### Arguments
+    * `func`: `function`\n
+        The wrapped function
+    * `source`: `str`\n
+        The source of the wrapper
+    * `filename`: `str`\n
+        The name of the source in the tracebacks
+
+    ### Return
+    * type `CodeType`: The compiled code
+    """
+    cache = _plan_cache
+    if cache is None:
+        return compile(source, filename, 'exec')
+    return cache.compile_source(func, source, filename)
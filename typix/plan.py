@@ -0,0 +1,452 @@
+from typing import Any, Iterator
+from types import FunctionType
+from inspect import iscoroutinefunction, isasyncgenfunction, CO_VARARGS, CO_VARKEYWORDS
+
+from .main import Typix
+from .error import TypixError
+from .context import Frame
+
+# The modes of processing of the default values of the arguments
+DEFAULTS_CALL = 'call'
+DEFAULTS_ONCE = 'once'
+
+class CallPlan:
+    """
+    An immutable and precompiled description of the processing
+    applied by `processor` on a function. It only lists the parameters
+    annotated with a dynamic type instance, so that undecorated
+    arguments do not cost anything at call time. The binding of the
+    keyword, variadic and default arguments is precomputed as well,
+    so that positional calls do not pay for it.
+    Should not be instanciated directly, use `compile_plan` instead.
+    """
+    def __init__(
+        self,
+        func: FunctionType,
+        slots: tuple[tuple[int, str, Typix], ...],
+        return_type: Typix = None,
+        keywords: dict[str, Typix] = None,
+        var_positional: tuple[str, Typix] = None,
+        var_keyword: tuple[str, Typix] = None,
+        defaults: tuple[tuple[int | None, str, Typix | None, Any], ...] = ()
+    ):
+        """
+        An immutable and precompiled description of the processing
+        applied by `processor` on a function.
+        Should not be instanciated directly, use `compile_plan` instead.
+
+        ### Arguments
+        * `func`: `function`\n
+            The function described by the plan
+        * `slots`: `tuple[tuple[int, str, Typix], ...]`\n
+            The `(index, argument name, dynamic type)` of each annotated
+            positional argument, sorted by index
+        * `return_type`: `Optional[Typix]`\n
+            The dynamic type annotating the return value.
+            Defaults to `None`
+        * `keywords`: `Optional[dict[str, Typix]]`\n
+            The dynamic type of each annotated argument that can be
+            passed by keyword.
+            Defaults to `None`
+        * `var_positional`: `Optional[tuple[str, Typix]]`\n
+            The name and the dynamic type of the annotated `*args`
+            parameter, applied to each item.
+            Defaults to `None`
+        * `var_keyword`: `Optional[tuple[str, Typix]]`\n
+            The name and the dynamic type of the annotated `**kwargs`
+            parameter, applied to each item.
+            Defaults to `None`
+        * `defaults`: `Optional[tuple[tuple[int | None, str, Typix | None, Any], ...]]`\n
+            The `(index, argument name, dynamic type, default value)` of each
+            annotated argument with a default value. The index is `None` for
+            keyword-only arguments and the dynamic type is `None` when the
+            default value is already processed.
+            Defaults to `()`
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        code = func.__code__
+        self.__func = func
+        self.__slots = slots
+        self.__return_type = return_type
+        self.__keywords = keywords or {}
+        self.__var_positional = var_positional
+        self.__var_keyword = var_keyword
+        self.__defaults = defaults
+        self.__argcount = code.co_argcount
+        self.__posonlycount = code.co_posonlyargcount
+        self.__keyword_names = frozenset(
+            code.co_varnames[code.co_posonlyargcount:code.co_argcount + code.co_kwonlyargcount]
+        )
+        self.__extended = bool(self.__keywords or var_positional or var_keyword or defaults)
+        self.__always_bind = any(index is None for index, _, _, _ in defaults)
+
+        type_hints = [type_hint for _, _, type_hint in slots]
+        type_hints += list(self.__keywords.values())
+        type_hints += [variadic[1] for variadic in (var_positional, var_keyword) if variadic is not None]
+        type_hints += [type_hint for _, _, type_hint, _ in defaults if type_hint is not None]
+        type_hints.append(return_type)
+        self.__type_hints = tuple({
+            id(type_hint): type_hint for type_hint in type_hints if type_hint is not None
+        }.values())
+
+        # Whether a dynamic type changes the values, so the processing cannot be skipped
+        self.__required = any(type_hint.required for type_hint in self.__type_hints)
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        arguments = [argument for _, argument, _ in self.__slots]
+        arguments += [argument for argument in self.__keywords if argument not in arguments]
+        if self.__var_positional is not None:
+            arguments.append(f"*{self.__var_positional[0]}")
+        if self.__var_keyword is not None:
+            arguments.append(f"**{self.__var_keyword[0]}")
+        return f"<{class_name}: {self.__func.__qualname__}({', '.join(arguments)})>"
+
+    @property
+    def func(self) -> FunctionType:
+        """
+        ### Property
+        `func`: `function`\n
+            The function described by the plan
+        """
+        return self.__func
+
+    @property
+    def slots(self) -> tuple[tuple[int, str, Typix], ...]:
+        """
+        ### Property
+        `slots`: `tuple[tuple[int, str, Typix], ...]`\n
+            The `(index, argument name, dynamic type)` of each annotated
+            positional argument, sorted by index
+        """
+        return self.__slots
+
+    @property
+    def return_type(self) -> Typix | None:
+        """
+        ### Property
+        `return_type`: `Typix`\n
+            The dynamic type annotating the return value if any
+        """
+        return self.__return_type
+
+    @property
+    def keywords(self) -> dict[str, Typix]:
+        """
+        ### Property
+        `keywords`: `dict[str, Typix]`\n
+            The dynamic type of each annotated argument that can be passed by keyword
+        """
+        return self.__keywords
+
+    @property
+    def var_positional(self) -> tuple[str, Typix] | None:
+        """
+        ### Property
+        `var_positional`: `tuple[str, Typix]`\n
+            The name and the dynamic type of the annotated `*args` parameter if any
+        """
+        return self.__var_positional
+
+    @property
+    def var_keyword(self) -> tuple[str, Typix] | None:
+        """
+        ### Property
+        `var_keyword`: `tuple[str, Typix]`\n
+            The name and the dynamic type of the annotated `**kwargs` parameter if any
+        """
+        return self.__var_keyword
+
+    @property
+    def defaults(self) -> tuple[tuple[int | None, str, Typix | None, Any], ...]:
+        """
+        ### Property
+        `defaults`: `tuple[tuple[int | None, str, Typix | None, Any], ...]`\n
+            The `(index, argument name, dynamic type, default value)` of each
+            annotated argument with a default value. The dynamic type is `None`
+            when the default value is already processed
+        """
+        return self.__defaults
+
+    @property
+    def argcount(self) -> int:
+        """
+        ### Property
+        `argcount`: `int`\n
+            The number of positional parameters of the function
+        """
+        return self.__argcount
+
+    @property
+    def extended(self) -> bool:
+        """
+        ### Property
+        `extended`: `bool`\n
+            Whether or not keyword, variadic or default arguments are processed
+        """
+        return self.__extended
+
+    @property
+    def type_hints(self) -> tuple[Typix, ...]:
+        """
+        ### Property
+        `type_hints`: `tuple[Typix, ...]`\n
+            Each distinct dynamic type of the plan, including the return value
+        """
+        return self.__type_hints
+
+    @property
+    def required(self) -> bool:
+        """
+        ### Property
+        `required`: `bool`\n
+            Whether or not a dynamic type of the plan changes the values,
+            in which case the processing is never skipped, see `set_mode`
+        """
+        return self.__required
+
+    def needs_binding(self, args: tuple | list, kwargs: dict) -> bool:
+        """
+        Checks whether a call must go through `bind` after its positional
+        slots are processed. Positional calls passing every positional
+        argument never do, unless keyword-only defaults are processed.
+
+        ### Arguments
+        * `args`: `tuple | list`\n
+            The positional arguments of the call
+        * `kwargs`: `dict`\n
+            The keyword arguments of the call
+
+        ### Return
+        * type `bool`: Whether or not the call must be bound
+        """
+        return bool(kwargs) or len(args) != self.__argcount or self.__always_bind
+
+    def bind(self, args: list, kwargs: dict) -> Iterator[tuple[list | dict, int | str, str, Typix]]:
+        """
+        Binds the keyword, variadic and default arguments of a call to their
+        dynamic types. The missing arguments with an annotated default value
+        are inserted into the arguments of the call.
+
+        ### Arguments
+        * `args`: `list`\n
+            The positional arguments of the call, updated in place
+        * `kwargs`: `dict`\n
+            The keyword arguments of the call, updated in place
+
+        ### Return
+        * type `Iterator[tuple[list | dict, int | str, str, Typix]]`: The
+        `(container, key, argument name, dynamic type)` of each value to process
+
+        .. doctest
+            >>> from typix import processor, Convert
+            >>> @processor
+            ... def f(a, b: Convert(int) = '2', /, c='x', *, d: Convert(int) = '4'):
+            ...     return a, b, c, d
+            >>> f(1)
+            (1, 2, 'x', 4)
+            >>> f(1, '3', c='y', d='5')
+            (1, 3, 'y', 5)
+            >>> f(d='5')
+            Traceback (most recent call last):
+            ...
+            TypeError: f() missing 1 required positional argument: 'a'
+        """
+        argcount = self.__argcount
+
+        # Each item of the variadic arguments
+        if self.__var_positional is not None and len(args) > argcount:
+            argument, type_hint = self.__var_positional
+            for index in range(argcount, len(args)):
+                yield args, index, argument, type_hint
+
+        # Keyword arguments
+        if kwargs:
+            keywords = self.__keywords
+            var_keyword = self.__var_keyword
+            for key in list(kwargs):
+                if key in keywords:
+                    yield kwargs, key, key, keywords[key]
+                elif var_keyword is not None and key not in self.__keyword_names:
+                    yield kwargs, key, var_keyword[0], var_keyword[1]
+
+        # Missing arguments with a default value
+        for index, argument, type_hint, value in self.__defaults:
+            if argument in kwargs:
+                continue
+
+            if index is None:
+                kwargs[argument] = value
+                container, key = kwargs, argument
+            elif index < len(args):
+                continue
+            elif index < self.__posonlycount:
+                # Positional-only arguments cannot be skipped
+                raw_defaults = self.__func.__defaults__
+                offset = argcount - len(raw_defaults)
+                # A missing argument without default is left to the call, which raises
+                if len(args) < offset:
+                    continue
+                while len(args) < index:
+                    args.append(raw_defaults[len(args) - offset])
+                args.append(value)
+                container, key = args, index
+            else:
+                kwargs[argument] = value
+                container, key = kwargs, argument
+
+            if type_hint is not None:
+                yield container, key, argument, type_hint
+
+def _apply(type_hint: Typix, argument: str, func: FunctionType, value: Any) -> Any:
+    """
+    Processes a value with the dynamic type annotating an argument.
+
+    ### Arguments
+    * `type_hint`: `Typix`\n
+        The dynamic type annotating the argument
+    * `argument`: `str`\n
+        The name of the argument, `'return'` for the return value
+    * `func`: `function`\n
+        The function containing the argument
+    * `value`: `Any`\n
+        The value to process
+
+    ### Return
+    * type `Any`: The processed value
+    """
+    return type_hint._run(Frame(type_hint, value, argument, func))
+
+async def _apply_async(type_hint: Typix, argument: str, func: FunctionType, value: Any) -> Any:
+    """
+    Processes a value with the asynchronous dynamic type annotating an argument.
+
+    ### Arguments
+    * `type_hint`: `Typix`\n
+        The dynamic type annotating the argument
+    * `argument`: `str`\n
+        The name of the argument, `'return'` for the return value
+    * `func`: `function`\n
+        The function containing the argument
+    * `value`: `Any`\n
+        The value to process
+
+    ### Return
+    * type `Any`: The processed value
+    """
+    return await type_hint._run_async(Frame(type_hint, value, argument, func))
+
+def compile_plan(func: FunctionType, defaults: str = DEFAULTS_CALL) -> CallPlan:
+    """
+    Resolves the annotations of a function once and compiles
+    them into a `CallPlan`. The annotations are resolved through
+    the plan cache if one is set, see `set_plan_cache`.
+
+    ### Arguments
+    * `func`: `function`\n
+        The function to compile
+    * `defaults`: `Optional[str]`\n
+        `DEFAULTS_CALL` to process the default value of a missing annotated
+        argument on each call, or `DEFAULTS_ONCE` to process it once here.
+        The default values processed by an asynchronous dynamic type are
+        always processed on each call.
+        Defaults to `DEFAULTS_CALL`
+
+    ### Return
+    * type `CallPlan`: The compiled plan of the function
+
+    ### Raises
+    * `NameError`\n
+        When an annotation is a forward reference that cannot be resolved yet
+    * `TypixError`\n
+        When an asynchronous dynamic type annotates a synchronous function
+    * `ValueError`\n
+        When the mode of processing of the default values is unknown
+    """
+    if defaults not in (DEFAULTS_CALL, DEFAULTS_ONCE):
+        raise ValueError(f"Unknown mode of processing of the default values: {defaults!r}")
+
+    # Imported on the first call, so that importing `typix` does not load them
+    from .kinds import TypeKind, classify
+    from .persist import resolve_type_hints
+
+    type_hints = resolve_type_hints(func)
+    code = func.__code__
+    names = code.co_varnames
+    argcount = code.co_argcount
+    kwonlycount = code.co_kwonlyargcount
+
+    def annotation(argument: str) -> Typix | None:
+        type_hint = type_hints.get(argument)
+        return type_hint if classify(type_hint) is TypeKind.TYPIX else None
+
+    slots = tuple(
+        (index, argument, annotation(argument))
+        for index, argument in enumerate(names[:argcount])
+        if annotation(argument) is not None
+    )
+
+    keywords = {
+        argument: annotation(argument)
+        for argument in names[code.co_posonlyargcount:argcount + kwonlycount]
+        if annotation(argument) is not None
+    }
+
+    # Variadic parameters
+    position = argcount + kwonlycount
+    var_positional = var_keyword = None
+    if code.co_flags & CO_VARARGS:
+        if annotation(names[position]) is not None:
+            var_positional = (names[position], annotation(names[position]))
+        position += 1
+    if code.co_flags & CO_VARKEYWORDS:
+        if annotation(names[position]) is not None:
+            var_keyword = (names[position], annotation(names[position]))
+
+    # Default values
+    default_values = []
+    raw_defaults = func.__defaults__ or ()
+    offset = argcount - len(raw_defaults)
+    for index, value in enumerate(raw_defaults, offset):
+        argument = names[index]
+        if annotation(argument) is not None:
+            default_values.append((index, argument, annotation(argument), value))
+    for argument, value in (func.__kwdefaults__ or {}).items():
+        if annotation(argument) is not None:
+            default_values.append((None, argument, annotation(argument), value))
+
+    if defaults == DEFAULTS_ONCE:
+        default_values = [
+            (index, argument, type_hint, value)
+            if type_hint.asynchronous
+            else (index, argument, None, _apply(type_hint, argument, func, value))
+            for index, argument, type_hint, value in default_values
+        ]
+
+    return_type: Any = type_hints.get('return')
+    if classify(return_type) is not TypeKind.TYPIX:
+        return_type = None
+
+    if not (iscoroutinefunction(func) or isasyncgenfunction(func)):
+        annotated = [(argument, type_hint) for _, argument, type_hint in slots]
+        annotated += list(keywords.items())
+        annotated += [variadic for variadic in (var_positional, var_keyword) if variadic is not None]
+        annotated.append(('return', return_type))
+        for argument, type_hint in annotated:
+            if type_hint is not None and type_hint.asynchronous:
+                raise TypixError(
+                    f"'{type_hint.__class__.__name__}' is asynchronous and cannot annotate "
+                    f"'{argument}' of the synchronous function '{func.__qualname__}'"
+                )
+
+    return CallPlan(
+        func,
+        slots,
+        return_type,
+        keywords,
+        var_positional,
+        var_keyword,
+        tuple(default_values)
+    )
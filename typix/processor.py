@@ -1,79 +1,582 @@
-from typing import get_type_hints, Any
+from typing import Any, Iterable
 from types import FunctionType
+from functools import update_wrapper
+from itertools import starmap
+from inspect import iscoroutinefunction, isasyncgenfunction
 
+from .plan import CallPlan, compile_plan, _apply, _apply_async, DEFAULTS_CALL, DEFAULTS_ONCE
+from .codegen import can_generate, generate_wrapper, regenerate_wrapper
+from .mode import Mode, register, reapply, get_mode
+from .attributes import process_attributes
 from .main import Typix
-from .utils import istypix
+from .context import _current_report, failed_arguments
+from .instrument import profiler
 
-def processor(func: FunctionType) -> FunctionType:
+def processor(
+    func: FunctionType = None,
+    *,
+    codegen: bool = False,
+    defaults: str = DEFAULTS_CALL,
+    mode: Mode = None
+) -> FunctionType:
     """
     A decorator function that allow dynamic type
     to process arguments on the targeted function.
+    The annotations are resolved once into a `CallPlan` on the first call,
+    so that decorating a function costs the same whatever its signature.
+    Can be used as `@processor` or `@processor(codegen=True)`.
+    Positional, keyword, positional-only and keyword-only arguments are
+    processed, as well as each item of annotated `*args` and `**kwargs`.
+    The default value of a missing annotated argument is processed too.
+    Coroutine functions and asynchronous generators get an asynchronous
+    wrapper that processes the awaited result or each yielded item, and
+    that awaits asynchronous dynamic types.
+    Class methods, static methods and properties are decorated through
+    their functions, and classes are decorated with `process_class`.
 
     ### Arguments
-    * `func`: `function`\n
+    * `func`: `function | classmethod | staticmethod | property | type`\n
         The function to decorate
-    
+    * `codegen`: `Optional[bool]`\n
+        Whether or not to generate a wrapper specialized to the signature
+        of the function. It is nearly as cheap as an undecorated call but
+        requires the annotations to be resolvable at decoration time,
+        otherwise the generic wrapper is used. Asynchronous generators
+        always use the generic wrapper.
+        Defaults to `False`
+    * `defaults`: `Optional[str]`\n
+        `'call'` to process the default values of the missing arguments on
+        each call, or `'once'` to process them once when the plan is compiled.
+        Defaults to `'call'`
+    * `mode`: `Optional[Mode]`\n
+        The calls of the function that are processed, see `set_mode`.
+        Defaults to `None`: the global mode is followed
+
     ### Return
-    * type `function`: The decorated function
+    * type `function`: The decorated function, or the decorated member or class
+
+    ### Raises
+    * `ValueError`\n
+        When the mode of processing of the default values is unknown
+    """
+    if defaults not in (DEFAULTS_CALL, DEFAULTS_ONCE):
+        raise ValueError(f"Unknown mode of processing of the default values: {defaults!r}")
+
+    if func is None:
+        return lambda func: processor(func, codegen=codegen, defaults=defaults, mode=mode)
+
+    if isinstance(func, type):
+        return process_class(func, codegen=codegen, defaults=defaults, mode=mode)
+    if isinstance(func, (classmethod, staticmethod, property)):
+        return _process_member(func, codegen, defaults, mode)
+
+    if codegen and not isasyncgenfunction(func) and can_generate(func):
+        try:
+            wrapper = generate_wrapper(func, defaults=defaults)
+        except NameError:
+            pass
+        else:
+            register(wrapper, mode)
+            return wrapper
+
+    if isasyncgenfunction(func):
+        inner = _async_generator_wrapper(func, defaults)
+    elif iscoroutinefunction(func):
+        inner = _coroutine_wrapper(func, defaults)
+    else:
+        inner = _wrapper(func, defaults)
+
+    update_wrapper(inner, func)
+
+    # The annotations are resolved on the first call
+    inner.__typix_plan__ = None
+    inner.__typix_defaults__ = defaults
+    register(inner, mode)
+
+    return inner
+
+def _process_member(member: Any, codegen: bool = False, defaults: str = DEFAULTS_CALL, mode: Mode = None) -> Any:
+    """
+    Decorates the functions of a class method, a static method or a property.
+
+    ### Arguments
+    * `member`: `classmethod | staticmethod | property`\n
+        The member to decorate
+    * `codegen`: `Optional[bool]`\n
+        Whether or not to generate the wrappers, see `processor`.
+        Defaults to `False`
+    * `defaults`: `Optional[str]`\n
+        The mode of processing of the default values, see `compile_plan`.
+        Defaults to `'call'`
+    * `mode`: `Optional[Mode]`\n
+        The calls that are processed, see `set_mode`.
+        Defaults to `None`: the global mode is followed
+
+    ### Return
+    * type `classmethod | staticmethod | property`: A new member of the same type
+    """
+    def decorate(func: FunctionType | None) -> FunctionType | None:
+        if func is None or hasattr(func, '__typix_plan__'):
+            return func
+        return processor(func, codegen=codegen, defaults=defaults, mode=mode)
+
+    if isinstance(member, property):
+        return member.__class__(
+            decorate(member.fget), decorate(member.fset), member.fdel, member.__doc__
+        )
+    return member.__class__(decorate(member.__func__))
+
+def _annotated(member: Any) -> bool:
+    """
+    Checks whether a member of a class may be annotated with a dynamic
+    type instance, without resolving its annotations.
+
+    ### Arguments
+    * `member`: `Any`\n
+        The member of the class
+
+    ### Return
+    * type `bool`: Whether or not the member should be decorated
+    """
+    if isinstance(member, property):
+        return _annotated(member.fget) or _annotated(member.fset)
+    if isinstance(member, (classmethod, staticmethod)):
+        member = member.__func__
+    if not isinstance(member, FunctionType) or hasattr(member, '__typix_plan__'):
+        return False
+    return any(
+        isinstance(annotation, (Typix, str))
+        for annotation in member.__annotations__.values()
+    )
+
+def process_class(cls: type, *, codegen: bool = False, defaults: str = DEFAULTS_CALL, mode: Mode = None) -> type:
+    """
+    Decorates with `processor` every method, class method, static method
+    and property of a class annotated with dynamic type instances, once for
+    the whole class. As for functions, the annotations of each method are
+    only resolved on its first call. The attributes of the class annotated
+    with a dynamic type instance are replaced by `ProcessedAttribute`
+    descriptors that process the assigned values. They store the values in
+    the slots of the class when it defines `__slots__`, and no `__setattr__`
+    is added. Used by `processor` on a class, it must be applied after
+    `dataclass`.
+
+    ### Arguments
+    * `cls`: `type`\n
+        The class to decorate
+    * `codegen`: `Optional[bool]`\n
+        Whether or not to generate the wrappers of the methods, see `processor`.
+        Defaults to `False`
+    * `defaults`: `Optional[str]`\n
+        The mode of processing of the default values, see `compile_plan`.
+        Defaults to `'call'`
+    * `mode`: `Optional[Mode]`\n
+        The calls of the methods that are processed, see `set_mode`. The
+        attributes are always processed.
+        Defaults to `None`: the global mode is followed
+
+    ### Return
+    * type `type`: The same class
+
+    ### Raises
+    * `TypixError`\n
+        When an asynchronous dynamic type annotates an attribute
+    """
+    for name, member in list(cls.__dict__.items()):
+        if not _annotated(member):
+            continue
+        if isinstance(member, FunctionType):
+            setattr(cls, name, processor(member, codegen=codegen, defaults=defaults, mode=mode))
+        else:
+            setattr(cls, name, _process_member(member, codegen, defaults, mode))
+
+    process_attributes(cls)
+    return cls
+
+def _resolve_plan(wrapper: FunctionType, func: FunctionType, defaults: str) -> CallPlan:
     """
-    def inner(*args) -> Any:
+    Compiles the plan of a decorated function on its first call. The gate
+    of the function depends on the plan, it is set again once compiled and
+    must be read again by the caller.
+
+    ### Arguments
+    * `wrapper`: `function`\n
+        The decorated function
+    * `func`: `function`\n
+        The wrapped function
+    * `defaults`: `str`\n
+        The mode of processing of the default values, see `compile_plan`
+
+    ### Return
+    * type `CallPlan`: The compiled plan
+
+    ### Raises
+    * `NameError`\n
+        When an annotation is a forward reference that cannot be resolved yet
+    """
+    plan = wrapper.__typix_plan__ = compile_plan(func, defaults)
+    if get_mode(wrapper).kind != Mode.ALWAYS:
+        reapply(wrapper)
+    return plan
+
+def _wrapper(func: FunctionType, defaults: str = DEFAULTS_CALL) -> FunctionType:
+    """
+    Builds the generic wrapper of a synchronous function.
+
+    ### Arguments
+    * `func`: `function`\n
+        The function to wrap
+    * `defaults`: `Optional[str]`\n
+        The mode of processing of the default values, see `compile_plan`.
+        Defaults to `'call'`
+
+    ### Return
+    * type `function`: The wrapper
+    """
+    def inner(*args, **kwargs) -> Any:
         """
         A modified version of the decorated function given by
         the `func` parameter in the parent scope. Handles argument
         and return value processing.
-        
+
         ### Arguments
         * `*args`: `tuple`\n
-            The arguments of the decorated function
-        
+            The positional arguments of the decorated function
+        * `**kwargs`: `dict`\n
+            The keyword arguments of the decorated function
+
         ### Return
         * type `Any`: The new return value of the function
         """
-        # Get function arguments and typehints
-        type_hints = get_type_hints(func)
-        arguments = func.__code__.co_varnames
-        
-        # Get return typehint
-        return_type_hint = None
-        if 'return' in type_hints:
-            return_type_hint: Typix = type_hints.pop('return')
-        
-        # Loop through the arguments
-        new_args = []
-        for argument, value in zip(arguments, args):
-            # If has annotation
-            if not argument in type_hints:
-                new_args.append(value)
-                continue
-            
-            type_hint: Typix = type_hints[argument]
-            
-            # If annotation is dynamic
-            if not istypix(type_hint):
-                new_args.append(value)
-                continue
-            
-            # Configure context
-            type_hint._arg = argument
-            type_hint._func = func
-            type_hint._value = value
-            
-            new_value = type_hint.process(*type_hint._args)
-            new_args.append(new_value)
-        
-        # Return value handling
-        return_value = func(*new_args)
-        
-        new_return_value = None
-        if return_type_hint is not None:
-            # Configure context
-            return_type_hint._arg = 'return'
-            return_type_hint._func = func
-            return_type_hint._value = return_value
-            
-            # Process value
-            new_return_value = return_type_hint.process(*return_type_hint._args)
-        
-        return new_return_value
-    
+        # The call is not sampled by the mode of the function
+        gate = inner.__typix_gate__
+        if gate is not None and not gate():
+            return func(*args, **kwargs)
+
+        # Get the compiled plan, resolve it if it was invalidated
+        plan: CallPlan = inner.__typix_plan__
+        if plan is None:
+            plan = _resolve_plan(inner, func, defaults)
+            # The gate is set with the plan, the resolving call is counted in it
+            gate = inner.__typix_gate__
+            if gate is not None and not gate():
+                return func(*args, **kwargs)
+
+        # Loop through the annotated arguments only
+        slots = plan.slots
+        if slots:
+            args = list(args)
+            count = len(args)
+            for index, argument, type_hint in slots:
+                if index >= count:
+                    break
+                args[index] = _apply(type_hint, argument, func, args[index])
+
+        # Keyword, variadic and default arguments
+        if plan.extended and plan.needs_binding(args, kwargs):
+            args = list(args)
+            for container, key, argument, type_hint in plan.bind(args, kwargs):
+                container[key] = _apply(type_hint, argument, func, container[key])
+
+        # Arguments failed while the errors are collected
+        if profiler.collecting and failed_arguments():
+            return None
+
+        # Return value handling, the call is only timed by the profiler
+        if profiler.enabled:
+            return_value = profiler.call(func, args, kwargs)
+        else:
+            return_value = func(*args, **kwargs)
+
+        return_type_hint = plan.return_type
+        if return_type_hint is None:
+            return return_value
+        return _apply(return_type_hint, 'return', func, return_value)
+
     return inner
+
+async def _process_arguments_async(
+    plan: CallPlan,
+    func: FunctionType,
+    args: tuple,
+    kwargs: dict
+) -> tuple[list | tuple, dict]:
+    """
+    Processes the annotated arguments of an asynchronous function call.
+    Only the asynchronous dynamic types are awaited.
+
+    ### Arguments
+    * `plan`: `CallPlan`\n
+        The compiled plan of the function
+    * `func`: `function`\n
+        The called function
+    * `args`: `tuple`\n
+        The positional arguments of the call
+    * `kwargs`: `dict`\n
+        The keyword arguments of the call
+
+    ### Return
+    * type `tuple[list | tuple, dict]`: The processed positional and keyword arguments
+    """
+    slots = plan.slots
+    if slots:
+        args = list(args)
+        count = len(args)
+        for index, argument, type_hint in slots:
+            if index >= count:
+                break
+            if type_hint.asynchronous:
+                args[index] = await _apply_async(type_hint, argument, func, args[index])
+            else:
+                args[index] = _apply(type_hint, argument, func, args[index])
+
+    if plan.extended and plan.needs_binding(args, kwargs):
+        args = list(args)
+        for container, key, argument, type_hint in plan.bind(args, kwargs):
+            if type_hint.asynchronous:
+                container[key] = await _apply_async(type_hint, argument, func, container[key])
+            else:
+                container[key] = _apply(type_hint, argument, func, container[key])
+
+    return args, kwargs
+
+def _coroutine_wrapper(func: FunctionType, defaults: str = DEFAULTS_CALL) -> FunctionType:
+    """
+    Builds the generic wrapper of a coroutine function. The awaited
+    result is processed as the return value.
+
+    ### Arguments
+    * `func`: `function`\n
+        The coroutine function to wrap
+    * `defaults`: `Optional[str]`\n
+        The mode of processing of the default values, see `compile_plan`.
+        Defaults to `'call'`
+
+    ### Return
+    * type `function`: The wrapper, a coroutine function
+    """
+    async def inner(*args, **kwargs) -> Any:
+        """
+        A modified version of the decorated coroutine function given by
+        the `func` parameter in the parent scope. Handles argument
+        and awaited return value processing.
+
+        ### Arguments
+        * `*args`: `tuple`\n
+            The positional arguments of the decorated function
+        * `**kwargs`: `dict`\n
+            The keyword arguments of the decorated function
+
+        ### Return
+        * type `Any`: The new awaited return value of the function
+        """
+        gate = inner.__typix_gate__
+        if gate is not None and not gate():
+            return await func(*args, **kwargs)
+
+        plan: CallPlan = inner.__typix_plan__
+        if plan is None:
+            plan = _resolve_plan(inner, func, defaults)
+            gate = inner.__typix_gate__
+            if gate is not None and not gate():
+                return await func(*args, **kwargs)
+
+        args, kwargs = await _process_arguments_async(plan, func, args, kwargs)
+        if profiler.collecting and failed_arguments():
+            return None
+        if profiler.enabled:
+            return_value = await profiler.call_async(func, args, kwargs)
+        else:
+            return_value = await func(*args, **kwargs)
+
+        return_type_hint = plan.return_type
+        if return_type_hint is None:
+            return return_value
+        if return_type_hint.asynchronous:
+            return await _apply_async(return_type_hint, 'return', func, return_value)
+        return _apply(return_type_hint, 'return', func, return_value)
+
+    return inner
+
+def _async_generator_wrapper(func: FunctionType, defaults: str = DEFAULTS_CALL) -> FunctionType:
+    """
+    Builds the generic wrapper of an asynchronous generator. Each
+    yielded item is processed as the return value.
+
+    ### Arguments
+    * `func`: `function`\n
+        The asynchronous generator function to wrap
+    * `defaults`: `Optional[str]`\n
+        The mode of processing of the default values, see `compile_plan`.
+        Defaults to `'call'`
+
+    ### Return
+    * type `function`: The wrapper, an asynchronous generator function
+    """
+    async def inner(*args, **kwargs) -> Any:
+        """
+        A modified version of the decorated asynchronous generator given by
+        the `func` parameter in the parent scope. Handles argument
+        and yielded item processing.
+
+        ### Arguments
+        * `*args`: `tuple`\n
+            The positional arguments of the decorated function
+        * `**kwargs`: `dict`\n
+            The keyword arguments of the decorated function
+
+        ### Return
+        * type `AsyncGenerator`: The processed items of the generator
+        """
+        gate = inner.__typix_gate__
+        if gate is not None and not gate():
+            async for item in func(*args, **kwargs):
+                yield item
+            return
+
+        plan: CallPlan = inner.__typix_plan__
+        if plan is None:
+            plan = _resolve_plan(inner, func, defaults)
+            gate = inner.__typix_gate__
+            if gate is not None and not gate():
+                async for item in func(*args, **kwargs):
+                    yield item
+                return
+
+        args, kwargs = await _process_arguments_async(plan, func, args, kwargs)
+        if profiler.collecting and failed_arguments():
+            return
+        generator = func(*args, **kwargs)
+
+        return_type_hint = plan.return_type
+        if return_type_hint is None:
+            async for item in generator:
+                yield item
+        elif return_type_hint.asynchronous:
+            async for item in generator:
+                yield await _apply_async(return_type_hint, 'return', func, item)
+        else:
+            async for item in generator:
+                yield _apply(return_type_hint, 'return', func, item)
+
+    return inner
+
+def invalidate(func: FunctionType) -> None:
+    """
+    Drops the compiled plan of a function decorated with `processor`.
+    The annotations will be resolved again on the next call. Must be
+    used when the annotations of the function change after decoration.
+    A generated wrapper is compiled again immediately. When the function
+    does not follow the `ALWAYS` mode, its gate is set again.
+
+    ### Arguments
+    * `func`: `function`\n
+        The decorated function
+
+    ### Return
+    * type `NoneType`: Returns `None`
+
+    ### Raises
+    * `TypeError`\n
+        When the function is not decorated with `processor`
+    * `NameError`\n
+        When a generated wrapper has an annotation that cannot be resolved
+    """
+    if not hasattr(func, '__typix_plan__'):
+        raise TypeError(f"{func!r} is not decorated with 'processor'")
+
+    if hasattr(func, '__typix_source__'):
+        regenerate_wrapper(func)
+    else:
+        func.__typix_plan__ = None
+
+    # The gates depend on the plan, and the generated ones on the globals
+    if func.__typix_gate__ is not None or get_mode(func).kind != Mode.ALWAYS:
+        reapply(func)
+
+def process_many(func: FunctionType, batch: Iterable[tuple]) -> list:
+    """
+    Calls a function decorated with `processor` with each tuple of
+    positional arguments of a batch. The plan of the function is looked
+    up once for the whole batch instead of once per call. Also available
+    as `processor.map`. While the errors are collected, the failures are
+    reported with the index of their call, and a call whose arguments
+    failed returns `None`.
+
+    ### Arguments
+    * `func`: `function`\n
+        The decorated function
+    * `batch`: `Iterable[tuple]`\n
+        The positional arguments of each call
+
+    ### Return
+    * type `list`: The processed return value of each call
+
+    ### Raises
+    * `TypeError`\n
+        When the function is not decorated with `processor`
+        or when it is asynchronous
+    * `NameError`\n
+        When an annotation is a forward reference that cannot be resolved yet
+    """
+    if not hasattr(func, '__typix_plan__'):
+        raise TypeError(f"{func!r} is not decorated with 'processor'")
+    if iscoroutinefunction(func) or isasyncgenfunction(func):
+        raise TypeError(f"{func!r} is asynchronous and cannot be mapped")
+
+    # The failures are reported with the index of their call
+    report = _current_report.get()
+    if report is not None:
+        results = []
+        try:
+            for position, args in enumerate(batch):
+                report._at(position)
+                results.append(func(*args))
+        finally:
+            report._at(None)
+        return results
+
+    # Generated wrappers are already specialized
+    if hasattr(func, '__typix_source__'):
+        return list(starmap(func, batch))
+
+    wrapped = func.__wrapped__
+    plan: CallPlan = func.__typix_plan__
+    if plan is None:
+        plan = _resolve_plan(func, wrapped, func.__typix_defaults__)
+
+    slots = plan.slots
+    extended = plan.extended
+    return_type_hint = plan.return_type
+    gate = func.__typix_gate__
+
+    results = []
+    for args in batch:
+        # The call is not sampled by the mode of the function
+        if gate is not None and not gate():
+            results.append(wrapped(*args))
+            continue
+
+        args = list(args)
+        kwargs = {}
+        count = len(args)
+        for index, argument, type_hint in slots:
+            if index >= count:
+                break
+            args[index] = _apply(type_hint, argument, wrapped, args[index])
+
+        if extended and plan.needs_binding(args, kwargs):
+            for container, key, argument, type_hint in plan.bind(args, kwargs):
+                container[key] = _apply(type_hint, argument, wrapped, container[key])
+
+        if profiler.enabled:
+            return_value = profiler.call(wrapped, args, kwargs)
+        else:
+            return_value = wrapped(*args, **kwargs)
+        if return_type_hint is not None:
+            return_value = _apply(return_type_hint, 'return', wrapped, return_value)
+        results.append(return_value)
+
+    return results
+
+processor.map = process_many
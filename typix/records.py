@@ -0,0 +1,760 @@
+from typing import (
+    Any, Callable, Mapping, AbstractSet, Union, Literal, Annotated, ClassVar, TypeVar, ForwardRef, NewType,
+    get_origin, get_args, get_type_hints, is_typeddict
+)
+from types import UnionType
+from dataclasses import is_dataclass, fields as dataclass_fields, MISSING as _NO_DEFAULT
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+from functools import lru_cache
+from inspect import isclass
+
+from .main import Typix
+from .error import TypixError, CheckResult
+from .checker import compile_check, compile_valid, CACHE_SIZE
+from .converters import ConversionError, convert
+from .report import ErrorReport, ReportError
+
+_NoneType = type(None)
+
+# The dialect of the exported schemas
+JSON_SCHEMA_DIALECT = 'https://json-schema.org/draft/2020-12/schema'
+
+# The schemas of the types with a direct JSON equivalent
+_SCALAR_SCHEMAS = {
+    bool: {'type': 'boolean'},
+    int: {'type': 'integer'},
+    float: {'type': 'number'},
+    Decimal: {'type': 'number'},
+    str: {'type': 'string'},
+    bytes: {'type': 'string'},
+    _NoneType: {'type': 'null'},
+    datetime: {'type': 'string', 'format': 'date-time'},
+    date: {'type': 'string', 'format': 'date'},
+    time: {'type': 'string', 'format': 'time'},
+    UUID: {'type': 'string', 'format': 'uuid'},
+    list: {'type': 'array'},
+    tuple: {'type': 'array'},
+    set: {'type': 'array', 'uniqueItems': True},
+    frozenset: {'type': 'array', 'uniqueItems': True},
+    dict: {'type': 'object'}
+}
+
+# The kinds of records
+TYPED_DICT = 'typed_dict'
+DATACLASS = 'dataclass'
+CLASS = 'class'
+
+class Missing:
+    """
+    The value of a required field missing from a record, as reported
+    in the failures.
+    Should not be instanciated directly.
+    """
+    def __repr__(self) -> str:
+        return '<missing>'
+
+# Marker of a missing field
+MISSING = Missing()
+
+# Marker of a field that failed, returned by the checks of the fields
+_FAILED = object()
+
+# Type Alias for the checks of the fields: value, convert, report, path
+FieldCheck = Callable[[Any, bool, ErrorReport, str], Any]
+
+def _is_record(type_: Any) -> bool:
+    """
+    Checks whether a type is a `TypedDict` or a dataclass, checked
+    field by field when it is nested in a record.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type
+
+    ### Return
+    * type `bool`: Whether or not the type is a record
+    """
+    return is_typeddict(type_) or (isclass(type_) and is_dataclass(type_))
+
+def _nullable_record(type_: Any) -> tuple[Any, bool]:
+    """
+    Finds the record of a field annotated with a record or an optional record.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type of the field
+
+    ### Return
+    * type `tuple[Any, bool]`: The record if any, and whether or not `None` is accepted
+    """
+    if _is_record(type_):
+        return type_, False
+    if get_origin(type_) is Union or isinstance(type_, UnionType):
+        args = [arg for arg in get_args(type_) if arg is not _NoneType]
+        if len(args) == 1 and _is_record(args[0]):
+            return args[0], True
+    return None, False
+
+def _field_check(type_: Any) -> tuple[Callable[[Any], bool], FieldCheck]:
+    """
+    Compiles the checks of a field: a predicate for `is_valid`, and a
+    check recording the failures in a report and returning the value,
+    converted when asked, or a marker of failure.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type of the field
+
+    ### Return
+    * type `tuple[Callable[[Any], bool], Callable]`: The predicate and the check
+    """
+    # Dynamic types are always processed, the converted value is kept
+    if isinstance(type_, Typix):
+        check_typix = compile_check(type_)
+
+        def valid_typix(value: Any) -> bool:
+            try:
+                return check_typix(value).state
+            except TypixError:
+                return False
+
+        def check_field(value: Any, convert_: bool, report: ErrorReport, path: str) -> Any:
+            # The fatal errors are reported like the others
+            try:
+                result = check_typix(value)
+            except TypixError as exception:
+                report._add_field(path, type_, value, exception)
+                return _FAILED
+            if result.state:
+                return result.value if convert_ else value
+            report._add_field(path, type_, value, result.exception)
+            return _FAILED
+        return valid_typix, check_field
+
+    # Nested records are checked with their own field table
+    record, nullable = _nullable_record(type_)
+    if record is not None:
+        schema = compile_record(record)
+
+        def valid_record(value: Any) -> bool:
+            return (nullable and value is None) or schema.is_valid(value)
+
+        def check_record(value: Any, convert_: bool, report: ErrorReport, path: str) -> Any:
+            if nullable and value is None:
+                return None
+            return schema._check(value, convert_, report, f'{path}.')
+        return valid_record, check_record
+
+    # The containers and the unions of records check their records field by field
+    if _has_record(type_):
+        return _structural_check(type_)
+
+    valid = compile_valid(type_)
+    # The members of an union are tried in order
+    if get_origin(type_) is Union or isinstance(type_, UnionType):
+        targets = tuple(arg for arg in get_args(type_) if arg is not _NoneType)
+    else:
+        targets = (type_,)
+
+    def check_value(value: Any, convert_: bool, report: ErrorReport, path: str) -> Any:
+        if valid(value):
+            return value
+        reason = None
+        if convert_:
+            for target in targets:
+                try:
+                    converted = convert(value, target)
+                except (ValueError, TypeError, OverflowError):
+                    continue
+                # A conversion is only accepted if its result matches the type
+                if valid(converted):
+                    return converted
+            # The message is only built if it is read
+            reason = ConversionError(value, type_)
+        report._add_field(path, type_, value, reason)
+        return _FAILED
+    return valid, check_value
+
+def _has_record(type_: Any) -> bool:
+    """
+    Checks whether a type is a record or contains one in its arguments,
+    like `list[Node]` or `dict[str, Node] | None`.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type
+
+    ### Return
+    * type `bool`: Whether or not a record is found
+    """
+    if _is_record(type_):
+        return True
+    if isinstance(type_, Typix) or get_origin(type_) is Literal:
+        return False
+    return any(_has_record(arg) for arg in get_args(type_))
+
+def _structural_check(type_: Any) -> tuple[Callable[[Any], bool], FieldCheck]:
+    """
+    Compiles the checks of a field whose type contains records: a union,
+    a sequence, a set or a mapping, each item being checked with the
+    checks of its own type, so that the records are checked field by field.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type of the field
+
+    ### Return
+    * type `tuple[Callable[[Any], bool], Callable]`: The predicate and the check
+    """
+    origin = get_origin(type_)
+    args = get_args(type_)
+
+    if origin is Annotated:
+        return _field_check(args[0])
+
+    if origin is Union or isinstance(type_, UnionType):
+        nullable = _NoneType in args
+        members = tuple(_field_check(arg) for arg in args if arg is not _NoneType)
+        # `Optional[X]` reports the failures of `X` with their own path
+        if len(members) == 1:
+            valid_member, check_member = members[0]
+
+            def valid_optional(value: Any) -> bool:
+                return value is None or valid_member(value)
+
+            def check_optional(value: Any, convert_: bool, report: ErrorReport, path: str) -> Any:
+                if value is None:
+                    return None
+                return check_member(value, convert_, report, path)
+            return valid_optional, check_optional
+
+        def valid_union(value: Any) -> bool:
+            return (nullable and value is None) or any(valid(value) for valid, _ in members)
+
+        def check_union(value: Any, convert_: bool, report: ErrorReport, path: str) -> Any:
+            if nullable and value is None:
+                return None
+            for valid, check in members:
+                if valid(value):
+                    return check(value, convert_, report, path)
+            if convert_:
+                # The members are tried in order, their failures are dropped
+                for _, check in members:
+                    result = check(value, True, ErrorReport(), path)
+                    if result is not _FAILED:
+                        return result
+            report._add_field(path, type_, value)
+            return _FAILED
+        return valid_union, check_union
+
+    if issubclass(origin, Mapping):
+        valid_key, check_key = _field_check(args[0]) if args else (None, None)
+        valid_item, check_item = _field_check(args[1]) if len(args) == 2 else (None, None)
+        # The abstract mappings are converted to dictionaries
+        container = dict if getattr(origin, '__abstractmethods__', None) else origin
+
+        def valid_mapping(value: Any) -> bool:
+            if not isinstance(value, origin):
+                return False
+            for key, item in value.items():
+                if valid_key is not None and not valid_key(key):
+                    return False
+                if valid_item is not None and not valid_item(item):
+                    return False
+            return True
+
+        def check_mapping(value: Any, convert_: bool, report: ErrorReport, path: str) -> Any:
+            if not isinstance(value, Mapping if convert_ else origin):
+                report._add_field(path, type_, value)
+                return _FAILED
+            failed = False
+            items = {}
+            for key, item in value.items():
+                if check_key is not None:
+                    key = check_key(key, convert_, report, f'{path}.{key}')
+                    if key is _FAILED:
+                        failed = True
+                        continue
+                if check_item is not None:
+                    item = check_item(item, convert_, report, f'{path}.{key}')
+                    if item is _FAILED:
+                        failed = True
+                        continue
+                items[key] = item
+            if failed:
+                return _FAILED
+            return container(items) if convert_ else value
+        return valid_mapping, check_mapping
+
+    # The tuples like `tuple[int, Node]` have a check per position
+    variadic = not issubclass(origin, tuple) or (len(args) == 2 and args[1] is Ellipsis)
+    checks = (_field_check(args[0]),) if variadic else tuple(_field_check(arg) for arg in args)
+    # The abstract collections are converted to lists or sets
+    if not getattr(origin, '__abstractmethods__', None):
+        container = origin
+    else:
+        container = set if issubclass(origin, AbstractSet) else list
+
+    def valid_items(value: Any) -> bool:
+        if not isinstance(value, origin) or isinstance(value, (str, bytes, Mapping)):
+            return False
+        if variadic:
+            valid = checks[0][0]
+            for item in value:
+                if not valid(item):
+                    return False
+            return True
+        if len(value) != len(checks):
+            return False
+        for (valid, _), item in zip(checks, value):
+            if not valid(item):
+                return False
+        return True
+
+    def check_items(value: Any, convert_: bool, report: ErrorReport, path: str) -> Any:
+        # The arrays decoded from JSON are lists, converted to the container
+        accepted = (list, tuple, set, frozenset) if convert_ else origin
+        if (
+            not isinstance(value, accepted) or isinstance(value, (str, bytes, Mapping))
+            or (not variadic and len(value) != len(checks))
+        ):
+            report._add_field(path, type_, value)
+            return _FAILED
+        failed = False
+        items = []
+        for index, item in enumerate(value):
+            check = checks[0][1] if variadic else checks[index][1]
+            item = check(item, convert_, report, f'{path}[{index}]')
+            if item is _FAILED:
+                failed = True
+            else:
+                items.append(item)
+        if failed:
+            return _FAILED
+        return container(items) if convert_ else value
+    return valid_items, check_items
+
+class RecordSchema:
+    """
+    A record type compiled into a flat table of fields, with the sets of
+    the required and optional fields and a check per field: a `TypedDict`,
+    a dataclass or a class with annotations. Validates the dictionaries
+    decoded from JSON in one pass over the table, optionally converting
+    the fields, and exports a JSON Schema built once. The annotations are
+    only resolved on the first use, so that recursive records are supported.
+    Should not be instanciated directly, use `compile_record` instead.
+    """
+    __slots__ = ('__cls', '__kind', '__required', '__optional', '__fields', '__json_schema')
+
+    def __init__(self, cls: type):
+        """
+        A record type compiled into a flat table of fields.
+        Should not be instanciated directly, use `compile_record` instead.
+
+        ### Arguments
+        * `cls`: `type`\n
+            The `TypedDict`, the dataclass or the annotated class
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+
+        ### Raises
+        * `TypeError`\n
+            When the class has no annotated field
+        """
+        self.__cls = cls
+        self.__fields = None
+        self.__json_schema = None
+
+        if is_typeddict(cls):
+            self.__kind = TYPED_DICT
+            required = cls.__required_keys__
+            optional = cls.__optional_keys__
+        elif is_dataclass(cls):
+            self.__kind = DATACLASS
+            fields = [field for field in dataclass_fields(cls) if field.init]
+            required = frozenset(
+                field.name for field in fields
+                if field.default is _NO_DEFAULT and field.default_factory is _NO_DEFAULT
+            )
+            optional = frozenset(field.name for field in fields) - required
+        else:
+            self.__kind = CLASS
+            names = [
+                name for klass in reversed(cls.__mro__)
+                for name, annotation in getattr(klass, '__annotations__', {}).items()
+                if get_origin(annotation) is not ClassVar and annotation is not ClassVar
+                and not (isinstance(annotation, str) and annotation.startswith('ClassVar'))
+            ]
+            if not names:
+                raise TypeError(f"'{cls.__qualname__}' has no annotated field")
+            required = frozenset(name for name in names if not hasattr(cls, name))
+            optional = frozenset(names) - required
+
+        self.__required = frozenset(required)
+        self.__optional = frozenset(optional)
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"<{class_name}: {self.__cls.__qualname__}>"
+
+    @property
+    def cls(self) -> type:
+        """
+        ### Property
+        `cls`: `type`\n
+            The record type
+        """
+        return self.__cls
+
+    @property
+    def kind(self) -> str:
+        """
+        ### Property
+        `kind`: `str`\n
+            The kind of record, one of `'typed_dict'`, `'dataclass'` and `'class'`
+        """
+        return self.__kind
+
+    @property
+    def required(self) -> frozenset[str]:
+        """
+        ### Property
+        `required`: `frozenset[str]`\n
+            The names of the fields that must be present
+        """
+        return self.__required
+
+    @property
+    def optional(self) -> frozenset[str]:
+        """
+        ### Property
+        `optional`: `frozenset[str]`\n
+            The names of the fields that can be missing
+        """
+        return self.__optional
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        """
+        ### Property
+        `fields`: `dict[str, Any]`\n
+            The type of each field, in the order of the declaration
+        """
+        return {name: type_ for name, type_, _, _, _ in self.__table()}
+
+    def __table(self) -> tuple[tuple[str, Any, bool, Callable, FieldCheck], ...]:
+        """
+        Compiles the table of the fields on the first use.
+
+        ### Return
+        * type `tuple[tuple[str, Any, bool, Callable, Callable], ...]`: The
+        `(name, type, required, predicate, check)` of each field
+        """
+        table = self.__fields
+        if table is not None:
+            return table
+
+        cls = self.__cls
+        type_hints = get_type_hints(cls)
+        if self.__kind == DATACLASS:
+            names = [field.name for field in dataclass_fields(cls) if field.init]
+        else:
+            names = [name for name in type_hints if name in self.__required or name in self.__optional]
+        table = []
+        for name in names:
+            type_ = type_hints.get(name, Any)
+            table.append((name, type_, name in self.__required) + _field_check(type_))
+        table = self.__fields = tuple(table)
+        return table
+
+    def is_valid(self, record: Any) -> bool:
+        """
+        Checks whether a record is valid: it must be a mapping with every
+        required field, and each field must match its type. The other keys
+        are ignored. Nothing is allocated.
+
+        ### Arguments
+        * `record`: `Any`\n
+            The record, like a dictionary decoded from JSON
+
+        ### Return
+        * type `bool`: Whether or not the record is valid
+        """
+        if type(record) is not dict and not isinstance(record, Mapping):
+            return False
+        for name, _, required, valid, _ in self.__fields or self.__table():
+            value = record.get(name, MISSING)
+            if value is MISSING:
+                if required:
+                    return False
+            elif not valid(value):
+                return False
+        return True
+
+    def _check(self, record: Any, convert_: bool, report: ErrorReport, prefix: str = '') -> Any:
+        """
+        Checks every field of a record in one pass over the table, adding
+        each failure to a report with the dotted path of the field.
+
+        ### Arguments
+        * `record`: `Any`\n
+            The record
+        * `convert_`: `bool`\n
+            Whether or not to convert the fields that do not match their type
+        * `report`: `ErrorReport`\n
+            The report of the failures
+        * `prefix`: `Optional[str]`\n
+            The path of the record in its parent record.
+            Defaults to `''`
+
+        ### Return
+        * type `Any`: The record, the converted record, or a marker of failure
+        """
+        if type(record) is not dict and not isinstance(record, Mapping):
+            report._add_field(prefix[:-1] or None, self.__cls, record)
+            return _FAILED
+
+        failed = False
+        values = {}
+        for name, type_, required, _, check in self.__fields or self.__table():
+            value = record.get(name, MISSING)
+            if value is MISSING:
+                if required:
+                    report._add_field(prefix + name, type_, MISSING)
+                    failed = True
+                continue
+            value = check(value, convert_, report, prefix + name)
+            if value is _FAILED:
+                failed = True
+            elif convert_:
+                values[name] = value
+
+        if failed:
+            return _FAILED
+        if not convert_:
+            return record
+        if self.__kind == DATACLASS:
+            return self.__cls(**values)
+        return values
+
+    def validate(self, record: Any, convert: bool = False) -> CheckResult:
+        """
+        Checks every field of a record in one pass, like `is_valid`, and
+        reports all the failures with the dotted path of their field.
+        When asked, the fields that do not match their type are converted
+        like with `Convert`, and the fields annotated with a dynamic type
+        keep their processed value.
+
+        ### Arguments
+        * `record`: `Any`\n
+            The record, like a dictionary decoded from JSON
+        * `convert`: `Optional[bool]`\n
+            Whether or not to convert the fields. The value of the result
+            is then a new dictionary of the fields, or an instance of the
+            dataclass, and the other keys are dropped.
+            Defaults to `False`
+
+        ### Return
+        * type `CheckResult`: The result, its value is the record or the
+        converted record, and its exception a `ReportError` listing the
+        failures of the fields
+        """
+        report = ErrorReport()
+        value = self._check(record, convert, report)
+        if value is _FAILED:
+            return CheckResult(False, ReportError(report), record)
+        return CheckResult(True, value=value)
+
+    def json_schema(self) -> dict:
+        """
+        Exports the record as a JSON Schema. The schema is built once from
+        the table of the fields, the nested records are defined in `$defs`.
+        The dynamic types are exported as the type they take as first
+        argument, like `int` for `Strict(int)`, and the unknown types
+        accept any value.
+
+        ### Return
+        * type `dict`: The schema, the same dictionary is returned
+        each time and must not be modified
+        """
+        if self.__json_schema is None:
+            definitions = {}
+            names = {}
+            reference = _define(self, definitions, names)
+            self.__json_schema = {'$schema': JSON_SCHEMA_DIALECT, **reference, '$defs': definitions}
+        return self.__json_schema
+
+    def _object_schema(self, definitions: dict, names: dict) -> dict:
+        """
+        Builds the schema of the object of the record.
+
+        ### Arguments
+        * `definitions`: `dict`\n
+            The schemas of the records by name, filled with the nested records
+        * `names`: `dict`\n
+            The name of each defined record type
+
+        ### Return
+        * type `dict`: The schema of the object
+        """
+        table = self.__table()
+        return {
+            'type': 'object',
+            'title': self.__cls.__name__,
+            'properties': {name: _type_schema(type_, definitions, names) for name, type_, _, _, _ in table},
+            'required': [name for name, _, required, _, _ in table if required]
+        }
+
+def _define(schema: RecordSchema, definitions: dict, names: dict) -> dict:
+    """
+    Adds the schema of a record to the definitions, once.
+
+    ### Arguments
+    * `schema`: `RecordSchema`\n
+        The compiled record
+    * `definitions`: `dict`\n
+        The schemas of the records by name
+    * `names`: `dict`\n
+        The name of each defined record type
+
+    ### Return
+    * type `dict`: The reference to the definition
+    """
+    cls = schema.cls
+    name = names.get(cls)
+    if name is None:
+        name = cls.__name__
+        index = 1
+        while name in definitions:
+            index += 1
+            name = f'{cls.__name__}{index}'
+        names[cls] = name
+        # Reserved first, so that recursive records refer to it
+        definitions[name] = {}
+        definitions[name] = schema._object_schema(definitions, names)
+    return {'$ref': f'#/$defs/{name}'}
+
+def _type_schema(type_: Any, definitions: dict, names: dict) -> dict:
+    """
+    Builds the JSON Schema of a type.
+
+    ### Arguments
+    * `type_`: `Any`\n
+        The type
+    * `definitions`: `dict`\n
+        The schemas of the records by name
+    * `names`: `dict`\n
+        The name of each defined record type
+
+    ### Return
+    * type `dict`: The schema
+    """
+    if type_ is Any or isinstance(type_, (TypeVar, ForwardRef, str)):
+        return {}
+    if type_ is None:
+        return {'type': 'null'}
+
+    if isinstance(type_, Typix):
+        args = type_.args
+        if args and (isclass(args[0]) or get_origin(args[0]) is not None or isinstance(args[0], tuple)):
+            return _type_schema(args[0], definitions, names)
+        return {}
+
+    if isinstance(type_, tuple):
+        return {'anyOf': [_type_schema(arg, definitions, names) for arg in type_]}
+    if isinstance(type_, NewType):
+        return _type_schema(type_.__supertype__, definitions, names)
+
+    origin = get_origin(type_)
+    args = get_args(type_)
+    if origin is Union or isinstance(type_, UnionType):
+        return {'anyOf': [_type_schema(arg, definitions, names) for arg in args]}
+    if origin is Literal:
+        return {'enum': list(args)}
+    if origin is Annotated:
+        return _type_schema(type_.__origin__, definitions, names)
+
+    if _is_record(type_):
+        return _define(compile_record(type_), definitions, names)
+
+    if origin is not None and isclass(origin):
+        if issubclass(origin, Mapping):
+            schema = {'type': 'object'}
+            if len(args) == 2:
+                schema['additionalProperties'] = _type_schema(args[1], definitions, names)
+            return schema
+        if issubclass(origin, tuple) and not (len(args) == 2 and args[1] is Ellipsis):
+            items = [_type_schema(arg, definitions, names) for arg in args]
+            return {'type': 'array', 'prefixItems': items, 'minItems': len(items), 'maxItems': len(items)}
+        schema = {'type': 'array'}
+        if args:
+            schema['items'] = _type_schema(args[0], definitions, names)
+        if issubclass(origin, (set, frozenset)):
+            schema['uniqueItems'] = True
+        return schema
+
+    if isclass(type_):
+        if issubclass(type_, Enum):
+            return {'enum': [member.value for member in type_]}
+        for klass in type_.__mro__:
+            schema = _SCALAR_SCHEMAS.get(klass)
+            if schema is not None:
+                return dict(schema)
+    return {}
+
+_cached_compile_record = lru_cache(maxsize=CACHE_SIZE)(RecordSchema)
+
+def compile_record(cls: type) -> RecordSchema:
+    """
+    Compiles a `TypedDict`, a dataclass or a class with annotations into
+    a `RecordSchema`, validating the dictionaries decoded from JSON.
+    The schemas are memoized by type in a bounded LRU cache.
+
+    ### Arguments
+    * `cls`: `type`\n
+        The record type
+
+    ### Return
+    * type `RecordSchema`: The compiled record
+
+    ### Raises
+    * `TypeError`\n
+        When the class has no annotated field
+
+    .. doctest
+        >>> from typing import TypedDict
+        >>> class Point(TypedDict):
+        ...     x: int
+        ...     y: int
+        >>> schema = compile_record(Point)
+        >>> schema.is_valid({'x': 1, 'y': 2})
+        True
+        >>> schema.validate({'x': '1', 'y': 2}, convert=True).value
+        {'x': 1, 'y': 2}
+        >>> print(schema.validate({'x': 'a'}).exception)
+        2 failures
+          x: expected 'int', got 'str'
+          y: expected 'int', got 'Missing'
+
+        The records nested in containers are checked field by field
+        >>> from dataclasses import dataclass
+        >>> @dataclass
+        ... class Item:
+        ...     count: int
+        >>> @dataclass
+        ... class Basket:
+        ...     items: list[Item]
+        >>> schema = compile_record(Basket)
+        >>> schema.is_valid({'items': [{'count': 1}, {'count': 2}]})
+        True
+        >>> print(schema.validate({'items': [{'count': 1}, {'count': 'zz'}]}, convert=True).exception)
+        1 failure
+          items[1].count: expected 'int', got 'str' (Cannot convert 'str' to 'int')
+        >>> schema.validate({'items': [{'count': '1'}]}, convert=True).value
+        Basket(items=[Item(count=1)])
+    """
+    return _cached_compile_record(cls)
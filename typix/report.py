@@ -0,0 +1,415 @@
+from typing import Any, Iterator
+from types import FunctionType
+from contextlib import contextmanager
+
+from .error import TypixError
+from .context import Frame, _current_report
+from .instrument import profiler
+from .utils import display_type
+
+def _plural(count: int) -> str:
+    return f"{count} failure" if count == 1 else f"{count} failures"
+
+class Failure:
+    """
+    A failure collected in an `ErrorReport`: where it happened, the
+    expected type and the value that failed. The message, and the
+    exception of a deferred fatal error, are only built when they are read.
+    Should not be instanciated directly.
+    """
+    __slots__ = ('__index', '__func', '__arg', '__expected', '__got', '__reason', '__deferred')
+
+    def __init__(
+        self,
+        index: int | None,
+        func: FunctionType | None,
+        arg: str | None,
+        expected: Any,
+        got: Any,
+        reason: BaseException = None,
+        deferred: tuple = None
+    ):
+        """
+        A failure collected in an `ErrorReport`.
+        Should not be instanciated directly.
+
+        ### Arguments
+        * `index`: `int | None`\n
+            The index of the value in the batch if any
+        * `func`: `function | None`\n
+            The function containing the argument if any
+        * `arg`: `str | None`\n
+            The name of the argument if any
+        * `expected`: `Any`\n
+            The type or the dynamic type the value failed
+        * `got`: `Any`\n
+            The value that failed
+        * `reason`: `Optional[BaseException]`\n
+            The error returned by the dynamic type if any.
+            Defaults to `None`
+        * `deferred`: `Optional[tuple[type, tuple]]`\n
+            The type of the error and the arguments to build it with,
+            when it is only built on read.
+            Defaults to `None`
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.__index = index
+        self.__func = func
+        self.__arg = arg
+        self.__expected = expected
+        self.__got = got
+        self.__reason = reason
+        self.__deferred = deferred
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"<{class_name}: {self.location}>"
+
+    def _shifted(self, offset: int) -> 'Failure':
+        """
+        Copies the failure with its index in a larger batch.
+
+        ### Arguments
+        * `offset`: `int`\n
+            The index of the first value of the chunk in the batch
+
+        ### Return
+        * type `Failure`: The failure with the shifted index
+        """
+        index = None if self.__index is None else self.__index + offset
+        return Failure(
+            index, self.__func, self.__arg, self.__expected, self.__got, self.__reason, self.__deferred
+        )
+
+    @property
+    def path(self) -> tuple:
+        """
+        ### Property
+        `path`: `tuple`\n
+            The index in the batch, the qualified name of the function
+            and the name of the argument, when they are known
+        """
+        path = () if self.__index is None else (self.__index,)
+        if self.__func is not None:
+            path += (self.__func.__qualname__,)
+        if self.__arg is not None:
+            path += (self.__arg,)
+        return path
+
+    @property
+    def location(self) -> str:
+        """
+        ### Property
+        `location`: `str`\n
+            The path of the failure as a string, like `[3] load.count`
+        """
+        names = '.'.join(str(part) for part in self.path if not isinstance(part, int))
+        if self.__index is None:
+            return names or '<value>'
+        return f"[{self.__index}] {names}".rstrip()
+
+    @property
+    def expected(self) -> Any:
+        """
+        ### Property
+        `expected`: `Any`\n
+            The type or the dynamic type the value failed
+        """
+        return self.__expected
+
+    @property
+    def got(self) -> Any:
+        """
+        ### Property
+        `got`: `Any`\n
+            The value that failed
+        """
+        return self.__got
+
+    @property
+    def reason(self) -> BaseException | None:
+        """
+        ### Property
+        `reason`: `BaseException`\n
+            The error returned by the dynamic type if any
+        """
+        if self.__deferred is not None:
+            error_type, args = self.__deferred
+            self.__reason = error_type(*args)
+            self.__deferred = None
+        return self.__reason
+
+    @property
+    def message(self) -> str:
+        """
+        ### Property
+        `message`: `str`\n
+            The rendered description of the failure
+        """
+        message = (
+            f"{self.location}: expected '{display_type(self.__expected)}', "
+            f"got '{display_type(type(self.__got))}'"
+        )
+        reason = self.reason
+        if reason is not None:
+            message += f" ({reason})"
+        return message
+
+class ErrorReport:
+    """
+    The failures gathered by `collect_errors`. If this object is used
+    in an `if` statement, it will be `True` when nothing failed.
+    Should not be instanciated directly, use `collect_errors` instead.
+    """
+    __slots__ = ('__failures', '__pending', '__index')
+
+    def __init__(self):
+        """
+        The failures gathered by `collect_errors`.
+        Should not be instanciated directly, use `collect_errors` instead.
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.__failures: list[Failure] = []
+        self.__pending = False
+        self.__index = None
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"<{class_name}: {_plural(len(self.__failures))}>"
+
+    def __bool__(self) -> bool:
+        return not self.__failures
+
+    def __len__(self) -> int:
+        return len(self.__failures)
+
+    def __iter__(self) -> Iterator[Failure]:
+        return iter(self.__failures)
+
+    @property
+    def failures(self) -> list[Failure]:
+        """
+        ### Property
+        `failures`: `list[Failure]`\n
+            The failures, in the order they happened
+        """
+        return self.__failures
+
+    def _add(self, frame: Frame, typix: Any, reason: BaseException) -> None:
+        """
+        Adds the fatal error of the outermost processing of an argument.
+        The call of the function is skipped, unless the return value failed.
+
+        ### Arguments
+        * `frame`: `Frame`\n
+            The processed frame
+        * `typix`: `Typix`\n
+            The dynamic type annotating the argument
+        * `reason`: `BaseException`\n
+            The fatal error
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        self.__failures.append(Failure(self.__index, frame.func, frame.arg, typix, frame.value, reason))
+        if frame.arg != 'return':
+            self.__pending = True
+
+    def _defer(self, frame: Frame, typix: Any, error_type: type, args: tuple) -> Failure:
+        """
+        Adds the fatal error of the outermost processing of an argument,
+        without building its exception, see `_add`.
+
+        ### Arguments
+        * `frame`: `Frame`\n
+            The processed frame
+        * `typix`: `Typix`\n
+            The dynamic type annotating the argument
+        * `error_type`: `type`\n
+            The type of the fatal error
+        * `args`: `tuple`\n
+            The arguments to build the fatal error with
+
+        ### Return
+        * type `Failure`: The added failure, building the error when it is read
+        """
+        failure = Failure(self.__index, frame.func, frame.arg, typix, frame.value, None, (error_type, args))
+        self.__failures.append(failure)
+        if frame.arg != 'return':
+            self.__pending = True
+        return failure
+
+    def _add_value(self, index: int, expected: Any, got: Any, reason: BaseException = None) -> None:
+        """
+        Adds a value of a batch that failed its check.
+
+        ### Arguments
+        * `index`: `int`\n
+            The index of the value in the batch
+        * `expected`: `Any`\n
+            The type the value was checked with
+        * `got`: `Any`\n
+            The value
+        * `reason`: `Optional[BaseException]`\n
+            The error returned by the dynamic type if any.
+            Defaults to `None`
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        self.__failures.append(Failure(index, None, None, expected, got, reason))
+
+    def _add_field(self, path: str | None, expected: Any, got: Any, reason: BaseException = None) -> None:
+        """
+        Adds a field of a record that failed its check.
+
+        ### Arguments
+        * `path`: `str | None`\n
+            The dotted path of the field, `None` for the record itself
+        * `expected`: `Any`\n
+            The type of the field
+        * `got`: `Any`\n
+            The value of the field
+        * `reason`: `Optional[BaseException]`\n
+            The error returned by the dynamic type or the conversion if any.
+            Defaults to `None`
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        self.__failures.append(Failure(self.__index, None, path, expected, got, reason))
+
+    def _extend(self, failures: list[Failure], offset: int) -> None:
+        """
+        Adds the failures collected by a chunk of a batch.
+
+        ### Arguments
+        * `failures`: `list[Failure]`\n
+            The failures of the chunk, indexed from the start of the chunk
+        * `offset`: `int`\n
+            The index of the first value of the chunk in the batch
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        self.__failures.extend(failure._shifted(offset) for failure in failures)
+
+    def _pop_pending(self) -> bool:
+        """
+        Checks and clears whether arguments failed since the last call.
+
+        ### Return
+        * type `bool`: Whether or not arguments failed
+        """
+        pending = self.__pending
+        self.__pending = False
+        return pending
+
+    def _at(self, index: int | None) -> None:
+        """
+        Sets the index in the batch of the next failures.
+
+        ### Arguments
+        * `index`: `int | None`\n
+            The index of the processed item of a batch
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        self.__index = index
+
+    def render(self, limit: int = None) -> str:
+        """
+        Renders the failures, one per line.
+
+        ### Arguments
+        * `limit`: `Optional[int]`\n
+            The maximum number of failures rendered.
+            Defaults to `None`: every failure is rendered
+
+        ### Return
+        * type `str`: The rendered report
+        """
+        failures = self.__failures if limit is None else self.__failures[:limit]
+        lines = [_plural(len(self.__failures))]
+        lines += [f"  {failure.message}" for failure in failures]
+        if len(failures) < len(self.__failures):
+            lines.append(f"  ... {len(self.__failures) - len(failures)} more")
+        return '\n'.join(lines)
+
+    def raise_errors(self) -> None:
+        """
+        Raises a single `ReportError` if anything failed.
+
+        ### Return
+        * type `NoneType`: Returns `None`
+
+        ### Raises
+        * `ReportError`\n
+            When the report contains failures
+        """
+        if self.__failures:
+            raise ReportError(self)
+
+class ReportError(TypixError):
+    """
+    Raised once by `collect_errors` when values failed.
+    The message is only built when it is read.
+    """
+    def __init__(self, report: ErrorReport):
+        """
+        Raised once by `collect_errors` when values failed.
+
+        ### Arguments
+        * `report`: `ErrorReport`\n
+            The report of the failures
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        super().__init__()
+        self.report = report
+
+    def __str__(self) -> str:
+        return self.report.render(limit=20)
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (self.report,)
+
+@contextmanager
+def collect_errors(raise_errors: bool = True) -> Iterator[ErrorReport]:
+    """
+    A context manager gathering the fatal errors of the current thread or
+    asyncio task into a single `ErrorReport` instead of raising them. Every
+    argument of a decorated function is processed, and the function is not
+    called when an argument failed: the call returns `None`. The values of
+    `typecheck_many` and the calls of `processor.map` that fail are added
+    with their index. No error message is built until the report is rendered.
+
+    ### Arguments
+    * `raise_errors`: `Optional[bool]`\n
+        Whether or not to raise a single `ReportError` when leaving
+        the block if anything failed.
+        Defaults to `True`
+
+    ### Return
+    * type `Iterator[ErrorReport]`: The report, filled by the block
+
+    ### Raises
+    * `ReportError`\n
+        When leaving the block if anything failed and `raise_errors` is `True`
+    """
+    report = ErrorReport()
+    token = _current_report.set(report)
+    profiler._collect(True)
+    try:
+        yield report
+    finally:
+        _current_report.reset(token)
+        profiler._collect(False)
+    if raise_errors:
+        report.raise_errors()
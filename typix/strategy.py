@@ -0,0 +1,287 @@
+from typing import Any, Iterable, Iterator, Sequence
+from itertools import islice
+from random import Random
+from time import perf_counter
+
+class Strategy:
+    """
+    Describes how much of a collection is inspected when it is checked
+    against a `GenericAlias`. Keeps strict typing on huge collections
+    with a predictable worst-case cost.
+    Should not be instanciated directly, use the class methods instead.
+    """
+    FULL = 'full'
+    FIRST = 'first'
+    SAMPLE = 'sample'
+    BUDGET = 'budget'
+    STREAM = 'stream'
+
+    def __init__(
+        self,
+        kind: str,
+        items: int = None,
+        seconds: float = None,
+        seed: Any = None,
+        collect: bool = False
+    ):
+        """
+        Describes how much of a collection is inspected when it is checked.
+        Should not be instanciated directly, use the class methods instead.
+
+        ### Arguments
+        * `kind`: `str`\n
+            The kind of strategy, one of `FULL`, `FIRST`, `SAMPLE`, `BUDGET` and `STREAM`
+        * `items`: `Optional[int]`\n
+            The maximum number of items to inspect.
+            Defaults to `None`: no limit
+        * `seconds`: `Optional[float]`\n
+            The maximum duration of the check.
+            Defaults to `None`: no limit
+        * `seed`: `Optional[Any]`\n
+            The seed of the random sampling.
+            Defaults to `None`
+        * `collect`: `Optional[bool]`\n
+            Whether or not a stream collects its errors instead of raising them.
+            Defaults to `False`
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.__kind = kind
+        self.__items = items
+        self.__seconds = seconds
+        self.__random = Random(seed)
+        self.__collect = collect
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        limits = []
+        if self.__items is not None:
+            limits.append(f"items={self.__items}")
+        if self.__seconds is not None:
+            limits.append(f"seconds={self.__seconds}")
+        return f"<{class_name}: {self.__kind}({', '.join(limits)})>"
+
+    @classmethod
+    def full(cls) -> 'Strategy':
+        """
+        Inspects every item of the collections.
+
+        ### Return
+        * type `Strategy`: The strategy
+        """
+        return cls(cls.FULL)
+
+    @classmethod
+    def first(cls, items: int) -> 'Strategy':
+        """
+        Inspects the first items of each collection.
+
+        ### Arguments
+        * `items`: `int`\n
+            The number of items to inspect in each collection
+
+        ### Return
+        * type `Strategy`: The strategy
+        """
+        return cls(cls.FIRST, items=items)
+
+    @classmethod
+    def sample(cls, items: int, seed: Any = None) -> 'Strategy':
+        """
+        Inspects a random sample of the items of each collection.
+        Collections that are not sequences are copied into a list first.
+
+        ### Arguments
+        * `items`: `int`\n
+            The number of items to inspect in each collection
+        * `seed`: `Optional[Any]`\n
+            The seed of the random sampling.
+            Defaults to `None`
+
+        ### Return
+        * type `Strategy`: The strategy
+        """
+        return cls(cls.SAMPLE, items=items, seed=seed)
+
+    @classmethod
+    def budget(cls, seconds: float = None, items: int = None) -> 'Strategy':
+        """
+        Inspects the items in order until a budget of time or of items
+        is spent for the whole check.
+
+        ### Arguments
+        * `seconds`: `Optional[float]`\n
+            The maximum duration of the check.
+            Defaults to `None`: no limit
+        * `items`: `Optional[int]`\n
+            The maximum number of items to inspect.
+            Defaults to `None`: no limit
+
+        ### Return
+        * type `Strategy`: The strategy
+        """
+        return cls(cls.BUDGET, items=items, seconds=seconds)
+
+    @classmethod
+    def stream(cls, collect: bool = False) -> 'Strategy':
+        """
+        Validates iterators lazily: an iterator checked against an iterable
+        `GenericAlias` like `Iterator[int]` is wrapped into a `Stream` that
+        validates each item as it is pulled. The check itself succeeds and
+        returns the stream as value. Other collections are fully inspected.
+
+        ### Arguments
+        * `collect`: `Optional[bool]`\n
+            Whether or not to collect the errors in the `errors` list of the
+            stream and yield the invalid items unchanged, instead of raising
+            the errors when the items are pulled.
+            Defaults to `False`
+
+        ### Return
+        * type `Strategy`: The strategy
+        """
+        return cls(cls.STREAM, collect=collect)
+
+    @property
+    def kind(self) -> str:
+        """
+        ### Property
+        `kind`: `str`\n
+            The kind of strategy, one of `FULL`, `FIRST`, `SAMPLE`, `BUDGET` and `STREAM`
+        """
+        return self.__kind
+
+    @property
+    def items(self) -> int | None:
+        """
+        ### Property
+        `items`: `int`\n
+            The maximum number of items to inspect if any
+        """
+        return self.__items
+
+    @property
+    def seconds(self) -> float | None:
+        """
+        ### Property
+        `seconds`: `float`\n
+            The maximum duration of the check if any
+        """
+        return self.__seconds
+
+    @property
+    def random(self) -> Random:
+        """
+        ### Property
+        `random`: `Random`\n
+            The random generator of the sampling
+        """
+        return self.__random
+
+    @property
+    def collect(self) -> bool:
+        """
+        ### Property
+        `collect`: `bool`\n
+            Whether or not a stream collects its errors instead of raising them
+        """
+        return self.__collect
+
+class Inspection:
+    """
+    The state of a single check applying a `Strategy`. Counts the
+    inspected items and whether some items were skipped.
+    Should not be instanciated directly.
+    """
+    __slots__ = ('strategy', 'inspected', 'complete', 'deadline')
+
+    def __init__(self, strategy: Strategy):
+        """
+        The state of a single check applying a `Strategy`.
+        Should not be instanciated directly.
+
+        ### Arguments
+        * `strategy`: `Strategy`\n
+            The strategy applied by the check
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.strategy = strategy
+        self.inspected = 0
+        self.complete = True
+        self.deadline = None
+        if strategy.seconds is not None:
+            self.deadline = perf_counter() + strategy.seconds
+
+    def select(self, items: Iterable) -> Iterator:
+        """
+        Selects the items of a collection to inspect.
+
+        ### Arguments
+        * `items`: `Iterable`\n
+            The items of the collection
+
+        ### Return
+        * type `Iterator`: The items to inspect
+        """
+        strategy = self.strategy
+        kind = strategy.kind
+        limit = strategy.items
+
+        if kind == Strategy.FIRST:
+            if hasattr(items, '__len__') and len(items) > limit:
+                self.complete = False
+            return self._count(islice(items, limit))
+
+        if kind == Strategy.SAMPLE:
+            if not isinstance(items, Sequence):
+                items = list(items)
+            if len(items) <= limit:
+                return self._count(items)
+            self.complete = False
+            indices = strategy.random.sample(range(len(items)), limit)
+            return self._count(items[index] for index in indices)
+
+        if kind == Strategy.BUDGET:
+            return self._budget(items)
+
+        return self._count(items)
+
+    def _count(self, items: Iterable) -> Iterator:
+        """
+        Counts the inspected items.
+
+        ### Arguments
+        * `items`: `Iterable`\n
+            The items to inspect
+
+        ### Return
+        * type `Iterator`: The items to inspect
+        """
+        for item in items:
+            self.inspected += 1
+            yield item
+
+    def _budget(self, items: Iterable) -> Iterator:
+        """
+        Selects the items in order until the budget of the check is spent.
+
+        ### Arguments
+        * `items`: `Iterable`\n
+            The items of the collection
+
+        ### Return
+        * type `Iterator`: The items to inspect
+        """
+        limit = self.strategy.items
+        deadline = self.deadline
+        for item in items:
+            if (limit is not None and self.inspected >= limit) or (
+                deadline is not None and perf_counter() >= deadline
+            ):
+                self.complete = False
+                return
+            self.inspected += 1
+            yield item
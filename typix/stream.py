@@ -0,0 +1,163 @@
+from typing import Any, Callable, Iterator
+
+from .error import CheckResult, TypixError
+
+class StreamError(TypixError):
+    """
+    Indicates that an item of a stream is invalid.
+    The message is only built when it is read.
+    """
+    def __init__(self, index: int, type_: Any, cause: BaseException = None):
+        """
+        Indicates that an item of a stream is invalid.
+
+        ### Arguments
+        * `index`: `int`\n
+            The index of the item in the stream
+        * `type_`: `Any`\n
+            The type of the items
+        * `cause`: `Optional[BaseException]`\n
+            The error returned by the check of the item if any.
+            Defaults to `None`
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        super().__init__()
+        self.index = index
+        self.type_ = type_
+        self.cause = cause
+
+    def __str__(self) -> str:
+        if self.cause is not None:
+            return f"Item {self.index} of the stream is invalid: {self.cause}"
+        # Imported when read, the checker importing this module is imported by `utils`
+        from .utils import display_type
+        return f"Item {self.index} of the stream is not a valid '{display_type(self.type_)}'"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self)!r})"
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (self.index, self.type_, self.cause)
+
+class Stream:
+    """
+    An iterator validating the items of another iterator as they are
+    pulled, so that a one-shot iterator is neither consumed nor loaded
+    in memory by the check. The processed value of each item is yielded,
+    so that a dynamic type like `Convert` can convert the items.
+    Should not be instanciated directly, check the iterator with
+    `Strategy.stream()` instead.
+    """
+    __slots__ = ('iterator', 'check', 'type_', 'collect', 'errors', 'index')
+
+    def __init__(
+        self,
+        iterator: Iterator,
+        check: Callable[[Any], CheckResult],
+        type_: Any,
+        collect: bool = False
+    ):
+        """
+        An iterator validating the items of another iterator as they are pulled.
+        Should not be instanciated directly.
+
+        ### Arguments
+        * `iterator`: `Iterator`\n
+            The iterator to validate
+        * `check`: `Callable[[Any], CheckResult]`\n
+            The compiled checker of the items
+        * `type_`: `Any`\n
+            The type of the items
+        * `collect`: `Optional[bool]`\n
+            Whether or not to collect the errors in `errors` and yield the
+            invalid items unchanged instead of raising the errors.
+            Defaults to `False`
+
+        ### Return
+        * type `NoneType`: Returns `None` as it is a constructor
+        """
+        self.iterator = iterator
+        self.check = check
+        self.type_ = type_
+        self.collect = collect
+        self.errors = []
+        self.index = 0
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"<{class_name}: {self.iterator!r}>"
+
+    def __iter__(self) -> 'Stream':
+        return self
+
+    def __next__(self) -> Any:
+        return self._validate(next(self.iterator))
+
+    def send(self, value: Any) -> Any:
+        """
+        Sends a value into the validated generator and validates the next item.
+
+        ### Arguments
+        * `value`: `Any`\n
+            The value to send
+
+        ### Return
+        * type `Any`: The next processed item
+        """
+        return self._validate(self.iterator.send(value))
+
+    def throw(self, *args) -> Any:
+        """
+        Raises an exception in the validated generator and validates the next item.
+
+        ### Arguments
+        * `*args`: `tuple`\n
+            The exception to raise
+
+        ### Return
+        * type `Any`: The next processed item
+        """
+        return self._validate(self.iterator.throw(*args))
+
+    def close(self) -> None:
+        """
+        Closes the validated generator if it can be closed.
+
+        ### Return
+        * type `NoneType`: Returns `None`
+        """
+        close = getattr(self.iterator, 'close', None)
+        if close is not None:
+            close()
+
+    def _validate(self, item: Any) -> Any:
+        """
+        Checks an item of the iterator.
+
+        ### Arguments
+        * `item`: `Any`\n
+            The item to check
+
+        ### Return
+        * type `Any`: The processed item, or the item itself when
+        it is invalid and the errors are collected
+
+        ### Raises
+        * `StreamError`\n
+            When the item is invalid and the errors are not collected
+        """
+        index = self.index
+        self.index += 1
+
+        result = self.check(item)
+        if result:
+            return result.value
+
+        # The message is only built if it is read
+        error = StreamError(index, self.type_, result.exception)
+        if not self.collect:
+            raise error
+        self.errors.append(error)
+        return item
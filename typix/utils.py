@@ -1,17 +1,19 @@
-from inspect import isclass
-from types import GenericAlias
-from typing import Any, Iterable, Mapping, _SpecialForm, Union
-import collections.abc as collection
-from abc import ABCMeta
+from types import GenericAlias, NoneType, UnionType, FunctionType, BuiltinFunctionType
+from collections.abc import Callable
+from array import array
+from typing import (
+    Any, Iterable, Optional, Union, Literal, Annotated, TypeVar, ForwardRef, NewType,
+    _SpecialForm, get_origin
+)
+from weakref import ref
 
 from .main import Typix
-from .error import CheckResult
-from .context import Context
-
-# Type Alias for the `typing._GenericAlias` protected class
-# Used in `typecheck` to target `GenericAlias` with typing class support
-_TypingGenericAlias = type(Iterable[int])
-_TypingType = type(Iterable)
+from .error import CheckResult, BatchResult
+from .context import Context, _current_report
+from .strategy import Strategy
+from .checker import compile_alias, compile_check, compile_valid
+from .kinds import TypeKind, CACHE_SIZE, classify, _TypingGenericAlias, _TypingType
+from .instrument import profiler
 
 def istypix(obj: Any) -> bool:
     """
@@ -35,22 +37,24 @@ def istypix(obj: Any) -> bool:
         >>> istypix(5)
         False
     """
-    if isclass(obj):
-        return issubclass(obj, Typix)
-    else:
-        return issubclass(obj.__class__, Typix)
+    # Cheaper than a lookup in the cache of the kinds
+    return isinstance(obj, Typix) or (isinstance(obj, type) and issubclass(obj, Typix))
     
-def match_generic_alias(value: Any, alias: GenericAlias) -> bool:
+def match_generic_alias(value: Any, alias: GenericAlias, vectorize: bool = False) -> bool:
     """
     Utility function that allow support for
     [GenericAlias](https://docs.python.org/3/library/types.html?highlight=genericalias#types.GenericAlias)
-    type checking.
+    type checking. The alias is compiled once by `compile_alias`.
     
     ### Arguments
     * `value`: `Any`\n
         The value to typecheck
     * `alias`: `GenericAlias`\n
         The `GenericAlias` to check with
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists of numbers in bulk
+        as NumPy arrays, see `compile_alias`.
+        Defaults to `False`
     
     ### Return
     * type `bool`: Whether or not the typecheck is successful
@@ -83,47 +87,19 @@ def match_generic_alias(value: Any, alias: GenericAlias) -> bool:
             ...
         NotImplementedError: typing._SpecialForm is currently not supported
     """
-    # NOTE: Probably never will be implemented due to 
-    # the new __class_getitem__ special method. Also, leads
-    # to confusing code, when trying to implement the support.
-    if isinstance(alias, _SpecialForm):
-        raise NotImplementedError("typing._SpecialForm is currently not supported")
-    
-    alias_origin = alias.__origin__
-    alias_args = alias.__args__
-    
-    # Prevent errors due to instanciating `typing` special classes (ex. Iterable)
-    alias_origin_instance = alias_origin
-    if type(alias_origin) is not ABCMeta:
-        alias_origin_instance = alias_origin()
-    
-    # Needs to match the orgin
-    if not isinstance(value, alias_origin):
-        return False
+    return compile_alias(alias, vectorize)(value)
 
-    # Needs to match any of the given type arguments
-    if alias_origin is collection.Mapping or isinstance(alias_origin_instance, Mapping):
-        if len(alias_args) < 2:
-            return False
-        
-        key_type = alias_args[0]
-        value_types = alias_args[1:]
-        
-        keys_typecheck = all(isinstance(key, key_type) for key in value.keys())
-        value_typecheck = all(isinstance(val, value_types) for val in value.values())
-        
-        return keys_typecheck and value_typecheck
-    
-    if alias_origin is collection.Iterable or isinstance(alias_origin_instance, Iterable):
-        return all(isinstance(arg, alias_args) for arg in value)
-    
-    # Always defaults to False
-    return False
-
-def typecheck(value: Any, type_: Any, context: Context = None) -> CheckResult:
+def typecheck(
+    value: Any,
+    type_: Any,
+    context: Context = None,
+    vectorize: bool = False,
+    strategy: Strategy = None
+) -> CheckResult:
     """
     A utility function that check the type of a value. Supports
-    dynamic types and `GenericAlias`.
+    dynamic types and `GenericAlias`. The type is compiled once
+    by `compile_check` and the checker is reused by later calls.
     
     ### Arguments
     * `value`: `Any`\n
@@ -135,6 +111,15 @@ def typecheck(value: Any, type_: Any, context: Context = None) -> CheckResult:
         Useful in that case because invoking `typecheck` does
         not provide argument or function data. Must be provided
         for dynamic type that use function context
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists of numbers in bulk
+        as NumPy arrays, see `compile_alias`.
+        Defaults to `False`
+    * `strategy`: `Optional[Strategy]`\n
+        How much of the collections is inspected, for example
+        `Strategy.sample(100)`. The result reports the strategy
+        and the number of inspected items.
+        Defaults to `None`: every item is inspected
     
     ### Return
     * type `CheckResult`: An object containing the state of the
@@ -155,77 +140,262 @@ def typecheck(value: Any, type_: Any, context: Context = None) -> CheckResult:
         <CheckResult: False>
         >>> typecheck((0, 1, 2), list[int])
         <CheckResult: False>
+        >>> typecheck({'a': [0, 1]}, dict[str, list[int]])
+        <CheckResult: True>
+        >>> typecheck([(0, 'a'), (1, 2)], list[tuple[int, str]])
+        <CheckResult: False>
+        >>> typecheck([0, None], list[int | None])
+        <CheckResult: True>
     """
-    # Tuple recursive support
-    if isinstance(type_, tuple):
-        return CheckResult(
-            any(typecheck(value, t).state for t in type_),
-            value = value,
-            context = context
-        )
+    check = compile_check(type_, vectorize)
+    if profiler.enabled:
+        return profiler.check(check, display_type(type_), value, context, strategy)
+    return check(value, context, strategy)
+
+def is_valid(value: Any, type_: Any, vectorize: bool = False) -> bool:
+    """
+    Checks if a value is valid for a given type, like `typecheck`
+    but only returns the state of the check. Nothing is allocated
+    to check a plain type or a `GenericAlias`.
     
-    # GenericAlias support
-    elif isinstance(type_, (GenericAlias, _TypingGenericAlias)):
-        return CheckResult(
-            match_generic_alias(value, type_),
-            value = value,
-            context = context
-        )
-    
-    # Dynamic Type support
-    elif istypix(type_):
-        type_._value = value
-        type_._function_context = False
-        new_value = type_.process(*type_._args)
-        
-        # Add context data if present
-        if context:
-            type_._arg = context.arg_name
-            type_._func = context.func
-            
-        return CheckResult(
-            type_._fail is None,
-            type_._fail,
-            value = new_value,
-            context = context
-        )
-    
-    # Standard type check
+    ### Arguments
+    * `value`: `Any`\n
+        The value to check
+    * `type_`: `Any`\n
+        The type to check the value with
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists of numbers in bulk
+        as NumPy arrays, see `compile_alias`.
+        Defaults to `False`
+    
+    ### Return
+    * type `bool`: Whether or not the value is valid
+    
+    .. doctest
+        >>> is_valid(0, int)
+        True
+        >>> is_valid([0, 1.0], list[int])
+        False
+        >>> is_valid('0', (int, str))
+        True
+    """
+    return compile_valid(type_, vectorize)(value)
+
+def typecheck_many(
+    values: Iterable,
+    type_: Any,
+    context: Context = None,
+    vectorize: bool = False,
+    strategy: Strategy = None
+) -> BatchResult:
+    """
+    Checks many values against the same type at once. The type is
+    compiled once and no `CheckResult` is built for the plain types
+    and the `GenericAlias`. While the errors are collected with
+    `collect_errors`, the fatal errors do not stop the batch and each
+    failure is added to the report with its index.
+    
+    ### Arguments
+    * `values`: `Iterable`\n
+        The values to check
+    * `type_`: `Any`\n
+        The type to check the values with
+    * `context`: `Optional[Context]`\n
+        Additional data about the argument and the function,
+        see `typecheck`
+    * `vectorize`: `Optional[bool]`\n
+        Whether or not to check large lists of numbers in bulk
+        as NumPy arrays, see `compile_alias`.
+        Defaults to `False`
+    * `strategy`: `Optional[Strategy]`\n
+        How much of the collections is inspected, see `typecheck`.
+        Defaults to `None`: every item is inspected
+    
+    ### Return
+    * type `BatchResult`: An object containing the indices of the
+    failures, their exceptions and the processed values
+    
+    .. doctest
+        >>> result = typecheck_many([0, 1.0, 2, '3'], int)
+        >>> result
+        <BatchResult: 2/4 failed>
+        >>> list(result.failures)
+        [1, 3]
+    """
+    values = list(values)
+    failures = array('q')
+    exceptions = []
+    
+    # Only the dynamic types process the values
+    if strategy is None and classify(type_) is not TypeKind.TYPIX:
+        valid = compile_valid(type_, vectorize)
+        failures.extend(index for index, value in enumerate(values) if not valid(value))
+        exceptions = [None] * len(failures)
     else:
-        return CheckResult(
-            isinstance(value, type_),
-            value = value,
-            context = context
-        )
+        check = compile_check(type_, vectorize)
+        for index, value in enumerate(values):
+            result = check(value, context, strategy)
+            values[index] = result.value
+            if not result:
+                failures.append(index)
+                exceptions.append(result.exception)
+    
+    report = _current_report.get()
+    if report is not None:
+        for index, exception in zip(failures, exceptions):
+            report._add_value(index, type_, values[index], exception)
+    return BatchResult(failures, exceptions, values)
 
-def display_type(type_: Any) -> str:
+def _render_argument(argument: Any) -> str:
     """
-    Generates a string display for a given type. Supports GenericAlias,
-    class instances, and special types from the `typing` module.
+    Generates a string display for an argument of a generic alias
+    or of a dynamic type instance, which can be a value.
+    
+    ### Arguments
+    * `argument`: `Any`\n
+        The argument to display
+    
+    ### Return
+    * type `str`: A string representing the argument as text
+    """
+    if argument is None or argument is NoneType:
+        return 'None'
+    elif argument is Ellipsis:
+        return '...'
+    # Forward references written as strings
+    elif isinstance(argument, str):
+        return argument
+    elif isinstance(argument, (int, float, complex, bytes)):
+        return repr(argument)
+    elif isinstance(argument, (FunctionType, BuiltinFunctionType)):
+        return argument.__name__
+    elif isinstance(argument, list):
+        return f"[{', '.join(_render_argument(item) for item in argument)}]"
+    elif isinstance(argument, tuple):
+        return f"({', '.join(_render_argument(item) for item in argument)})"
+    return display_type(argument)
+    
+def _render(type_: Any) -> str:
+    """
+    Generates a string display for a type, rendering
+    the nested types with `display_type`.
     
     ### Arguments
     * `type_`: `Any`\n
         The type to display
     
     ### Return
-    * type `str`: A string reprensenting the type as text
+    * type `str`: A string representing the type as text
     """
-    # `GenericAlias` support
-    if type(type_) is GenericAlias:
-        return str(type_)
+    # Dynamic type instance support, with their arguments
+    if isinstance(type_, Typix):
+        return f"{type_.__class__.__name__}({', '.join(_render_argument(a) for a in type_.args)})"
+    
+    origin = get_origin(type_)
+    
+    # `Union`, `Optional` and `X | Y` support
+    if isinstance(type_, UnionType) or origin is Union:
+        return ' | '.join(_render_argument(a) for a in type_.__args__)
     
-    # `typing._GenericAlias` support
-    elif type(type_) is _TypingGenericAlias:
-        return f"{type_.__origin__.__name__}[{', '.join(a.__name__ for a in type_.__args__)}]"
+    # `Literal` support, the arguments are values
+    elif origin is Literal:
+        return f"Literal[{', '.join(repr(a) for a in type_.__args__)}]"
+    
+    # `Annotated` support, only the annotated type is displayed
+    elif origin is Annotated:
+        return display_type(type_.__origin__)
+    
+    # `GenericAlias` and `typing._GenericAlias` support, nested or not
+    elif isinstance(type_, (GenericAlias, _TypingGenericAlias)):
+        name = getattr(origin, '__name__', None) or _render(origin)
+        # `tuple[()]` has no arguments
+        arguments = type_.__args__ or ((),)
+        # The parameters of `Callable` are flattened in the arguments
+        if origin is Callable and arguments[0] is not Ellipsis:
+            arguments = (list(arguments[:-1]), arguments[-1])
+        return f"{name}[{', '.join(_render_argument(a) for a in arguments)}]"
     
     # type input support
-    elif isclass(type_):
+    elif isinstance(type_, type):
         return type_.__name__
     
     # typing sepecial type input support
     elif type(type_) is _TypingType:
         return type_.__origin__.__name__
     
+    # typing special forms, type variables and forward references support
+    elif isinstance(type_, _SpecialForm):
+        return type_._name
+    elif isinstance(type_, (TypeVar, NewType)):
+        return type_.__name__
+    elif isinstance(type_, ForwardRef):
+        return type_.__forward_arg__
+    
     # instance input support
     else:
-        return type(type_).__name__
\ No newline at end of file
+        return type(type_).__name__
+    
+# The display of each rendered type by identity. The types that can be
+# weakly referenced are dropped when they are collected, the unions like
+# `int | str` are kept alive so that their identity cannot be reused, and
+# the other objects are rendered on each call
+_displays: dict[int, str] = {}
+_display_references: dict[int, Any] = {}
+    
+def _forget_display(key: int) -> None:
+    """
+    Drops the display of a collected type.
+    
+    ### Arguments
+    * `key`: `int`\n
+        The identity of the type
+    
+    ### Return
+    * type `NoneType`: Returns `None`
+    """
+    _displays.pop(key, None)
+    _display_references.pop(key, None)
+    
+def display_type(type_: Any) -> str:
+    """
+    Generates a string display for a given type. Supports classes, nested
+    generic aliases, unions, `Literal`, class instances, special types from
+    the `typing` module, and dynamic type instances with their arguments.
+    The display is rendered once per type and cached by identity, so that
+    the error messages can render their types when they are read.
+    
+    ### Arguments
+    * `type_`: `Any`\n
+        The type to display
+    
+    ### Return
+    * type `str`: A string reprensenting the type as text
+    
+    .. doctest
+        >>> display_type(int)
+        'int'
+        >>> display_type(list[dict[str, int]])
+        'list[dict[str, int]]'
+        >>> display_type(Optional[Literal['a', 1]])
+        "Literal['a', 1] | None"
+        >>> display_type(Typix(int, str | None))
+        'Typix(int, str | None)'
+    """
+    key = id(type_)
+    display = _displays.get(key)
+    if display is not None:
+        return display
+    
+    display = _render(type_)
+    try:
+        reference = ref(type_, lambda _, key=key: _forget_display(key))
+    except TypeError:
+        if not isinstance(type_, UnionType):
+            return display
+        # Bounded, the oldest unions are dropped first
+        if len(_display_references) >= CACHE_SIZE:
+            _forget_display(next(iter(_display_references)))
+        reference = type_
+    _display_references[key] = reference
+    _displays[key] = display
+    return display
\ No newline at end of file
@@ -0,0 +1,212 @@
+from typing import Any
+from array import array
+
+# NumPy is optional, the buffer fast paths that need it are disabled without it
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The minimum length of a list converted to an array by the vectorized mode
+VECTORIZE_SIZE = 1024
+
+# The values that can be checked in O(1) from their item type
+BUFFER_TYPES: tuple[type, ...] = (array, memoryview)
+if numpy is not None:
+    BUFFER_TYPES += (numpy.ndarray,)
+
+# The `array` and `struct` codes of the items by Python type
+_CODES = {
+    bool: frozenset('?'),
+    int: frozenset('bBhHiIlLqQnNP?'),
+    float: frozenset('efd'),
+    str: frozenset('uw'),
+    bytes: frozenset('c')
+}
+
+# The Python type of the items by `array` and `struct` code, the first
+# types winning so that `?` holds booleans
+_CODE_SCALARS = {code: type_ for type_, codes in reversed(_CODES.items()) for code in codes}
+
+# The NumPy dtype kinds of the items by Python type
+_KINDS = {
+    bool: frozenset('b'),
+    int: frozenset('iub'),
+    float: frozenset('f'),
+    complex: frozenset('c'),
+    str: frozenset('U'),
+    bytes: frozenset('S')
+}
+
+# The builtin types the NumPy arrays are converted to at once, as their dtype
+_ARRAY_BUILTINS = (bool, int, float, complex)
+
+# The Python type of the items by NumPy dtype kind
+_KIND_SCALARS = {'b': bool, 'i': int, 'u': int, 'f': float, 'c': complex, 'U': str, 'S': bytes}
+
+# The NumPy dtype kinds whose conversion from a list is checked in bulk
+_NUMERIC_KINDS = frozenset('biufc')
+
+def _match_code(code: str, types: tuple) -> bool:
+    """
+    Checks an `array` typecode or a `memoryview` format against types.
+
+    ### Arguments
+    * `code`: `str`\n
+        The typecode or the format, byte order characters are ignored
+    * `types`: `tuple`\n
+        The types any item must be an instance of
+
+    ### Return
+    * type `bool`: Whether or not the items are instances of the types,
+    `None` when the code is unknown and the items must be checked one by one
+    """
+    scalar = _CODE_SCALARS.get(code.lstrip('@=<>!'))
+    if scalar is None:
+        return None
+    # The items are instances of the parent classes too, like `numbers.Real`
+    return any(issubclass(scalar, type_) for type_ in types)
+
+def _match_dtype(dtype: Any, types: tuple) -> bool | None:
+    """
+    Checks a NumPy dtype against types.
+
+    ### Arguments
+    * `dtype`: `numpy.dtype`\n
+        The dtype of the items
+    * `types`: `tuple`\n
+        The types any item must be an instance of
+
+    ### Return
+    * type `bool`: Whether or not the items are instances of the types,
+    `None` when the dtype holds Python objects that must be checked one by one
+    """
+    if dtype.kind == 'O':
+        return None
+    scalar = _KIND_SCALARS.get(dtype.kind)
+    for type_ in types:
+        if dtype.kind in _KINDS.get(type_, ()):
+            return True
+        # The NumPy scalar type of the items or its Python equivalent, like
+        # `numpy.float32` or `float` for `numbers.Real`
+        if issubclass(dtype.type, type_) or (scalar is not None and issubclass(scalar, type_)):
+            return True
+    return False
+
+def match_buffer(value: Any, types: tuple) -> bool | None:
+    """
+    Checks the items of an `array.array`, a `memoryview` or a `numpy.ndarray`
+    in O(1) from their typecode, format or dtype.
+
+    ### Arguments
+    * `value`: `array | memoryview | numpy.ndarray`\n
+        The buffer to check
+    * `types`: `tuple`\n
+        The types any item must be an instance of
+
+    ### Return
+    * type `bool`: Whether or not the items are instances of the types,
+    `None` when the items must be checked one by one
+    """
+    if isinstance(value, array):
+        return _match_code(value.typecode, types)
+    if isinstance(value, memoryview):
+        # Iterating a multidimensional view is not supported
+        if value.ndim != 1:
+            return None
+        return _match_code(value.format, types)
+    return _match_dtype(value.dtype, types)
+
+def is_numeric(types: tuple) -> bool:
+    """
+    Checks whether a list can be checked against types by converting
+    it to a NumPy array.
+
+    ### Arguments
+    * `types`: `tuple`\n
+        The types any item must be an instance of
+
+    ### Return
+    * type `bool`: Whether or not every type is a NumPy numeric kind
+    """
+    if numpy is None:
+        return False
+    for type_ in types:
+        if type_ in _KINDS:
+            if not _KINDS[type_] <= _NUMERIC_KINDS:
+                return False
+        elif not (isinstance(type_, type) and issubclass(type_, numpy.number)):
+            return False
+    return True
+
+def match_list(value: list, types: tuple) -> bool | None:
+    """
+    Checks a large list against numeric types by converting it to a NumPy
+    array. The items are checked as NumPy coerces them: a list mixing
+    `int` and `float` items matches `float`.
+
+    ### Arguments
+    * `value`: `list`\n
+        The list to check
+    * `types`: `tuple`\n
+        The numeric types any item must be an instance of
+
+    ### Return
+    * type `bool`: Whether or not the items are instances of the types,
+    `None` when the items must be checked one by one
+    """
+    try:
+        values = numpy.asarray(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if values.ndim != 1:
+        return None
+    if values.dtype.kind not in _NUMERIC_KINDS:
+        return None if values.dtype.kind == 'O' else False
+    return _match_dtype(values.dtype, types)
+
+def can_convert(value: Any, type_: Any) -> bool:
+    """
+    Checks whether a value can be converted at once by `convert_array`:
+    a NumPy array converted to a NumPy dtype or scalar type, or to a
+    numeric builtin type, or a list or a tuple converted to a NumPy dtype
+    or scalar type. The other types, like `list` or `str`, are converted
+    like any other value.
+
+    ### Arguments
+    * `value`: `Any`\n
+        The value to convert
+    * `type_`: `Any`\n
+        The type to convert to
+
+    ### Return
+    * type `bool`: Whether or not the value can be converted at once
+    """
+    if numpy is None:
+        return False
+    if isinstance(type_, numpy.dtype) or (isinstance(type_, type) and issubclass(type_, numpy.generic)):
+        return isinstance(value, (numpy.ndarray, list, tuple))
+    # The numeric builtin types are mapped to a dtype by NumPy
+    return isinstance(value, numpy.ndarray) and any(type_ is builtin for builtin in _ARRAY_BUILTINS)
+
+def convert_array(value: Any, type_: Any) -> Any:
+    """
+    Converts every item of an array, a list or a tuple to a NumPy dtype at once.
+
+    ### Arguments
+    * `value`: `Any`\n
+        The value to convert
+    * `type_`: `Any`\n
+        The dtype or the type to convert the items to
+
+    ### Return
+    * type `numpy.ndarray`: The converted array
+
+    ### Raises
+    * `ValueError`\n
+        When an item cannot be converted
+    """
+    try:
+        return numpy.asarray(value).astype(type_)
+    except TypeError as exception:
+        raise ValueError(str(exception)) from exception
@@ -0,0 +1,67 @@
+import gc
+
+from .main import Typix
+from .checker import compile_check
+from .kinds import TypeKind, STRUCTURAL_KINDS, classify
+from .plan import CallPlan
+from .processor import _resolve_plan
+from .mode import registered
+from .persist import get_plan_cache
+
+def _compile_checkers(type_hint: Typix) -> None:
+    """
+    Compiles the checkers of the types given as arguments to a dynamic
+    type and to its nested dynamic types, like `int` in `Strict(int)`.
+
+    ### Arguments
+    * `type_hint`: `Typix`\n
+        The dynamic type
+
+    ### Return
+    * type `NoneType`: Returns `None`
+    """
+    for argument in type_hint.args:
+        kind = classify(argument)
+        if kind is TypeKind.TYPIX:
+            _compile_checkers(argument)
+        elif kind in STRUCTURAL_KINDS or kind is TypeKind.TUPLE:
+            compile_check(argument)
+
+def prewarm(freeze: bool = False) -> int:
+    """
+    Compiles the plans of the functions decorated with `processor` that
+    are not compiled yet, and the checkers of the types given to their
+    dynamic types, then saves the plan cache if one is set. Called in a
+    parent process before it forks workers, the children start warm and
+    share the plans copy-on-write. The functions whose annotations cannot
+    be resolved yet are left for their first call.
+
+    ### Arguments
+    * `freeze`: `Optional[bool]`\n
+        Whether or not to move every object to the permanent generation
+        of the garbage collector with `gc.freeze`, so that the collections
+        of the children do not write to the shared pages.
+        Defaults to `False`
+
+    ### Return
+    * type `int`: The number of functions whose plan is compiled
+    """
+    plans = 0
+    for func in registered():
+        plan: CallPlan = func.__typix_plan__
+        if plan is None:
+            try:
+                plan = _resolve_plan(func, func.__wrapped__, func.__typix_defaults__)
+            except NameError:
+                continue
+        plans += 1
+        for type_hint in plan.type_hints:
+            _compile_checkers(type_hint)
+
+    cache = get_plan_cache()
+    if cache is not None:
+        cache.save()
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return plans